@@ -0,0 +1,91 @@
+"""Run the game loop headless and report renderer cost per frame.
+
+Usage: python bench.py [--frames N] [--renderer recording|null]
+"""
+from render.renderer import gl, use_renderer, NullRenderer, TIMES_ROMAN_24
+from render.recording_renderer import RecordingRenderer
+from shapes.dinosaur import Dinosaur
+from shapes.obstacles import MovingObstacles
+from shapes.line import Line, LineBatch
+from scene.scene import Scene
+from scene.intro import IntroScene
+from utils.utils import iterate
+from utils.text import bitmap_text
+from logics.timestep import FixedTimestep
+from logics.clock import GameClock
+from logics.simulation import Simulation, JUMP_PRESS
+import argparse
+import time
+
+def run_gameplay(frames, is_day=False, fps=60):
+    """Play frames of the main game at a simulated fps with a jump every
+    90 frames, restarting whenever the dinosaur crashes"""
+    frame_time = 1.0 / fps
+    timestep = FixedTimestep()
+    sim_clock = GameClock(manual=True)
+    moving_obstacles = MovingObstacles(sim_clock)
+    simulation = Simulation(sim_clock, moving_obstacles)
+    dinosaur = Dinosaur(sim_clock, simulation.jump_physics)
+    scene = Scene()
+    scene.is_day = is_day
+    line_batch = LineBatch()
+
+    for frame in range(frames):
+        gl.begin_frame()
+        gl.clear()
+        gl.load_identity()
+        iterate(scene)
+        scene.draw()
+
+        inputs = [JUMP_PRESS] if frame % 90 == 0 else []
+        for _ in range(timestep.advance(frame_time)):
+            if simulation.game_over:
+                simulation.reset()
+            simulation.step(timestep.dt, inputs)
+            inputs = []
+            dinosaur.update(simulation.speed)
+
+        alpha = timestep.alpha()
+        moving_obstacles.draw(alpha)
+        Line.begin_batch(line_batch)
+        dinosaur.draw(alpha)
+        Line.end_batch()
+
+        gl.color(1.0, 0.0, 0.0)
+        bitmap_text.draw(f"Score: {simulation.score}", 600, 450, TIMES_ROMAN_24)
+        bitmap_text.draw("High: 0", 400, 450, TIMES_ROMAN_24)
+        gl.end_frame()
+    return {"obstacle cache misses": moving_obstacles.cache_misses}
+
+def run_intro(frames, is_day=False, fps=60):
+    """Draw frames of the intro screen at a simulated fps"""
+    clock = GameClock(manual=True)
+    intro_scene = IntroScene(clock)
+    for _ in range(frames):
+        gl.begin_frame()
+        clock.step(1.0 / fps)
+        intro_scene.update()
+        intro_scene.draw(False, 0, is_day)
+        gl.end_frame()
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless T-Rex Runner benchmark")
+    parser.add_argument("--frames", type=int, default=600, help="frames per phase")
+    parser.add_argument("--renderer", choices=["recording", "null"], default="recording")
+    args = parser.parse_args()
+
+    for name, run in (("gameplay", run_gameplay), ("intro", run_intro)):
+        backend = use_renderer(RecordingRenderer() if args.renderer == "recording" else NullRenderer())
+        start = time.perf_counter()
+        counters = run(args.frames) or {}
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {args.frames / elapsed:.0f} frames/s")
+        if isinstance(backend, RecordingRenderer):
+            stats = backend.summary()
+            print(f"  per frame: {stats['calls']:.0f} calls, "
+                  f"{stats['draw_calls']:.1f} draw calls, {stats['vertices']:.0f} vertices")
+        for counter, value in counters.items():
+            print(f"  {counter}: {value}")
+
+if __name__ == "__main__":
+    main()
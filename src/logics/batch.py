@@ -0,0 +1,243 @@
+from .speed import REFERENCE_FPS
+from .obstacles import OBSTACLE_TYPES, GEOMETRY_VARIANTS
+from .simulation import new_seed
+import numpy as np
+import random
+
+# Type codes index OBSTACLE_TYPES; widths and (inclusive) height ranges per
+# code, as ObstacleField gives them
+BIRD_CACTUS = OBSTACLE_TYPES.index("bird_cactus")
+OBSTACLE_WIDTHS = np.array([20, 25, 60, 30], dtype=np.float64)
+OBSTACLE_MIN_HEIGHTS = np.array([40, 70, 50, 120], dtype=np.int64)
+OBSTACLE_MAX_HEIGHTS = np.array([60, 90, 70, 160], dtype=np.int64)
+
+class BatchSimulation:
+    """Many independent games advanced together in vectorized steps.
+
+    State is kept as struct-of-arrays: one entry per game for the clock,
+    speed, dinosaur y and jump progress, and an (n_games, slots) grid for
+    the obstacles' x, width, height and type code with an `active` mask
+    for the free slots. Each step follows the same rules as Simulation:
+    GameSpeed's speed ramp, ObstacleField's movement, scoring, removal and
+    spawning, the JumpPhysics parabola and detect_collision's hitboxes,
+    tested at the end of each tick like Simulation(swept_collision=False).
+    Games that have crashed stay frozen until reset.
+
+    By default obstacles are drawn from a numpy Generator, so a batch game
+    does not replay the same layout as a Simulation would with the same
+    seed. Passing game_seeds instead gives each game its own Random that
+    draws obstacles exactly as ObstacleField does, so game i plays out
+    like Simulation(seed=game_seeds[i]) given the same jumps; spawning
+    then loops over the games that need an obstacle.
+    """
+    def __init__(self, n_games, seed=None, slots=4, game_seeds=None):
+        self.n_games = n_games
+        self.slots = slots  # Obstacles kept alive per game, like ObstacleField
+        self.rng = np.random.default_rng(seed)
+        # Per-game obstacle streams, only when games are seeded like Simulation
+        self.game_rngs = [random.Random() for _ in range(n_games)] if game_seeds is not None else None
+        self.game_seeds = [None] * n_games
+        self.ground_level = 100  # Height of the ground
+        self.dino_x = 150  # Matches the Dinosaur's base x position
+        self.base_y = 130  # JumpPhysics ground level
+        self.jump_height = 150
+        self.jump_duration = 0.7
+        self.base_speed = 2.0
+        self.max_speed = 10.0
+
+        self.now = np.zeros(n_games)  # Game seconds since each game started
+        self.speed = np.full(n_games, self.base_speed)
+        self.dino_y = np.full(n_games, float(self.base_y))
+        self.is_jumping = np.zeros(n_games, dtype=bool)
+        self.jump_start_time = np.zeros(n_games)
+        self.jump_progress = np.zeros(n_games)
+        self.score = np.zeros(n_games, dtype=np.int64)
+        self.ticks = np.zeros(n_games, dtype=np.int64)
+        self.game_over = np.zeros(n_games, dtype=bool)
+        self.collided_type = np.full(n_games, -1, dtype=np.int8)  # Type code that ended each game
+
+        shape = (n_games, slots)
+        self.obstacle_x = np.zeros(shape)
+        self.obstacle_prev_x = np.zeros(shape)
+        self.obstacle_width = np.zeros(shape)
+        self.obstacle_height = np.zeros(shape)
+        self.obstacle_type = np.zeros(shape, dtype=np.int8)
+        self.passed = np.zeros(shape, dtype=bool)
+        self.active = np.zeros(shape, dtype=bool)
+        self.reset(game_seeds=game_seeds)
+
+    def reset(self, games=None, game_seeds=None):
+        """Restart every game, or only those selected by an index or mask.
+        Seeded batches take a seed per restarted game, or pick fresh ones"""
+        if games is None:
+            games = np.arange(self.n_games)
+        games = np.arange(self.n_games)[games]
+        if self.game_rngs is not None:
+            if game_seeds is None:
+                game_seeds = [new_seed() for _ in games]
+            for game, game_seed in zip(games, game_seeds):
+                self.game_seeds[game] = game_seed
+                self.game_rngs[game].seed(game_seed)
+        self.now[games] = 0.0
+        self.speed[games] = self.base_speed
+        self.dino_y[games] = self.base_y
+        self.is_jumping[games] = False
+        self.jump_start_time[games] = 0.0
+        self.jump_progress[games] = 0.0
+        self.score[games] = 0
+        self.ticks[games] = 0
+        self.game_over[games] = False
+        self.collided_type[games] = -1
+        self.active[games] = False
+        self.generate_obstacles(games)
+
+    def generate_obstacles(self, games, start_x=800, min_spacing=400, max_spacing=900):
+        """Fill every slot of the given games with a fresh obstacle sequence"""
+        if self.game_rngs is not None:
+            for game in games:
+                rng = self.game_rngs[game]
+                x = start_x
+                for slot in range(self.slots):
+                    x += self._spawn_seeded(game, slot, x) + rng.randint(min_spacing, max_spacing)
+            return
+        current_x = np.full(len(games), float(start_x))
+        for slot in range(self.slots):
+            width = self._spawn(games, np.full(len(games), slot), current_x)
+            current_x += width + self.rng.integers(min_spacing, max_spacing + 1, len(games))
+
+    def _spawn(self, games, slots, x):
+        """Roll new obstacles into the given (game, slot) pairs and return their widths"""
+        count = len(games)
+        types = self.rng.integers(0, len(OBSTACLE_TYPES), count)
+        width = OBSTACLE_WIDTHS[types]
+        height = self.rng.integers(OBSTACLE_MIN_HEIGHTS[types], OBSTACLE_MAX_HEIGHTS[types] + 1)
+        self.obstacle_type[games, slots] = types
+        self.obstacle_x[games, slots] = x
+        self.obstacle_prev_x[games, slots] = x
+        self.obstacle_width[games, slots] = width
+        self.obstacle_height[games, slots] = height
+        self.passed[games, slots] = False
+        self.active[games, slots] = True
+        return width
+
+    def _spawn_seeded(self, game, slot, x):
+        """Roll one game's next obstacle from its Random in the order
+        ObstacleField.create_obstacle does, and return its width"""
+        rng = self.game_rngs[game]
+        code = OBSTACLE_TYPES.index(rng.choice(OBSTACLE_TYPES))
+        height = rng.randint(int(OBSTACLE_MIN_HEIGHTS[code]), int(OBSTACLE_MAX_HEIGHTS[code]))
+        rng.randrange(GEOMETRY_VARIANTS)  # The geometry variant, drawn to stay in step
+        width = OBSTACLE_WIDTHS[code]
+        self.obstacle_type[game, slot] = code
+        self.obstacle_x[game, slot] = x
+        self.obstacle_prev_x[game, slot] = x
+        self.obstacle_width[game, slot] = width
+        self.obstacle_height[game, slot] = height
+        self.passed[game, slot] = False
+        self.active[game, slot] = True
+        return width
+
+    def step(self, dt, jump=None):
+        """Advance every running game by dt seconds.
+
+        jump is an optional boolean array of games pressing jump this tick;
+        like JumpPhysics, a press while already jumping is ignored. Returns
+        the boolean array of games still running.
+        """
+        live = ~self.game_over
+        if jump is not None:
+            start = live & np.asarray(jump, dtype=bool) & ~self.is_jumping
+            self.is_jumping |= start
+            self.jump_start_time[start] = self.now[start]
+
+        self.now[live] += dt
+        self.ticks[live] += 1
+        self._update_obstacles(live, dt)
+        self._update_jumps(live)
+
+        hits = self._collisions()
+        crashed = live & hits.any(axis=1)
+        if crashed.any():
+            # Report the leftmost obstacle hit, as find_collision would
+            first_hit = np.argmin(np.where(hits[crashed], self.obstacle_x[crashed], np.inf), axis=1)
+            self.collided_type[crashed] = self.obstacle_type[crashed, first_hit]
+            self.game_over |= crashed
+        return ~self.game_over
+
+    def _update_obstacles(self, live, dt):
+        # GameSpeed: linear ramp from base to max speed over the first minute
+        time_factor = np.minimum(self.now / 60.0, 1.0)
+        speed = self.base_speed + (self.max_speed - self.base_speed) * time_factor
+        self.speed[live] = speed[live]
+        distance = np.where(live, self.speed * dt * REFERENCE_FPS, 0.0)
+
+        moving = self.active & live[:, None]
+        self.obstacle_prev_x[moving] = self.obstacle_x[moving]
+        self.obstacle_x -= np.where(moving, distance[:, None], 0.0)
+
+        # Score obstacles that have just passed the dinosaur
+        newly_passed = moving & ~self.passed & (self.obstacle_x < 100)
+        self.passed |= newly_passed
+        self.score += newly_passed.sum(axis=1)
+
+        # Drop off-screen obstacles, then spawn at most one per game
+        self.active &= ~(moving & (self.obstacle_x <= -100))
+        needs_spawn = live & (self.active.sum(axis=1) < self.slots)
+        games = np.flatnonzero(needs_spawn)
+        if len(games):
+            active_x = np.where(self.active[games], self.obstacle_x[games], -np.inf)
+            last_x = active_x.max(axis=1)
+            last_x[np.isneginf(last_x)] = 800
+            free_slots = np.argmin(self.active[games], axis=1)
+            if self.game_rngs is None:
+                self._spawn(games, free_slots, last_x + self.rng.integers(200, 401, len(games)))
+            else:
+                for game, slot, x in zip(games, free_slots, last_x):
+                    self._spawn_seeded(game, slot, x + self.game_rngs[game].randint(200, 400))
+
+    def _update_jumps(self, live):
+        jumping = live & self.is_jumping
+        progress = np.minimum((self.now - self.jump_start_time) / self.jump_duration, 1.0)
+        landed = jumping & (progress >= 1.0)
+        airborne = jumping & ~landed
+
+        self.is_jumping[landed] = False
+        self.dino_y[landed] = self.base_y
+        self.jump_progress[landed] = 0.0
+
+        # Parabolic jump trajectory, y = 4h * t * (1-t)
+        p = progress[airborne]
+        self.dino_y[airborne] = self.base_y + 4.0 * self.jump_height * p * (1.0 - p)
+        self.jump_progress[airborne] = p
+
+    def detect_collisions(self, dino_width=40, dino_height=60):
+        """Return which games have the dinosaur overlapping an obstacle,
+        using the same hitboxes as ObstacleField.detect_collision"""
+        return self._collisions(dino_width, dino_height).any(axis=1)
+
+    def _collisions(self, dino_width=40, dino_height=60):
+        """Return the (n_games, slots) grid of obstacles the dinosaur overlaps"""
+        dino_hitbox_x = self.dino_x + 10
+        dino_hitbox_width = dino_width - 20
+        dino_hitbox_height = dino_height - 10
+        x = self.obstacle_x
+        width = self.obstacle_width
+        height = self.obstacle_height
+        dino_y = self.dino_y[:, None]
+
+        # Only obstacles level with the dinosaur can hit
+        near = (self.active & (x <= self.dino_x + dino_width + 10)
+                & (x + width >= self.dino_x - 10))
+
+        obs_hitbox_width = width * 0.8
+        obs_hitbox_x = x + (width - obs_hitbox_width) / 2
+        overlap_x = ((dino_hitbox_x < obs_hitbox_x + obs_hitbox_width)
+                     & (dino_hitbox_x + dino_hitbox_width > obs_hitbox_x))
+
+        # Flying cacti only hit a dinosaur high in its jump
+        ground = self.ground_level
+        bird_hit = ((dino_y > ground + 60) & (dino_y + dino_hitbox_height > ground + 90)
+                    & (dino_y < ground + height))
+        ground_hit = (dino_y < ground + height) & (dino_y + dino_hitbox_height > ground)
+        hit = np.where(self.obstacle_type == BIRD_CACTUS, bird_hit, ground_hit)
+        return near & overlap_x & hit
@@ -0,0 +1,59 @@
+import time
+
+class GameClock:
+    """Shared monotonic time source for the game.
+
+    A real-time clock samples perf_counter once per frame in tick(), and
+    components read `now` and `dt` from it instead of calling time
+    functions themselves. A manual clock ignores the wall clock and only
+    moves when step() is called, which is how the fixed-timestep
+    simulation and headless fast-forward runs advance. Paused time never
+    counts, and time_scale speeds up or slows down everything reading
+    the clock.
+    """
+    def __init__(self, manual=False, time_scale=1.0, source=time.perf_counter):
+        self.manual = manual
+        self.time_scale = time_scale
+        self.source = source
+        self.paused = False
+        self.now = 0.0  # Game seconds elapsed, excluding pauses
+        self.dt = 0.0  # Game seconds covered by the last tick or step
+        self.last_sample = source()
+
+    def tick(self):
+        """Sample the wall clock for this frame and return the game-time delta"""
+        sample = self.source()
+        elapsed = sample - self.last_sample
+        self.last_sample = sample
+        if self.manual or self.paused:
+            self.dt = 0.0
+        else:
+            self.dt = elapsed * self.time_scale
+            self.now += self.dt
+        return self.dt
+
+    def step(self, dt):
+        """Advance a manual clock by dt game seconds"""
+        self.dt = 0.0 if self.paused else dt
+        self.now += self.dt
+        return self.dt
+
+    def pause(self):
+        """Stop game time"""
+        self.paused = True
+
+    def resume(self):
+        """Restart game time without counting the time spent paused"""
+        self.paused = False
+        self.last_sample = self.source()
+
+    def set_time_scale(self, time_scale):
+        """Scale how fast game time runs relative to the wall clock"""
+        self.time_scale = time_scale
+
+    def reset(self):
+        """Restart game time from zero"""
+        self.now = 0.0
+        self.dt = 0.0
+        self.paused = False
+        self.last_sample = self.source()
@@ -0,0 +1,123 @@
+from .simulation import Simulation, JUMP_PRESS, JUMP_RELEASE
+import numpy as np
+
+NOOP = 0
+JUMP = 1
+RELEASE = 2
+
+# Simulation inputs for each action, built once so step() doesn't allocate
+_ACTION_INPUTS = ((), (JUMP_PRESS,), (JUMP_RELEASE,))
+
+class DinoEnv:
+    """Gym-style wrapper around the headless Simulation.
+
+    Observations are a float32 vector laid out as the distances, widths
+    and heights of the next `lookahead` obstacles still ahead of the
+    dinosaur, then the dinosaur's y, its jump progress and the GameSpeed
+    speed. Missing obstacles read as `far_distance` away with no size.
+    reset() and step() refill and return the same preallocated array,
+    so callers that keep an observation across steps must copy it.
+
+    Each step holds the action for `frame_skip` ticks. The reward is
+    `clear_reward` per obstacle cleared plus `alive_reward` per tick
+    survived, and `crash_reward` on the step the dinosaur crashes. Once
+    an episode is done, step() returns the final observation with no
+    reward and leaves the game alone until reset().
+    """
+    def __init__(self, lookahead=3, tick_rate=60, frame_skip=1, max_time=None,
+                 alive_reward=0.01, clear_reward=1.0, crash_reward=-1.0,
+                 far_distance=1000.0, simulation=None):
+        self.simulation = simulation if simulation is not None else Simulation()
+        self.lookahead = lookahead
+        self.dt = 1.0 / tick_rate
+        self.frame_skip = frame_skip
+        self.max_ticks = int(max_time * tick_rate) if max_time else None
+        self.alive_reward = alive_reward
+        self.clear_reward = clear_reward
+        self.crash_reward = crash_reward
+        self.far_distance = far_distance
+        self.action_count = len(_ACTION_INPUTS)
+
+        self.observation = np.zeros(3 * lookahead + 3, dtype=np.float32)
+        # Views into the observation, one per feature group
+        self._distances = self.observation[0:lookahead]
+        self._widths = self.observation[lookahead:2 * lookahead]
+        self._heights = self.observation[2 * lookahead:3 * lookahead]
+        self.info = {"score": 0, "ticks": 0, "cause": None}
+        self.done = False
+
+    @property
+    def observation_size(self):
+        return self.observation.shape[0]
+
+    def reset(self, seed=None):
+        """Start a new game, seeding the obstacle sequence if a seed is
+        given, and return the first observation"""
+        self.simulation.reset(seed)
+        self.done = False
+        self._update_info()
+        return self._observe()
+
+    def step(self, action):
+        """Apply an action (NOOP, JUMP or RELEASE) and advance the game.
+
+        Returns (observation, reward, done, info).
+        """
+        if self.done:
+            return self.observation, 0.0, True, self.info
+
+        simulation = self.simulation
+        inputs = _ACTION_INPUTS[action]
+        score = simulation.score
+        ticks = simulation.ticks
+        for _ in range(self.frame_skip):
+            if not simulation.step(self.dt, inputs):
+                break
+            inputs = ()  # Presses only apply on the first tick
+
+        reward = (simulation.score - score) * self.clear_reward
+        if simulation.game_over:
+            reward += self.crash_reward
+        else:
+            reward += (simulation.ticks - ticks) * self.alive_reward
+
+        self.done = simulation.game_over or (
+            self.max_ticks is not None and simulation.ticks >= self.max_ticks)
+        self._update_info()
+        return self._observe(), reward, self.done, self.info
+
+    def _observe(self):
+        """Refill the observation buffer in place from the simulation"""
+        simulation = self.simulation
+        dino_x = simulation.dino_x
+        # Index the ring's records directly rather than iterating it, which
+        # would create a generator every step
+        ring = simulation.obstacles.obstacles
+        records, capacity, head = ring.records, ring.capacity, ring.head
+        slot = 0
+        for i in range(ring.count):
+            if slot == self.lookahead:
+                break
+            obstacle = records[(head + i) % capacity]
+            if obstacle.x + obstacle.width < dino_x:
+                continue  # Already behind the dinosaur
+            self._distances[slot] = obstacle.x - dino_x
+            self._widths[slot] = obstacle.width
+            self._heights[slot] = obstacle.height
+            slot += 1
+        self._distances[slot:] = self.far_distance
+        self._widths[slot:] = 0.0
+        self._heights[slot:] = 0.0
+
+        end = 3 * self.lookahead
+        self.observation[end] = simulation.dino_y
+        self.observation[end + 1] = simulation.jump_physics.jump_progress
+        self.observation[end + 2] = simulation.speed
+        return self.observation
+
+    def _update_info(self):
+        simulation = self.simulation
+        collided_with = simulation.collided_with
+        self.info["score"] = simulation.score
+        self.info["ticks"] = simulation.ticks
+        self.info["cause"] = collided_with.type if collided_with is not None else None
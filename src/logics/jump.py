@@ -1,8 +1,8 @@
 import math
-import time
 
 class JumpPhysics:
-    def __init__(self):
+    def __init__(self, clock):
+        self.clock = clock  # Simulation GameClock
         self.jump_height = 150  # Maximum jump height in pixels
         self.jump_duration = 0.7  # Total jump duration in seconds
         self.is_jumping = False
@@ -16,7 +16,7 @@ class JumpPhysics:
         """Handle jump button press"""
         if not self.is_jumping:
             self.is_jumping = True
-            self.jump_start_time = time.time()
+            self.jump_start_time = self.clock.now
             self.jump_pressed = True
             return True
         return False
@@ -31,7 +31,7 @@ class JumpPhysics:
             return self.base_y, 0.0, False
         
         # Calculate how far we are in the jump (0 to 1)
-        elapsed = time.time() - self.jump_start_time
+        elapsed = self.clock.now - self.jump_start_time
         progress = min(elapsed / self.jump_duration, 1.0)
         
         # If jump is complete
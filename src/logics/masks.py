@@ -0,0 +1,163 @@
+from .poses import get_pose_cache
+import math
+import numpy as np
+
+class Bitmask:
+    """Pixels a shape covers, as a boolean grid indexed [y, x].
+
+    bits[0, 0] is the pixel at (x0, y0) relative to the shape's origin,
+    so (x0, y0)-(x1, y1) is also the shape's bounding box.
+    """
+    __slots__ = ("bits", "x0", "y0", "x1", "y1")
+
+    def __init__(self, bits, x0, y0):
+        self.bits = bits
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x0 + bits.shape[1]
+        self.y1 = y0 + bits.shape[0]
+
+    def overlaps(self, x, y, other, other_x, other_y):
+        """Test this mask placed at (x, y) against other placed at
+        (other_x, other_y), comparing pixels only where the bounding boxes
+        intersect"""
+        ax, ay = math.floor(x + 0.5), math.floor(y + 0.5)
+        bx, by = math.floor(other_x + 0.5), math.floor(other_y + 0.5)
+        left = max(ax + self.x0, bx + other.x0)
+        right = min(ax + self.x1, bx + other.x1)
+        if left >= right:
+            return False
+        bottom = max(ay + self.y0, by + other.y0)
+        top = min(ay + self.y1, by + other.y1)
+        if bottom >= top:
+            return False
+
+        mine = self.bits[bottom - ay - self.y0:top - ay - self.y0,
+                         left - ax - self.x0:right - ax - self.x0]
+        theirs = other.bits[bottom - by - other.y0:top - by - other.y0,
+                            left - bx - other.x0:right - bx - other.x0]
+        return bool((mine & theirs).any())
+
+class MaskCanvas:
+    """Collects the pixels of lines, discs and convex polygons, then packs
+    them into a Bitmask. Pixel (i, j) covers [i, i+1) x [j, j+1)."""
+    def __init__(self):
+        self.xs = []
+        self.ys = []
+
+    def line(self, x0, y0, x1, y1, width=1.0):
+        """Cover a line segment as GL rasterizes an aliased line of a width:
+        the pixels whose centres lie along its major axis from the start up
+        to, but not including, the end, each widened to `width` pixels
+        across the minor axis only"""
+        dx, dy = x1 - x0, y1 - y0
+        if dx == 0 and dy == 0:
+            return
+        width = max(1, round(width))
+        x_major = abs(dx) >= abs(dy)
+        if x_major:
+            start, end, across, step, slope = x0, x1, y0, dx, dy / dx
+        else:
+            start, end, across, step, slope = y0, y1, x0, dy, dx / dy
+        if step > 0:
+            along = np.arange(math.ceil(start - 0.5), math.ceil(end - 0.5))
+        else:
+            along = np.arange(math.floor(end - 0.5) + 1, math.floor(start - 0.5) + 1)
+        # First of the `width` pixels centred on the line at each step
+        first = np.ceil(across + (along + 0.5 - start) * slope - width / 2 - 0.5)
+        for offset in range(width):
+            self.xs.append(along if x_major else first + offset)
+            self.ys.append(first + offset if x_major else along)
+
+    def segments(self, vertices, width=1.0, x=0.0, y=0.0):
+        """Cover GL_LINES vertices drawn at (x, y)"""
+        for (x0, y0), (x1, y1) in zip(vertices[0::2], vertices[1::2]):
+            self.line(x0 + x, y0 + y, x1 + x, y1 + y, width)
+
+    def disc(self, cx, cy, rad):
+        """Cover a filled disc like Circle.filled_disc"""
+        i, j = np.meshgrid(np.arange(math.floor(cx - rad) - 1, math.ceil(cx + rad) + 1),
+                           np.arange(math.floor(cy - rad) - 1, math.ceil(cy + rad) + 1))
+        inside = (i + 0.5 - cx) ** 2 + (j + 0.5 - cy) ** 2 <= rad * rad + rad
+        self.xs.append(i[inside])
+        self.ys.append(j[inside])
+
+    def convex_polygon(self, points):
+        """Cover a filled convex polygon, given in either winding"""
+        px = np.array([p[0] for p in points], dtype=np.float64)
+        py = np.array([p[1] for p in points], dtype=np.float64)
+        i, j = np.meshgrid(np.arange(math.floor(px.min()), math.ceil(px.max()) + 1),
+                           np.arange(math.floor(py.min()), math.ceil(py.max()) + 1))
+        cx, cy = i + 0.5, j + 0.5
+        sides = []
+        for k in range(len(points)):
+            ex = px[(k + 1) % len(points)] - px[k]
+            ey = py[(k + 1) % len(points)] - py[k]
+            sides.append(ex * (cy - py[k]) - ey * (cx - px[k]))
+        sides = np.array(sides)
+        inside = (sides >= 0).all(axis=0) | (sides <= 0).all(axis=0)
+        self.xs.append(i[inside])
+        self.ys.append(j[inside])
+
+    def to_mask(self):
+        xs = np.concatenate(self.xs).astype(np.int64)
+        ys = np.concatenate(self.ys).astype(np.int64)
+        x0, y0 = int(xs.min()), int(ys.min())
+        bits = np.zeros((int(ys.max()) - y0 + 1, int(xs.max()) - x0 + 1), dtype=bool)
+        bits[ys - y0, xs - x0] = True
+        return Bitmask(bits, x0, y0)
+
+def obstacle_mask(vertices, line_width=2.0):
+    """Rasterize GL_LINES obstacle geometry at the width MovingObstacles
+    draws it"""
+    canvas = MaskCanvas()
+    canvas.segments(vertices, line_width)
+    return canvas.to_mask()
+
+class DinoMasks:
+    """Bitmasks of the dinosaur as Dinosaur.draw draws it, one per pose
+    keyframe, built the first time each keyframe is needed.
+
+    Masks are relative to the dinosaur's (x, y) and include the sideways
+    jiggle of the run cycle; jumps are drawn without it.
+    """
+    def __init__(self, size=0.7, samples=32):
+        self.size = size
+        self.samples = samples
+        self.poses = get_pose_cache(size, samples)
+        self.run_masks = [None] * len(self.poses.run_frames)
+        self.jump_masks = [None] * len(self.poses.jump_frames)
+
+    def running(self, run_progress):
+        """Mask at a point of the run cycle (0 to 1)"""
+        index = round((run_progress % 1.0) * self.samples) % self.samples
+        mask = self.run_masks[index]
+        if mask is None:
+            offset_x = math.sin(index / self.samples * 4 * math.pi) * 2.0
+            mask = self.run_masks[index] = self._build(self.poses.run_frames[index], offset_x)
+        return mask
+
+    def jumping(self, jump_progress):
+        """Mask at a point of the jump (0 to 1)"""
+        index = round(min(max(jump_progress, 0.0), 1.0) * self.samples)
+        mask = self.jump_masks[index]
+        if mask is None:
+            mask = self.jump_masks[index] = self._build(self.poses.jump_frames[index], 0.0)
+        return mask
+
+    def _build(self, legs, cx):
+        s = self.size
+        canvas = MaskCanvas()
+        # Head, body, legs, arm and mouth; the eye lies inside the head
+        canvas.disc(cx, int(10 * s), int(18 * s) - 1)
+        canvas.convex_polygon([
+            (cx - int(15 * s), int(15 * s)),
+            (cx - int(40 * s), 0),
+            (cx - int(30 * s), -int(15 * s)),
+            (cx + int(10 * s), -int(15 * s)),
+            (cx + int(15 * s), 0),
+        ])
+        canvas.segments(legs, 2.0, cx)
+        canvas.line(cx, 0, cx + int(10 * s), int(5 * s), 2.0)
+        canvas.line(cx + int(18 * s), int(5 * s), cx + int(8 * s), int(5 * s), 2.0)
+        return canvas.to_mask()
@@ -0,0 +1,475 @@
+from .speed import GameSpeed, REFERENCE_FPS
+from .masks import obstacle_mask
+import numpy as np
+import random
+
+OBSTACLE_TYPES = ("small_cactus", "tall_cactus", "cactus_group", "bird_cactus")
+GEOMETRY_VARIANTS = 4  # Baked arm layouts per obstacle type and height
+
+class Obstacle:
+    """A single obstacle, recycled in place once it scrolls off screen"""
+    __slots__ = ("type", "x", "prev_x", "y", "width", "height", "passed", "shape", "vertices")
+
+    def __init__(self):
+        self.type = None
+        self.x = 0.0
+        self.prev_x = 0.0  # Position at the previous simulation tick
+        self.y = 0  # Base of the obstacle, the ground level
+        self.width = 0
+        self.height = 0
+        self.passed = False  # Track if the obstacle has been passed
+        self.shape = None  # (type, height, variant) key of the baked geometry
+        self.vertices = None  # Baked line segments relative to (x, y)
+
+class ObstacleRing:
+    """Fixed-capacity queue of Obstacle records, oldest first.
+
+    All records are allocated up front; push() hands out the next free one
+    to be filled in place and pop_front() returns the oldest to the pool.
+    Obstacles all move at the same speed, so the oldest is always the
+    leftmost and the only one that can scroll off screen.
+    """
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.records = [Obstacle() for _ in range(capacity)]
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        records, capacity, head = self.records, self.capacity, self.head
+        for i in range(self.count):
+            yield records[(head + i) % capacity]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("obstacle index out of range")
+        return self.records[(self.head + index) % self.capacity]
+
+    def push(self):
+        """Return the next free record, now the newest in the queue"""
+        if self.count == self.capacity:
+            raise IndexError("obstacle ring is full")
+        record = self.records[(self.head + self.count) % self.capacity]
+        self.count += 1
+        return record
+
+    def pop_front(self):
+        """Release the oldest record back to the pool"""
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+class ObstacleField:
+    """Spawning, movement, scoring and collision of the obstacles, with no
+    drawing so it can run headless"""
+    geometry_cache = {}  # (type, height, variant) -> baked vertex array
+    mask_cache = {}  # (type, height, variant) -> Bitmask of the solid geometry
+
+    def __init__(self, clock, capacity=8, rng=None):
+        self.clock = clock  # Simulation GameClock
+        self.rng = rng if rng is not None else random.Random()  # This game's random stream
+        self.obstacles = ObstacleRing(capacity)
+        # Geometry and masks this field had to bake because they weren't
+        # cached yet. Records come from the ring, so once every shape it
+        # meets is cached, update() allocates nothing and this stops growing
+        self.cache_misses = 0
+        self.ground_level = 100  # Height of the ground
+        self.speed_controller = GameSpeed(clock)
+        self.generate_obstacles()
+        self.num_triangles_touched = 0
+        self.translation = [0, 0]  # [x, y] translation offset
+        
+    def generate_obstacles(self, start_x=800, count=4, min_spacing=400, max_spacing=900):
+        """Generate a sequence of random obstacles with appropriate spacing"""
+        self.obstacles.clear()
+        current_x = start_x
+        
+        for _ in range(count):
+            obstacle = self.add_obstacle(current_x)
+            
+            # Add spacing for next obstacle
+            spacing = self.rng.randint(min_spacing, max_spacing)
+            current_x += obstacle.width + spacing
+    
+    def get_obstacle_width(self, obstacle_type):
+        """Return the width for each obstacle type"""
+        if obstacle_type == "small_cactus":
+            return 20
+        elif obstacle_type == "tall_cactus":
+            return 25
+        elif obstacle_type == "bird_cactus":
+            return 30
+        else:  # cactus_group
+            return 60
+
+    def get_obstacle_height(self, obstacle_type):
+        """Return the height for each obstacle type"""
+        if obstacle_type == "small_cactus":
+            return self.rng.randint(40, 60)
+        elif obstacle_type == "tall_cactus":
+            return self.rng.randint(70, 90)
+        elif obstacle_type == "bird_cactus":
+            return self.rng.randint(120, 160)
+        else:  # cactus_group
+            return self.rng.randint(50, 70)
+            
+    def update(self):
+        """Advance obstacle positions by the last simulation clock step"""
+        delta_time = self.clock.dt
+        
+        # Get current game speed
+        speed = self.speed_controller.update(delta_time)
+        distance = speed * delta_time * REFERENCE_FPS
+        
+        # Move obstacles to the left based on speed, keeping the previous
+        # position for render interpolation
+        obstacles = self.obstacles
+        for obstacle in obstacles:
+            obstacle.prev_x = obstacle.x
+            obstacle.x -= distance
+            
+            # Check if an obstacle has just passed the dinosaur
+            if not obstacle.passed and obstacle.x < 100:  # Dinosaur x position is 150
+                obstacle.passed = True
+                self.num_triangles_touched += 1
+        
+        # Recycle obstacles that are off-screen to the left
+        while obstacles and obstacles[0].x <= -100:
+            obstacles.pop_front()
+        
+        # Add new obstacles if needed
+        if len(obstacles) < 4:
+            last_x = obstacles[-1].x if obstacles else 800
+            self.add_obstacle(last_x + self.rng.randint(200, 400))
+            
+        # Update translation value for animation synchronization
+        self.translation[0] = speed
+        
+        return speed
+        
+    def add_obstacle(self, x_position):
+        """Add a new random obstacle at the specified position"""
+        return self.create_obstacle(self.rng.choice(OBSTACLE_TYPES), x_position)
+
+    def create_obstacle(self, obstacle_type, x_position):
+        """Fill the next free obstacle record, reusing baked geometry"""
+        width = self.get_obstacle_width(obstacle_type)
+        height = self.get_obstacle_height(obstacle_type)
+        variant = self.rng.randrange(GEOMETRY_VARIANTS)
+        
+        obstacle = self.obstacles.push()
+        obstacle.type = obstacle_type
+        obstacle.x = x_position
+        obstacle.prev_x = x_position
+        obstacle.y = self.ground_level  # All obstacles start from ground level
+        obstacle.width = width
+        obstacle.height = height
+        obstacle.passed = False
+        obstacle.shape = (obstacle_type, height, variant)
+        obstacle.vertices = self.get_geometry(obstacle_type, width, height, variant)
+        return obstacle
+
+    def get_geometry(self, obstacle_type, width, height, variant):
+        """Return the shared vertex array for an obstacle variant, baking it
+        on first use"""
+        key = (obstacle_type, height, variant)
+        vertices = self.geometry_cache.get(key)
+        if vertices is None:
+            # Arms are rolled from the key so a variant always looks the same
+            # and baking never disturbs the game's random sequence
+            rng = random.Random(f"{obstacle_type}:{height}:{variant}")
+            vertices = self.geometry_cache[key] = self.build_geometry(obstacle_type, width, height, rng)
+            self.cache_misses += 1
+        return vertices
+    
+    def get_mask(self, obstacle):
+        """Return the shared bitmask of an obstacle's solid lines, rasterizing
+        it on first use.
+
+        Only the stems (and the bird cactus's wings) are solid. Arms are
+        drawn but, as with the hitboxes, never collide: a tall cactus spans
+        about 95 pixels from arm tip to arm tip, more than a whole jump
+        covers at base speed, so solid arms would make it unclearable.
+        """
+        mask = self.mask_cache.get(obstacle.shape)
+        if mask is None:
+            obstacle_type, height, variant = obstacle.shape
+            # Rebake from the same key so the solid lines match the drawn ones
+            rng = random.Random(f"{obstacle_type}:{height}:{variant}")
+            solid = []
+            self.build_geometry(obstacle_type, obstacle.width, height, rng, solid)
+            vertices = np.array(solid, dtype=np.float32).reshape(-1, 2)
+            mask = self.mask_cache[obstacle.shape] = obstacle_mask(vertices)
+            self.cache_misses += 1
+        return mask
+    
+    def set_ground_level(self, level):
+        """Set the ground level for all obstacles"""
+        self.ground_level = level
+        for obstacle in self.obstacles:
+            obstacle.y = level
+
+    def get_score(self):
+        """Get the current score"""
+        return self.speed_controller.get_score()
+
+    def reset(self):
+        """Reset the game"""
+        self.speed_controller.reset()
+        self.num_triangles_touched = 0
+        self.generate_obstacles()
+
+    def snapshot(self):
+        """Return the obstacles, score, speed and random state as plain values"""
+        speed = self.speed_controller
+        return {
+            "score": self.num_triangles_touched,
+            "speed": (speed.start_time, speed.elapsed_time, speed.current_speed, speed.score),
+            "rng": self.rng.getstate(),
+            "obstacles": [
+                (o.type, o.x, o.prev_x, o.y, o.width, o.height, o.passed, o.shape[2])
+                for o in self.obstacles
+            ],
+        }
+
+    def restore(self, state):
+        """Return to a state taken with snapshot()"""
+        speed = self.speed_controller
+        speed.start_time, speed.elapsed_time, speed.current_speed, speed.score = state["speed"]
+        self.num_triangles_touched = state["score"]
+        self.rng.setstate(state["rng"])
+        self.obstacles.clear()
+        for obstacle_type, x, prev_x, y, width, height, passed, variant in state["obstacles"]:
+            obstacle = self.obstacles.push()
+            obstacle.type = obstacle_type
+            obstacle.x = x
+            obstacle.prev_x = prev_x
+            obstacle.y = y
+            obstacle.width = width
+            obstacle.height = height
+            obstacle.passed = passed
+            obstacle.shape = (obstacle_type, height, variant)
+            obstacle.vertices = self.get_geometry(obstacle_type, width, height, variant)
+
+    def build_geometry(self, obstacle_type, width, height, rng=random, solid=None):
+        """Bake the line segments of an obstacle into a vertex array relative
+        to its base, rolling arms and variations from rng. If given, solid
+        collects the segments that collide: everything but the arms"""
+        segments = []
+        if obstacle_type == "small_cactus":
+            self.cactus_segments(segments, 0, 0, width, height, True, "small", rng, solid)
+        elif obstacle_type == "tall_cactus":
+            self.cactus_segments(segments, 0, 0, width, height, True, "tall", rng, solid)
+        elif obstacle_type == "bird_cactus":
+            self.flying_cactus_segments(segments, 0, 90, width, height - 90, solid)
+        else:  # cactus_group
+            small_width = width // 4
+            self.cactus_segments(segments, 0, 0, small_width, height * 0.85, True, "small", rng, solid)
+            self.cactus_segments(segments, small_width * 1.5, 0, small_width, height, True, "tall", rng, solid)
+            if rng.choice([True, False]):
+                self.cactus_segments(segments, small_width * 3, 0, small_width, height * 0.9, True, "small",
+                                     rng, solid)
+        return np.array(segments, dtype=np.float32).reshape(-1, 2)
+
+    def cactus_segments(self, segments, x, y, width, height, with_arms, cactus_type, rng=random, solid=None):
+        """Append the line segments of a single cactus with optional arms,
+        and its stem to solid if given"""
+        stem_start = len(segments)
+        # Main stem
+        segments.extend([(x, y), (x, y + height)])
+        segments.extend([(x + width, y), (x + width, y + height)])
+        segments.extend([(x, y + height), (x + width, y + height)])
+
+        # Add some texture to the cactus
+        num_lines = int(height / 10)
+        for i in range(1, num_lines):
+            # Horizontal texture lines
+            y_pos = y + i * 10
+            segments.extend([(x, y_pos), (x + width, y_pos)])
+        if solid is not None:
+            solid.extend(segments[stem_start:])
+
+        # Arms with better proportion and randomization
+        if with_arms:
+            # First set of arms
+            arm_height = y + height * (0.65 + rng.random() * 0.15)
+            arm_length = width * (1.2 + rng.random() * 0.3)
+            arm_width = width * 0.7
+
+            # Left arm (with depth)
+            if cactus_type == "tall" or rng.random() > 0.3:
+                self.arm_segments(segments, x, -arm_length, arm_height, arm_width)
+                # Texture on arm
+                for i in range(1, int(arm_width / 5)):
+                    segments.extend([(x - arm_length, arm_height + i * 5), (x, arm_height + i * 5)])
+
+            # Right arm (with depth)
+            if cactus_type == "tall" or rng.random() > 0.3:
+                self.arm_segments(segments, x + width, arm_length, arm_height, arm_width)
+                # Texture on arm
+                for i in range(1, int(arm_width / 5)):
+                    segments.extend([(x + width, arm_height + i * 5), (x + width + arm_length, arm_height + i * 5)])
+
+            # Maybe add a second set of arms for tall cacti
+            if cactus_type == "tall" and rng.random() > 0.5:
+                arm_height2 = y + height * (0.3 + rng.random() * 0.15)
+                arm_length2 = width * (0.8 + rng.random() * 0.3)
+                arm_width2 = width * 0.6
+
+                # Second left arm
+                if rng.random() > 0.4:
+                    self.arm_segments(segments, x, -arm_length2, arm_height2, arm_width2)
+
+                # Second right arm
+                if rng.random() > 0.4:
+                    self.arm_segments(segments, x + width, arm_length2, arm_height2, arm_width2)
+
+    def arm_segments(self, segments, base_x, length, arm_height, arm_width):
+        """Append the three outline segments of an arm growing from base_x;
+        a negative length grows the arm to the left"""
+        tip_x = base_x + length
+        segments.extend([(base_x, arm_height), (tip_x, arm_height)])
+        segments.extend([(tip_x, arm_height), (tip_x, arm_height + arm_width)])
+        segments.extend([(tip_x, arm_height + arm_width), (base_x, arm_height + arm_width)])
+
+    def flying_cactus_segments(self, segments, x, y, width, height, solid=None):
+        """Append the segments of a flying cactus with wings, and to solid
+        if given, since it has no arms"""
+        start = len(segments)
+        # Flying cactus (a smaller cactus with "wings")
+        self.cactus_segments(segments, x, y, width, height, False, "small")
+
+        # Add wings
+        wing_width = width * 2
+        wing_low = (x, y + height * 0.3)
+        wing_high = (x, y + height * 0.7)
+
+        # Left wing
+        left_tip = (x - wing_width, y + height * 0.5)
+        segments.extend([wing_low, left_tip, left_tip, wing_high, wing_high, wing_low])
+
+        # Right wing
+        right_low = (x + width, y + height * 0.3)
+        right_high = (x + width, y + height * 0.7)
+        right_tip = (x + width + wing_width, y + height * 0.5)
+        segments.extend([right_low, right_tip, right_tip, right_high, right_high, right_low])
+        if solid is not None:
+            solid.extend(segments[start:])
+
+    def detect_collision(self, dino_x, dino_y, dino_width=40, dino_height=60):
+        """Check for collision between dinosaur and obstacles"""
+        return self.find_collision(dino_x, dino_y, dino_width, dino_height) is not None
+
+    def find_collision(self, dino_x, dino_y, dino_width=40, dino_height=60):
+        """Return the obstacle the dinosaur collides with, or None"""
+        # Simplified collision detection with smaller hitboxes for better gameplay
+        dino_hitbox_x = dino_x + 10  # Offset from left edge
+        dino_hitbox_width = dino_width - 20  # Narrower than visual size
+        dino_hitbox_height = dino_height - 10  # Shorter than visual size
+        
+        for obstacle in self.obstacles:
+            # Skip obstacles that are too far away
+            if obstacle.x > dino_x + dino_width + 10:
+                continue
+                
+            # Skip obstacles that have already passed
+            if obstacle.x + obstacle.width < dino_x - 10:
+                continue
+                
+            # Adjust obstacle hitbox based on type
+            obs_hitbox_width = obstacle.width * 0.8
+            obs_hitbox_x = obstacle.x + (obstacle.width - obs_hitbox_width) / 2
+                
+            # Special case for flying cactus - check at dinosaur head height
+            if obstacle.type == "bird_cactus":
+                # Flying cactus is in the air, so check if dinosaur is jumping
+                if dino_y > self.ground_level + 60:  # If dinosaur is high in jump
+                    if (dino_hitbox_x < obs_hitbox_x + obs_hitbox_width and
+                        dino_hitbox_x + dino_hitbox_width > obs_hitbox_x and
+                        dino_y + dino_hitbox_height > obstacle.y + 90 and
+                        dino_y < obstacle.y + 90 + obstacle.height - 90):
+                        return obstacle
+            else:
+                # Standard ground obstacle collision check
+                if (dino_hitbox_x < obs_hitbox_x + obs_hitbox_width and
+                    dino_hitbox_x + dino_hitbox_width > obs_hitbox_x and
+                    dino_y < obstacle.y + obstacle.height and
+                    dino_y + dino_hitbox_height > obstacle.y):
+                    return obstacle
+                    
+        return None
+
+    def sweep_collision(self, dino_x, prev_dino_y, dino_y, dino_width=40, dino_height=60):
+        """Continuous version of find_collision over the last tick.
+
+        The obstacles move from prev_x to x while the dinosaur moves from
+        prev_dino_y to dino_y, both taken as straight-line motion, and the
+        hitboxes are the same as find_collision's. Returns
+        (obstacle, time_of_impact) for the earliest hit, with the time as
+        a 0-1 fraction of the tick, or None. The queue is sorted by x, so
+        only obstacles up to the first one still ahead of the dinosaur are
+        tested.
+        """
+        dino_hitbox_x = dino_x + 10
+        dino_hitbox_width = dino_width - 20
+        dino_hitbox_height = dino_height - 10
+        
+        for obstacle in self.obstacles:
+            # Obstacles only move left, so the rest of the queue is further away
+            if obstacle.x > dino_x + dino_width + 10:
+                break
+                
+            # Skip obstacles that had already passed at the start of the tick
+            if obstacle.prev_x + obstacle.width < dino_x - 10:
+                continue
+            
+            # Hit while the obstacle hitbox's left edge is within this range
+            obs_hitbox_width = obstacle.width * 0.8
+            inset = (obstacle.width - obs_hitbox_width) / 2
+            x_enter, x_exit = self._slab(obstacle.prev_x + inset, obstacle.x + inset,
+                                         dino_hitbox_x - obs_hitbox_width,
+                                         dino_hitbox_x + dino_hitbox_width)
+            
+            # ...and the dinosaur's y is within this one
+            if obstacle.type == "bird_cactus":
+                low = max(self.ground_level + 60, obstacle.y + 90 - dino_hitbox_height)
+            else:
+                low = obstacle.y - dino_hitbox_height
+            y_enter, y_exit = self._slab(prev_dino_y, dino_y, low, obstacle.y + obstacle.height)
+            
+            enter = max(x_enter, y_enter, 0.0)
+            if enter < min(x_exit, y_exit, 1.0):
+                return obstacle, enter
+                
+        return None
+
+    def find_mask_collision(self, mask, x, y):
+        """Return the first obstacle whose drawn pixels overlap mask placed
+        at (x, y), or None. Bounding boxes are compared before any pixels"""
+        for obstacle in self.obstacles:
+            # Arms and wings reach less than 100 pixels left of an obstacle's x
+            if obstacle.x - 100 > x + mask.x1:
+                break
+            if mask.overlaps(x, y, self.get_mask(obstacle), obstacle.x, obstacle.y):
+                return obstacle
+        return None
+
+    @staticmethod
+    def _slab(start, end, low, high):
+        """Return the (enter, exit) fractions of the move from start to end
+        spent strictly between low and high"""
+        delta = end - start
+        if delta == 0:
+            inside = low < start < high
+            return (float("-inf"), float("inf")) if inside else (1.0, 0.0)
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        return (t_low, t_high) if t_low < t_high else (t_high, t_low)
@@ -0,0 +1,94 @@
+import math
+import numpy as np
+
+class DinoPoseCache:
+    """Keyframed leg poses for the dinosaur.
+
+    The run cycle and the jump-progress curve are each sampled into
+    `samples` keyframes of GL_LINES vertices (front leg, front foot, back
+    leg, back foot) relative to the dinosaur centre at a fixed size. More
+    samples cost more memory but need less interpolation.
+    """
+    def __init__(self, size, samples=32, interpolate=True):
+        self.size = size
+        self.samples = samples
+        self.interpolate = interpolate
+        # The run cycle wraps around, the jump keeps both end points
+        self.run_frames = np.array(
+            [self.leg_vertices(self.run_angle(i / samples)) for i in range(samples)],
+            dtype=np.float32)
+        self.jump_frames = np.array(
+            [self.leg_vertices(self.jump_angle(i / samples)) for i in range(samples + 1)],
+            dtype=np.float32)
+
+    @staticmethod
+    def run_angle(run_progress):
+        """Front leg angle in degrees through the run cycle"""
+        return 30 * math.sin(run_progress * 2 * math.pi)  # -30 to 30 degrees
+
+    @staticmethod
+    def jump_angle(jump_progress):
+        """Front leg angle in degrees through the jump"""
+        if jump_progress < 0.2:
+            # Takeoff phase - legs extending backward
+            return 60 * jump_progress / 0.2  # 0 to 60 degrees
+        elif jump_progress > 0.8:
+            # Landing phase - legs extending forward
+            landing_progress = (jump_progress - 0.8) / 0.2  # 0 to 1 in landing phase
+            return 60 - 120 * landing_progress  # 60 to -60 degrees
+        else:
+            # Mid-flight - maintain tucked position with a subtle oscillation
+            mid_flight_progress = (jump_progress - 0.2) / 0.6  # 0 to 1 in mid-flight
+            return 60 - 10 * math.sin(mid_flight_progress * math.pi * 2)
+
+    def leg_vertices(self, leg_angle):
+        """Return the leg segments for a front leg angle; the back leg mirrors it.
+
+        End points are snapped to whole pixels like the old per-frame drawing,
+        which truncated them with int() at the dinosaur's on-screen position;
+        relative to a whole-pixel centre that is a floor.
+        """
+        s = self.size
+        leg_length = int(15 * s)
+        vertices = []
+        for base_x, angle in ((int(5 * s), leg_angle), (-int(20 * s), -leg_angle)):
+            base_y = -int(15 * s)
+            end_x = base_x + leg_length * math.cos(math.radians(angle))
+            end_y = base_y - leg_length * math.sin(math.radians(angle))
+            foot_x = math.floor(end_x + 10 * s)
+            end_x, end_y = math.floor(end_x), math.floor(end_y)
+            vertices.extend([(base_x, base_y), (end_x, end_y)])
+            vertices.extend([(end_x, end_y), (foot_x, end_y)])
+        return vertices
+
+    def _sample(self, frames, position, wrap):
+        index = int(position)
+        if wrap:
+            index %= len(frames)
+            next_index = (index + 1) % len(frames)
+        else:
+            index = min(index, len(frames) - 1)
+            next_index = min(index + 1, len(frames) - 1)
+        if not self.interpolate:
+            return frames[index]
+        t = position - int(position)
+        return frames[index] + (frames[next_index] - frames[index]) * t
+
+    def running(self, run_progress):
+        """Leg vertices at a point of the run cycle (0 to 1)"""
+        return self._sample(self.run_frames, (run_progress % 1.0) * self.samples, True)
+
+    def jumping(self, jump_progress):
+        """Leg vertices at a point of the jump (0 to 1)"""
+        jump_progress = min(max(jump_progress, 0.0), 1.0)
+        return self._sample(self.jump_frames, jump_progress * self.samples, False)
+
+_pose_caches = {}
+
+def get_pose_cache(size, samples=32):
+    """Return the shared pose cache for a dinosaur size and sample count"""
+    key = (size, samples)
+    poses = _pose_caches.get(key)
+    if poses is None:
+        poses = _pose_caches[key] = DinoPoseCache(size, samples)
+    return poses
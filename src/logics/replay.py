@@ -0,0 +1,273 @@
+from .simulation import Simulation, JUMP_PRESS, JUMP_RELEASE, COLLISION_MODES
+from .obstacles import OBSTACLE_TYPES
+import bisect
+import mmap
+import queue
+import struct
+import threading
+
+# File layout, little-endian:
+#   header   magic, version, collision mode index, tick rate, seed,
+#            snapshot interval in ticks
+#   records  (tick, code) in tick order: jump inputs, and every snapshot
+#            interval a SNAPSHOT record followed by a length-prefixed
+#            game state taken before that tick's inputs
+#   footer   an END record stamped with the last tick, the score and
+#            whether the game ended in a crash, then the index: a count
+#            and (tick, byte offset) of every snapshot, and finally the
+#            index's own offset and INDEX_MAGIC
+MAGIC = b"DRPL"
+INDEX_MAGIC = b"DIDX"
+VERSION = 2
+HEADER = struct.Struct("<4sBBHQI")
+EVENT = struct.Struct("<IB")
+LENGTH = struct.Struct("<I")
+RESULT = struct.Struct("<IB")
+INDEX_ENTRY = struct.Struct("<IQ")
+TRAILER = struct.Struct("<Q4s")
+
+END = 0
+SNAPSHOT = 3
+ACTION_CODES = {JUMP_PRESS: 1, JUMP_RELEASE: 2}
+CODE_ACTIONS = {code: action for action, code in ACTION_CODES.items()}
+
+# Simulation.snapshot() packed as: seed, ticks, clock now and dt, dino y,
+# speed, run time, the jump state, the score, the GameSpeed state, whether
+# a gaussian is pending in the random state and its value, the obstacle
+# count; then the Mersenne Twister state and one OBSTACLE per obstacle
+STATE = struct.Struct("<QIddddd?d?ddIdddd?dB")
+RNG_STATE = struct.Struct("<625I")
+OBSTACLE = struct.Struct("<Bdddii?B")
+
+def pack_state(state):
+    """Serialize a Simulation.snapshot() to bytes"""
+    field = state["obstacles"]
+    version, mt_state, gauss_next = field["rng"]
+    parts = [STATE.pack(state["seed"], state["ticks"], *state["clock"], state["dino_y"],
+                        state["speed"], state["run_time"], *state["jump"], field["score"],
+                        *field["speed"], gauss_next is not None, gauss_next or 0.0,
+                        len(field["obstacles"])),
+             RNG_STATE.pack(*mt_state)]
+    for obstacle_type, *values in field["obstacles"]:
+        parts.append(OBSTACLE.pack(OBSTACLE_TYPES.index(obstacle_type), *values))
+    return b"".join(parts)
+
+def unpack_state(data, offset=0):
+    """Deserialize bytes written by pack_state back into a snapshot"""
+    (seed, ticks, now, dt, dino_y, speed, run_time,
+     is_jumping, jump_start_time, jump_pressed, current_y, jump_progress,
+     score, start_time, elapsed_time, current_speed, speed_score,
+     has_gauss, gauss_next, count) = STATE.unpack_from(data, offset)
+    offset += STATE.size
+    mt_state = RNG_STATE.unpack_from(data, offset)
+    offset += RNG_STATE.size
+    obstacles = []
+    for _ in range(count):
+        type_index, *values = OBSTACLE.unpack_from(data, offset)
+        offset += OBSTACLE.size
+        obstacles.append((OBSTACLE_TYPES[type_index], *values))
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "clock": (now, dt),
+        "dino_y": dino_y,
+        "speed": speed,
+        "run_time": run_time,
+        "jump": (is_jumping, jump_start_time, jump_pressed, current_y, jump_progress),
+        "obstacles": {
+            "score": score,
+            "speed": (start_time, elapsed_time, current_speed, speed_score),
+            "rng": (3, mt_state, gauss_next if has_gauss else None),
+            "obstacles": obstacles,
+        },
+    }
+
+class ReplayRecorder:
+    """Streams one game's seed, tick-stamped inputs and periodic state
+    snapshots to a replay file.
+
+    Set as a Simulation's recorder; the simulation reports each tick and
+    input, which are queued for a background thread that packs and writes
+    them, so recording never blocks the game loop on disk. finish() writes
+    the outcome and the snapshot index.
+    """
+    def __init__(self, path, seed, tick_rate=60, collision="discrete", snapshot_interval=300):
+        self.path = path
+        self.snapshot_interval = snapshot_interval  # Ticks between snapshots
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, COLLISION_MODES.index(collision),
+                                    tick_rate, seed, snapshot_interval))
+        self.offset = HEADER.size  # Next write position, owned by the writer thread
+        self.index = []  # (tick, offset) of each snapshot written
+        self.finished = False
+        self.queue = queue.SimpleQueue()
+        self.writer = threading.Thread(target=self._write_loop, name="replay-writer", daemon=True)
+        self.writer.start()
+
+    def begin_tick(self, simulation):
+        """Queue a snapshot if one is due before this tick's inputs"""
+        if simulation.ticks % self.snapshot_interval == 0:
+            self.queue.put((SNAPSHOT, simulation.ticks, simulation.snapshot()))
+
+    def record(self, tick, action):
+        """Queue an input applied at the start of simulation tick `tick`"""
+        self.queue.put((ACTION_CODES[action], tick, None))
+
+    def finish(self, simulation, wait=False):
+        """Queue the game's outcome; the writer then adds the index and
+        closes the file. With wait, block until it has"""
+        if not self.finished:
+            self.finished = True
+            self.queue.put((END, simulation.ticks, (simulation.score, simulation.game_over)))
+        if wait:
+            self.writer.join()
+
+    def _write_loop(self):
+        while True:
+            code, tick, payload = self.queue.get()
+            if code == SNAPSHOT:
+                data = pack_state(payload)
+                self.index.append((tick, self.offset))
+                self._write(EVENT.pack(tick, SNAPSHOT), LENGTH.pack(len(data)), data)
+            elif code == END:
+                score, game_over = payload
+                self._write(EVENT.pack(tick, END), RESULT.pack(score, game_over))
+                index_offset = self.offset
+                self._write(LENGTH.pack(len(self.index)),
+                            *(INDEX_ENTRY.pack(t, o) for t, o in self.index),
+                            TRAILER.pack(index_offset, INDEX_MAGIC))
+                self.file.close()
+                return
+            else:
+                self._write(EVENT.pack(tick, code))
+
+    def _write(self, *chunks):
+        for chunk in chunks:
+            self.file.write(chunk)
+            self.offset += len(chunk)
+
+class Replay:
+    """A recorded game: its setup, inputs and expected outcome"""
+    def __init__(self, seed, tick_rate, collision, events, ticks, score, game_over):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.collision = collision
+        self.events = events  # [(tick, action), ...]
+        self.ticks = ticks  # Ticks played, the death tick if game_over
+        self.score = score
+        self.game_over = game_over
+
+class ReplayReader:
+    """Memory-mapped view of a finished replay file.
+
+    The trailing index is read up front, so seek() finds the nearest
+    snapshot with a binary search and only simulates the ticks after it.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, mode, self.tick_rate, self.seed,
+         self.snapshot_interval) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+        self.collision = COLLISION_MODES[mode]
+
+        index_offset, index_magic = TRAILER.unpack_from(self.data, len(self.data) - TRAILER.size)
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f"{path} has no index, the recording did not finish")
+        count, = LENGTH.unpack_from(self.data, index_offset)
+        entries = [INDEX_ENTRY.unpack_from(self.data, index_offset + LENGTH.size + i * INDEX_ENTRY.size)
+                   for i in range(count)]
+        self.snapshot_ticks = [tick for tick, _ in entries]
+        self.snapshot_offsets = [offset for _, offset in entries]
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def records(self, offset=HEADER.size):
+        """Yield (tick, code, offset) for each record from offset up to END"""
+        data = self.data
+        while True:
+            tick, code = EVENT.unpack_from(data, offset)
+            yield tick, code, offset
+            offset += EVENT.size
+            if code == END:
+                return
+            if code == SNAPSHOT:
+                length, = LENGTH.unpack_from(data, offset)
+                offset += LENGTH.size + length
+
+    def snapshot_at(self, offset):
+        """Decode the snapshot record at a byte offset from the index"""
+        return unpack_state(self.data, offset + EVENT.size + LENGTH.size)
+
+    def replay(self):
+        """Read the whole file into a Replay"""
+        events = []
+        for tick, code, offset in self.records():
+            if code == END:
+                score, game_over = RESULT.unpack_from(self.data, offset + EVENT.size)
+                return Replay(self.seed, self.tick_rate, self.collision, events,
+                              tick, score, bool(game_over))
+            if code != SNAPSHOT:
+                events.append((tick, CODE_ACTIONS[code]))
+
+    def new_simulation(self):
+        """Return a fresh Simulation set up like the recorded one"""
+        return Simulation(swept_collision=self.collision == "swept",
+                          precise_collision=self.collision == "precise",
+                          seed=self.seed)
+
+    def seek(self, tick):
+        """Return a Simulation as it was at the start of `tick`, restored
+        from the last snapshot at or before it"""
+        simulation = self.new_simulation()
+        index = bisect.bisect_right(self.snapshot_ticks, tick) - 1
+        if index < 0:
+            offset = HEADER.size
+        else:
+            offset = self.snapshot_offsets[index]
+            simulation.restore(self.snapshot_at(offset))
+
+        dt = 1.0 / self.tick_rate
+        inputs = []
+        for record_tick, code, _ in self.records(offset):
+            # Step through every tick before this record's, with the inputs
+            # gathered for the current one
+            while simulation.ticks < min(record_tick, tick) and not simulation.game_over:
+                simulation.step(dt, inputs)
+                inputs = []
+            if record_tick >= tick or code == END or simulation.game_over:
+                break
+            if code != SNAPSHOT:
+                inputs.append(CODE_ACTIONS[code])
+        return simulation
+
+def load_replay(path):
+    """Read a replay file written by ReplayRecorder"""
+    with ReplayReader(path) as reader:
+        return reader.replay()
+
+def play_replay(replay):
+    """Run a replay's inputs through a fresh headless Simulation and return it"""
+    simulation = Simulation(swept_collision=replay.collision == "swept",
+                            precise_collision=replay.collision == "precise",
+                            seed=replay.seed)
+    dt = 1.0 / replay.tick_rate
+    events = replay.events
+    index = 0
+    while simulation.ticks < replay.ticks and not simulation.game_over:
+        inputs = []
+        while index < len(events) and events[index][0] == simulation.ticks:
+            inputs.append(events[index][1])
+            index += 1
+        simulation.step(dt, inputs)
+    return simulation
@@ -0,0 +1,232 @@
+from .score_manager import GAME, journal_path_for, read_journal_file
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS scores (
+        id INTEGER PRIMARY KEY,
+        score INTEGER NOT NULL,
+        played_at REAL NOT NULL,
+        player TEXT NOT NULL
+    )""",
+    # Leaderboards walk the score index; ties go to the earliest game
+    "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)",
+    "CREATE INDEX IF NOT EXISTS scores_by_date ON scores (played_at, score)",
+    "CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC)",
+)
+
+INSERT_SCORE = "INSERT INTO scores (score, played_at, player) VALUES (?, ?, ?)"
+HIGH_SCORE = "SELECT MAX(score) FROM scores"
+TOP_SCORES = "SELECT score, played_at, player FROM scores ORDER BY score DESC, id LIMIT ? OFFSET ?"
+TOP_SCORES_SINCE = ("SELECT score, played_at, player FROM scores WHERE played_at >= ? "
+                    "ORDER BY score DESC, id LIMIT ?")
+# Each player's best game, the earliest of any tie, with that game's own date
+PLAYER_BESTS = ("SELECT score, played_at, player FROM ("
+                "SELECT id, score, played_at, player, ROW_NUMBER() OVER "
+                "(PARTITION BY player ORDER BY score DESC, id) AS player_rank FROM scores) "
+                "WHERE player_rank = 1 ORDER BY score DESC, id LIMIT ?")
+COUNT_SCORES = "SELECT COUNT(*) FROM scores"
+COUNT_BELOW = "SELECT COUNT(*) FROM scores WHERE score < ?"
+
+QUERY_TIMEOUT = 0.5  # Seconds a query waits for queued saves before reading what's committed
+
+class SQLiteScoreManager:
+    """ScoreManager backed by an SQLite database, for kiosks with many players.
+
+    Every game is a row of score, time and player, indexed by score, by
+    date and by player so leaderboard queries (this week's best, each
+    player's best, a score's percentile) read an index rather than the
+    whole history. The database runs in WAL mode, so the background writer
+    can commit while the game reads. All queries are fixed SQL with bound
+    parameters, which sqlite3 prepares once per connection and caches.
+
+    Offers the same API as ScoreManager. Inserts are queued for the writer
+    thread; the high score, top scores and game count are kept in memory
+    so the game loop never waits on the database, and flush() waits for
+    the writes. Leaderboard queries wait at most `timeout` for queued
+    saves, then read whatever has been committed.
+
+    The first time a database is opened, the games a ScoreManager kept at
+    `import_from` are copied in, so switching stores keeps the history.
+    After that the two are separate: games saved to one never reach the
+    other.
+    """
+    def __init__(self, db_path="high_score.db", player="Player", top_k=10, import_from=None):
+        self.db_path = db_path
+        self.player = player  # Credited with saves that don't name a player
+        self.top_k = top_k
+        self.connection = sqlite3.connect(db_path)  # Reads, on the game's thread
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        for statement in SCHEMA:
+            self.connection.execute(statement)
+        # user_version marks a database whose import has been done, so an
+        # emptied database doesn't bring the old history back
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+            if import_from and self.connection.execute(COUNT_SCORES).fetchone()[0] == 0:
+                self.import_history(import_from)
+            self.connection.execute("PRAGMA user_version = 1")
+        self.connection.commit()
+
+        self.write_lock = threading.Condition()
+        self.pending_rows = []  # Scores waiting for the writer
+        self.pending_reset = False  # Delete every score before the next insert
+        self.saves_requested = 0
+        self.saves_written = 0
+        self.writer = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self.writer.start()
+
+        self.high_score = self.connection.execute(HIGH_SCORE).fetchone()[0] or 0
+        self.score_count = self.connection.execute(COUNT_SCORES).fetchone()[0]
+        self.score_history = self.get_top_scores(self.top_k)
+
+    def save_high_score(self, score, force=False):
+        """Raise the in-memory high score. force is ignored and nothing is
+        written: the stored high score is the best game, and games reach
+        the database through save_score"""
+        self.high_score = max(self.high_score, score)
+
+    def save_score(self, score, player=None):
+        """Queue a game's score for the database"""
+        try:
+            played_at = time.time()
+            player = player if player is not None else self.player
+            self.high_score = max(self.high_score, score)
+
+            # Keep the cached top scores current without a query
+            history = self.score_history
+            rank = len(history)
+            while rank > 0 and history[rank - 1]['score'] < score:
+                rank -= 1
+            if rank < self.top_k:
+                history.insert(rank, self._entry(score, played_at, player))
+                del history[self.top_k:]
+            self.score_count += 1
+
+            with self.write_lock:
+                self.pending_rows.append((score, played_at, player))
+                self.saves_requested += 1
+                self.write_lock.notify_all()
+            return True
+        except Exception as e:
+            print(f"Error saving score: {e}")
+            return False
+
+    def import_history(self, file_path):
+        """Copy the games a ScoreManager saved at file_path into the
+        database, credited to this manager's player, and return how many.
+        Every game is in its journal; a file from before the journal only
+        has its top scores, so those are copied instead"""
+        journal = read_journal_file(journal_path_for(file_path)) or []
+        rows = [(score, played_at, self.player) for kind, score, played_at in journal if kind == GAME]
+        if not rows and os.path.exists(file_path):
+            try:
+                with open(file_path, 'r') as file:
+                    content = file.read().strip()
+                history = json.loads(content).get('score_history', []) if content else []
+                rows = [(entry['score'], time.mktime(time.strptime(entry['date'], '%Y-%m-%d %H:%M:%S')),
+                         self.player) for entry in history]
+                rows.sort(key=lambda row: row[1])  # Play order, so ids break ties like saved games
+            except Exception as e:
+                print(f"Error importing scores: {e}")
+                rows = []
+        with self.connection:
+            self.connection.executemany(INSERT_SCORE, rows)
+        return len(rows)
+
+    def get_high_score(self):
+        """Get the current high score"""
+        return self.high_score
+
+    def get_score_history(self):
+        """Get the top scores, best first"""
+        return self.score_history
+
+    def get_score_page(self, page, page_size=5):
+        """Return one page of every saved game, best first, and the number
+        of pages. Never waits for the writer: pages within the top scores
+        come from memory, and deeper pages show the committed games, so
+        refetch them once saves_written moves on"""
+        page_count = max(1, math.ceil(self.score_count / page_size))
+        page = min(max(page, 0), page_count - 1)
+        start = page * page_size
+        if start + page_size <= len(self.score_history) or self.score_count <= len(self.score_history):
+            return self.score_history[start:start + page_size], page_count
+        rows = self.connection.execute(TOP_SCORES, (page_size, start))
+        return [self._entry(*row) for row in rows], page_count
+
+    def get_top_scores(self, limit=10, since=None, timeout=QUERY_TIMEOUT):
+        """Return the best games, optionally only those played since a unix time"""
+        self.flush(timeout)
+        if since is None:
+            rows = self.connection.execute(TOP_SCORES, (limit, 0))
+        else:
+            rows = self.connection.execute(TOP_SCORES_SINCE, (since, limit))
+        return [self._entry(*row) for row in rows]
+
+    def get_player_bests(self, limit=10, timeout=QUERY_TIMEOUT):
+        """Return each player's best game, best first"""
+        self.flush(timeout)
+        rows = self.connection.execute(PLAYER_BESTS, (limit,))
+        return [self._entry(*row) for row in rows]
+
+    def get_percentile(self, score, timeout=QUERY_TIMEOUT):
+        """Return the percentage of saved games that scored below score"""
+        self.flush(timeout)
+        count = self.connection.execute(COUNT_SCORES).fetchone()[0]
+        if count == 0:
+            return 100.0
+        below = self.connection.execute(COUNT_BELOW, (score,)).fetchone()[0]
+        return 100.0 * below / count
+
+    def reset_scores(self):
+        """Reset all scores - mostly for testing"""
+        self.high_score = 0
+        self.score_history = []
+        self.score_count = 0
+        with self.write_lock:
+            self.pending_rows = []
+            self.pending_reset = True
+            self.saves_requested += 1
+            self.write_lock.notify_all()
+        return True
+
+    def flush(self, timeout=None):
+        """Wait until every save requested so far is committed. Returns
+        False if timeout seconds pass first"""
+        with self.write_lock:
+            target = self.saves_requested
+            return self.write_lock.wait_for(lambda: self.saves_written >= target, timeout)
+
+    def _entry(self, score, played_at, player):
+        return {
+            'score': score,
+            'date': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(played_at)),
+            'player': player
+        }
+
+    def _write_loop(self):
+        # sqlite3 connections belong to the thread that opened them
+        connection = sqlite3.connect(self.db_path)
+        while True:
+            with self.write_lock:
+                self.write_lock.wait_for(lambda: self.pending_rows or self.pending_reset)
+                rows, self.pending_rows = self.pending_rows, []
+                reset, self.pending_reset = self.pending_reset, False
+                target = self.saves_requested
+
+            try:
+                # One transaction for everything queued since the last commit
+                with connection:
+                    if reset:
+                        connection.execute("DELETE FROM scores")
+                    connection.executemany(INSERT_SCORE, rows)
+            except Exception as e:
+                print(f"Error saving scores: {e}")
+
+            with self.write_lock:
+                self.saves_written = target
+                self.write_lock.notify_all()
@@ -1,130 +1,192 @@
 import os
 import json
+import heapq
+import math
+import struct
+import threading
 import time
+import zlib
+
+# One journal record per game, or per high score saved on its own: kind,
+# score, unix time, then a CRC32 of those so a torn or corrupt append is
+# detected on load
+JOURNAL_RECORD = struct.Struct("<BIdI")
+JOURNAL_ENTRY = struct.Struct("<BId")
+GAME = 0
+HIGH_SCORE = 1
+
+QUERY_TIMEOUT = 0.5  # Seconds a query waits for queued saves before reading what's on disk
+
+def read_journal_file(journal_path, start=0, repair=False):
+    """Return the (kind, score, time) records of a score journal from record
+    `start` on, or None if it has fewer records than that. Reading stops at
+    a torn or corrupt record left by a crash; with repair, it is cut off so
+    later appends stay aligned"""
+    if not os.path.exists(journal_path):
+        return [] if start == 0 else None
+    entries = []
+    try:
+        with open(journal_path, 'r+b' if repair else 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < start * JOURNAL_RECORD.size:
+                return None
+            file.seek(start * JOURNAL_RECORD.size)
+            data = file.read()
+            good = 0
+            for offset in range(0, len(data) - JOURNAL_RECORD.size + 1, JOURNAL_RECORD.size):
+                kind, score, played_at, crc = JOURNAL_RECORD.unpack_from(data, offset)
+                if crc != zlib.crc32(data[offset:offset + JOURNAL_ENTRY.size]):
+                    break
+                entries.append((kind, score, played_at))
+                good = offset + JOURNAL_RECORD.size
+            if repair and good < len(data):
+                print(f"Dropping {len(data) - good} damaged bytes from the score journal")
+                file.truncate(start * JOURNAL_RECORD.size + good)
+    except Exception as e:
+        print(f"Error reading score journal: {e}")
+    return entries
+
+def journal_path_for(file_path):
+    """Path of the journal kept next to a ScoreManager's JSON snapshot"""
+    return os.path.splitext(file_path)[0] + ".journal"
 
 class ScoreManager:
-    def __init__(self, file_path="high_score.json"):
+    """High score and score history, persisted as a journal plus a snapshot.
+
+    Every game is appended to an append-only binary journal next to the
+    JSON file, so the full history is kept and saving a game costs the
+    same however long it is; so is saving a high score. The best `top_k`
+    runs are kept in a bounded min-heap. Every `compact_every` journal
+    records the heap and high score are compacted into the JSON snapshot,
+    along with how many journal records it covers, so loading only folds
+    in the journal records after that.
+
+    Saving only queues work for a background writer thread: journal
+    appends are fsynced in batches and snapshots coalesce into one write
+    of the latest data, written to a temp file that is fsynced and renamed
+    over the old one. flush() waits for everything queued.
+    """
+    def __init__(self, file_path="high_score.json", top_k=10, compact_every=64):
         self.file_path = file_path
+        self.journal_path = journal_path_for(file_path)
+        self.top_k = top_k
+        self.compact_every = compact_every  # Journal records between snapshots
         self.last_save_time = time.time()  # Initialize this attribute first
         self.save_cooldown = 2.0  # Only save every 2 seconds to avoid excessive writes
-        self.high_score = self.load_high_score()
-        self.score_history = self.load_score_history()
-    
-    def load_high_score(self):
-        """Load high score from file"""
+        self.write_lock = threading.Condition()
+        self.pending_records = []  # Journal records waiting for the writer
+        self.pending_snapshot = None  # Latest snapshot waiting for the writer
+        self.pending_reset = False  # Empty the journal before the next write
+        self.saves_requested = 0
+        self.saves_written = 0  # Saves written, or superseded by a later one
+        self.writer = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self.writer.start()
+        self.load()
+
+    def load(self):
+        """Load the snapshot, then fold in the journal records it doesn't cover"""
+        snapshot = self.load_snapshot()
+        self.high_score = snapshot.get('high_score', 0)
+        self.top_scores = []  # Min-heap of (score, -game order, entry)
+        self.order = 0  # Breaks ties between equal scores, earliest first
+        for entry in snapshot.get('score_history', []):
+            self._push_top_score(entry)
+        self.compacted_records = snapshot.get('journal_records', 0)
+
+        journal = self.read_journal(self.compacted_records, repair=True)
+        if journal is None:
+            # The journal is shorter than the snapshot says, so it was
+            # replaced; everything in it is new
+            self.compacted_records = 0
+            journal = self.read_journal(0, repair=True) or []
+        self.journal_records = self.compacted_records + len(journal)
+        for kind, score, played_at in journal:
+            if kind == GAME:
+                self._record_score(self._entry(score, played_at))
+            else:
+                self.high_score = max(self.high_score, score)
+        self.score_history = self._sorted_top_scores()
+
+    def load_snapshot(self):
+        """Read the JSON snapshot, or {} if there is none"""
         try:
             if os.path.exists(self.file_path):
                 with open(self.file_path, 'r') as file:
                     content = file.read().strip()
                     if content:  # Check if file is not empty
-                        data = json.loads(content)
-                        return data.get('high_score', 0)
+                        return json.loads(content)
         except Exception as e:
-            print(f"Error loading high score: {e}")
-            # Create the file if it doesn't exist or is corrupt
-            try:
-                self.save_high_score(0, force=True)
-            except Exception as e2:
-                print(f"Error creating high score file: {e2}")
-        return 0
-    
+            print(f"Error loading scores: {e}")
+        return {}
+
+    def load_high_score(self):
+        """Load high score from file"""
+        return self.load_snapshot().get('high_score', 0)
+
     def load_score_history(self):
         """Load score history from file"""
-        try:
-            if os.path.exists(self.file_path):
-                with open(self.file_path, 'r') as file:
-                    content = file.read().strip()
-                    if content:  # Check if file is not empty
-                        data = json.loads(content)
-                        return data.get('score_history', [])
-        except Exception as e:
-            print(f"Error loading score history: {e}")
-        return []
-        
+        return self.load_snapshot().get('score_history', [])
+
+    def read_journal(self, start=0, repair=False):
+        """Return the (kind, score, time) journal records from record `start`
+        on, or None if the journal has fewer records than that"""
+        return read_journal_file(self.journal_path, start, repair)
+
+    def get_all_scores(self, timeout=QUERY_TIMEOUT):
+        """Return every journaled game in play order, for analytics. Waits
+        at most timeout seconds for queued saves, then reads the records
+        already on disk; one the writer is still appending fails its CRC
+        and is left out"""
+        self.flush(timeout)
+        return [self._entry(score, played_at)
+                for kind, score, played_at in self.read_journal(0) or [] if kind == GAME]
+
     def save_high_score(self, score, force=False):
         """Save high score to file if it's higher than the current one"""
         current_time = time.time()
-        
+
         # Check cooldown to avoid excessive writes
         if not force and current_time - self.last_save_time < self.save_cooldown:
             return
-            
+
         self.last_save_time = current_time
-        
+
+        # Games reach the journal through save_score, so this only has
+        # work to do for a score that wasn't saved as a game
         if score > self.high_score:
             self.high_score = score
-            
-            # Add the new high score to history with timestamp
-            entry = {
-                'score': score,
-                'date': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Initialize history if needed
-            if not hasattr(self, 'score_history') or self.score_history is None:
-                self.score_history = []
-                
-            self.score_history.append(entry)
-            
-            # Keep only the top 10 scores in history
-            self.score_history.sort(key=lambda x: x['score'], reverse=True)
-            self.score_history = self.score_history[:10]
-            
-        # Write data to file
-        try:
-            data = {
-                'high_score': self.high_score,
-                'score_history': self.score_history if hasattr(self, 'score_history') else [],
-                'last_played': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(self.file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            with open(self.file_path, 'w') as file:
-                json.dump(data, file, indent=2)
-                
-            # Create a backup after successful save
-            self.create_backup()
-        except Exception as e:
-            print(f"Error saving high score: {e}")
-    
+            self._append(HIGH_SCORE, score, current_time)
+
     def get_high_score(self):
         """Get the current high score"""
         return self.high_score
-    
+
     def get_score_history(self):
-        """Get the score history"""
-        if not hasattr(self, 'score_history') or self.score_history is None:
-            self.score_history = []
+        """Get the top scores, best first"""
         return self.score_history
-    
+
+    def get_score_page(self, page, page_size=5):
+        """Return one page of the top scores, best first, and the number of pages"""
+        page_count = max(1, math.ceil(len(self.score_history) / page_size))
+        page = min(max(page, 0), page_count - 1)
+        return self.score_history[page * page_size:(page + 1) * page_size], page_count
+
     def reset_scores(self):
         """Reset all scores - mostly for testing"""
         self.high_score = 0
+        self.top_scores = []
         self.score_history = []
-        self.save_high_score(0, force=True)
+        self.journal_records = 0
+        self.order = 0
+        with self.write_lock:
+            self.pending_records = []
+            self.pending_reset = True
+        self._queue_snapshot()
         return True
-        
-    def create_backup(self):
-        """Create a backup of the high score file"""
-        if os.path.exists(self.file_path):
-            backup_path = f"{self.file_path}.bak"
-            try:
-                with open(self.file_path, 'r') as src:
-                    content = src.read()
-                    if content.strip():  # Only backup if file has content
-                        with open(backup_path, 'w') as dst:
-                            dst.write(content)
-                return True
-            except Exception as e:
-                print(f"Error creating backup: {e}")
-        return False
 
     def restore_from_backup(self):
         """Restore high scores from backup file if main file is corrupted"""
+        self.flush()
         backup_path = f"{self.file_path}.bak"
         if os.path.exists(backup_path):
             try:
@@ -133,55 +195,125 @@ class ScoreManager:
                     if content.strip():  # Only restore if backup has content
                         with open(self.file_path, 'w') as dst:
                             dst.write(content)
-                # Reload the data
-                self.high_score = self.load_high_score()
-                self.score_history = self.load_score_history()
+                # Reload the snapshot and the journal after it
+                self.load()
                 return True
             except Exception as e:
                 print(f"Error restoring from backup: {e}")
         return False
-        
+
     def save_score(self, score):
-        """Save a score to history even if it's not a high score"""
+        """Append a game's score to the journal, even if it's not a high score"""
         try:
-            # Add the score to history with timestamp
-            entry = {
-                'score': score,
-                'date': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Initialize history if needed
-            if not hasattr(self, 'score_history') or self.score_history is None:
-                self.score_history = []
-                
-            self.score_history.append(entry)
-            
-            # Keep only the top 10 scores in history
-            self.score_history.sort(key=lambda x: x['score'], reverse=True)
-            self.score_history = self.score_history[:10]
-            
-            # Also update high score if needed
-            if score > self.high_score:
-                self.high_score = score
-                
-            # Write data to file
-            data = {
-                'high_score': self.high_score,
-                'score_history': self.score_history,
-                'last_played': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(self.file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            with open(self.file_path, 'w') as file:
-                json.dump(data, file, indent=2)
-                
-            # Create a backup after successful save
-            self.create_backup()
+            played_at = time.time()
+            entry = self._entry(score, played_at)
+            if self._record_score(entry):
+                self.score_history = self._sorted_top_scores()
+            self._append(GAME, score, played_at)
             return True
         except Exception as e:
             print(f"Error saving score: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def flush(self, timeout=None):
+        """Wait until every save requested so far is on disk. Returns False
+        if timeout seconds pass first"""
+        with self.write_lock:
+            target = self.saves_requested
+            return self.write_lock.wait_for(lambda: self.saves_written >= target, timeout)
+
+    def _append(self, kind, score, played_at):
+        """Queue a journal record for the writer thread, and a compaction
+        every `compact_every` records"""
+        data = JOURNAL_ENTRY.pack(kind, score, played_at)
+        record = data + struct.pack("<I", zlib.crc32(data))
+        with self.write_lock:
+            self.pending_records.append(record)
+            self.saves_requested += 1
+            self.write_lock.notify_all()
+        self.journal_records += 1
+
+        # Fold the journal into the snapshot every so often
+        if self.journal_records - self.compacted_records >= self.compact_every:
+            self._queue_snapshot()
+
+    def _entry(self, score, played_at):
+        return {
+            'score': score,
+            'date': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(played_at))
+        }
+
+    def _record_score(self, entry):
+        """Count a game towards the high score and top scores, returning
+        True if it made the top scores"""
+        self.high_score = max(self.high_score, entry['score'])
+        return self._push_top_score(entry)
+
+    def _push_top_score(self, entry):
+        item = (entry['score'], -self.order, entry)
+        self.order += 1
+        if len(self.top_scores) < self.top_k:
+            heapq.heappush(self.top_scores, item)
+            return True
+        if item[:2] > self.top_scores[0][:2]:
+            heapq.heapreplace(self.top_scores, item)
+            return True
+        return False
+
+    def _sorted_top_scores(self):
+        return [entry for _, _, entry in sorted(self.top_scores, key=lambda item: item[:2], reverse=True)]
+
+    def _queue_snapshot(self):
+        """Queue a compaction of the current state into the JSON snapshot"""
+        self.compacted_records = self.journal_records
+        with self.write_lock:
+            self.pending_snapshot = {
+                'high_score': self.high_score,
+                'score_history': list(self.score_history),
+                'journal_records': self.journal_records,
+                'last_played': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self.saves_requested += 1
+            self.write_lock.notify_all()
+
+    def _write_loop(self):
+        while True:
+            with self.write_lock:
+                self.write_lock.wait_for(lambda: self.pending_records or self.pending_snapshot is not None
+                                         or self.pending_reset)
+                records, self.pending_records = self.pending_records, []
+                snapshot, self.pending_snapshot = self.pending_snapshot, None
+                reset, self.pending_reset = self.pending_reset, False
+                target = self.saves_requested
+
+            try:
+                # Create directory if it doesn't exist
+                directory = os.path.dirname(self.file_path)
+                if directory and not os.path.exists(directory):
+                    os.makedirs(directory)
+                # Journal first, so a snapshot never covers records not on disk
+                if reset or records:
+                    with open(self.journal_path, 'wb' if reset else 'ab') as file:
+                        file.write(b"".join(records))
+                        file.flush()
+                        os.fsync(file.fileno())
+                if snapshot is not None:
+                    content = json.dumps(snapshot, indent=2)
+                    self._write_atomic(self.file_path, content)
+                    # Keep a backup of the last good snapshot
+                    self._write_atomic(f"{self.file_path}.bak", content)
+            except Exception as e:
+                print(f"Error saving scores: {e}")
+
+            with self.write_lock:
+                self.saves_written = target
+                self.write_lock.notify_all()
+
+    def _write_atomic(self, path, content):
+        """Replace path with content through an fsynced temp file"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
@@ -0,0 +1,156 @@
+from .clock import GameClock
+from .jump import JumpPhysics
+from .obstacles import ObstacleField
+from .masks import DinoMasks
+import random
+
+JUMP_PRESS = "jump_press"
+JUMP_RELEASE = "jump_release"
+COLLISION_MODES = ("swept", "discrete", "precise")
+
+def new_seed():
+    """Pick a fresh 32-bit game seed"""
+    return random.getrandbits(32)
+
+def derive_rng(seed, stream):
+    """Return an independent Random for one part of a seeded game, so
+    cosmetic randomness never shifts the obstacle sequence"""
+    return random.Random(f"{seed}:{stream}")
+
+class Simulation:
+    """Headless core of the game.
+
+    Owns the obstacles (with their GameSpeed), the dinosaur's jump physics
+    and the score, and advances them one tick at a time with step(). It
+    never draws, so bots, balance tests and CI can run it without a window;
+    the GLUT front end passes in a drawable MovingObstacles and renders
+    the shared state.
+
+    Every game is seeded: the obstacles draw from their own Random, seeded
+    by reset(), so a seed plus the tick-stamped inputs reproduces a game
+    exactly. An optional recorder (see logics.replay) is told every input.
+    """
+    def __init__(self, clock=None, obstacles=None, swept_collision=False, precise_collision=False,
+                 seed=None, recorder=None):
+        self.clock = clock if clock is not None else GameClock(manual=True)
+        self.obstacles = obstacles if obstacles is not None else ObstacleField(self.clock)
+        self.jump_physics = JumpPhysics(self.clock)
+        self.dino_x = 150  # Matches the Dinosaur's base x position
+        self.dino_y = self.jump_physics.base_y
+        self.speed = self.obstacles.speed_controller.get_speed()
+        self.swept_collision = swept_collision  # Test the whole tick, not just its end
+        # Test the drawn pixels of the dinosaur pose and obstacles instead of hitboxes
+        self.dino_masks = DinoMasks() if precise_collision else None
+        self.run_time = 0.0  # Position in the run cycle, as Dinosaur animates it
+        self.run_period = 0.3
+        self.ticks = 0
+        self.game_over = False
+        self.collided_with = None  # Obstacle that ended the game
+        self.impact_time = None  # Fraction of the last tick at which it hit
+        self.recorder = recorder
+        self.seed = None
+        self.reset(seed)
+
+    @property
+    def collision_mode(self):
+        """Name of the collision test in use, one of COLLISION_MODES"""
+        if self.dino_masks is not None:
+            return "precise"
+        return "swept" if self.swept_collision else "discrete"
+
+    @property
+    def score(self):
+        """Number of obstacles cleared so far"""
+        return self.obstacles.num_triangles_touched
+
+    def step(self, dt, inputs=()):
+        """Apply inputs (JUMP_PRESS / JUMP_RELEASE), then advance the game by
+        dt seconds. Returns False once the dinosaur has collided"""
+        if self.game_over:
+            return False
+
+        if self.recorder is not None:
+            self.recorder.begin_tick(self)
+        for action in inputs:
+            if self.recorder is not None:
+                self.recorder.record(self.ticks, action)
+            if action == JUMP_PRESS:
+                self.jump_physics.jump_press()
+            elif action == JUMP_RELEASE:
+                self.jump_physics.jump_release()
+
+        self.clock.step(dt)
+        self.speed = self.obstacles.update()
+        prev_dino_y = self.dino_y
+        self.dino_y, jump_progress, is_jumping = self.jump_physics.update(dt)
+        if not is_jumping:
+            self.run_time += dt
+            if self.run_time > self.run_period:
+                self.run_time -= self.run_period
+        self.ticks += 1
+
+        if self.dino_masks is not None:
+            if is_jumping:
+                mask = self.dino_masks.jumping(jump_progress)
+            else:
+                mask = self.dino_masks.running(self.run_time / self.run_period)
+            self.collided_with = self.obstacles.find_mask_collision(mask, self.dino_x, self.dino_y)
+            self.impact_time = 1.0 if self.collided_with is not None else None
+        elif self.swept_collision:
+            hit = self.obstacles.sweep_collision(self.dino_x, prev_dino_y, self.dino_y)
+            if hit is not None:
+                self.collided_with, self.impact_time = hit
+        else:
+            self.collided_with = self.obstacles.find_collision(self.dino_x, self.dino_y)
+            self.impact_time = 1.0 if self.collided_with is not None else None
+        if self.collided_with is not None:
+            self.game_over = True
+        return not self.game_over
+
+    def snapshot(self):
+        """Return the full state of a running game as plain values"""
+        jump = self.jump_physics
+        return {
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "clock": (self.clock.now, self.clock.dt),
+            "dino_y": self.dino_y,
+            "speed": self.speed,
+            "run_time": self.run_time,
+            "jump": (jump.is_jumping, jump.jump_start_time, jump.jump_pressed,
+                     jump.current_y, jump.jump_progress),
+            "obstacles": self.obstacles.snapshot(),
+        }
+
+    def restore(self, state):
+        """Continue from a state taken with snapshot(); stepping on from it
+        plays out exactly as the original game did"""
+        jump = self.jump_physics
+        self.seed = state["seed"]
+        self.ticks = state["ticks"]
+        self.clock.now, self.clock.dt = state["clock"]
+        self.dino_y = state["dino_y"]
+        self.speed = state["speed"]
+        self.run_time = state["run_time"]
+        (jump.is_jumping, jump.jump_start_time, jump.jump_pressed,
+         jump.current_y, jump.jump_progress) = state["jump"]
+        self.obstacles.restore(state["obstacles"])
+        self.game_over = False
+        self.collided_with = None
+        self.impact_time = None
+
+    def reset(self, seed=None):
+        """Start a new game from seed, or a fresh seed, keeping the same
+        clock and obstacle objects"""
+        self.seed = seed if seed is not None else new_seed()
+        self.obstacles.rng.seed(self.seed)
+        self.clock.reset()
+        self.obstacles.reset()
+        self.jump_physics.__init__(self.clock)
+        self.dino_y = self.jump_physics.base_y
+        self.speed = self.obstacles.speed_controller.get_speed()
+        self.run_time = 0.0
+        self.ticks = 0
+        self.game_over = False
+        self.collided_with = None
+        self.impact_time = None
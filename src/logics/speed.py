@@ -1,23 +1,20 @@
-import time
+REFERENCE_FPS = 60  # Speeds are in pixels per frame at this frame rate
 
 class GameSpeed:
-    def __init__(self):
+    def __init__(self, clock):
+        self.clock = clock  # Simulation GameClock
         self.base_speed = 2.0  # Starting speed (pixels per frame)
         self.current_speed = self.base_speed
         self.max_speed = 10.0  # Maximum speed cap
         self.acceleration_rate = 0.05  # Speed increase per second
-        self.start_time = time.time()
-        self.last_update_time = self.start_time
+        self.start_time = clock.now
         self.elapsed_time = 0
         self.score = 0
         self.score_multiplier = 0.05  # Score increment per frame
         
     def update(self, delta_time):
-        """Update game speed based on elapsed time"""
-        current_time = time.time()
-        self.elapsed_time = current_time - self.start_time
-        frame_time = current_time - self.last_update_time
-        self.last_update_time = current_time
+        """Update game speed based on elapsed simulation time"""
+        self.elapsed_time = self.clock.now - self.start_time
         
         # Gradually increase speed based on elapsed time
         # The speed will grow faster at the beginning and slow down as it approaches max_speed
@@ -25,11 +22,11 @@ class GameSpeed:
         self.current_speed = self.base_speed + (self.max_speed - self.base_speed) * time_factor
         
         # Alternative: Linear acceleration
-        # self.current_speed += self.acceleration_rate * frame_time
+        # self.current_speed += self.acceleration_rate * delta_time
         # self.current_speed = min(self.current_speed, self.max_speed)
         
         # Increase score based on speed
-        self.score += self.current_speed * self.score_multiplier
+        self.score += self.current_speed * self.score_multiplier * delta_time * REFERENCE_FPS
         
         return self.current_speed
     
@@ -44,7 +41,6 @@ class GameSpeed:
     def reset(self):
         """Reset the game speed and timer"""
         self.current_speed = self.base_speed
-        self.start_time = time.time()
-        self.last_update_time = self.start_time
+        self.start_time = self.clock.now
         self.elapsed_time = 0
         self.score = 0
\ No newline at end of file
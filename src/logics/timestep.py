@@ -0,0 +1,27 @@
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation
+    ticks, keeping the leftover time for the next frame and for render
+    interpolation"""
+    def __init__(self, tick_rate=60, max_steps=8):
+        self.dt = 1.0 / tick_rate  # Seconds per simulation tick
+        self.max_steps = max_steps  # Ticks allowed per frame before time is dropped
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Add a frame's elapsed time and return how many ticks to run"""
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Too far behind to catch up (e.g. window dragged), drop the excess
+            steps = self.max_steps
+            self.accumulator = self.dt * steps
+        self.accumulator -= steps * self.dt
+        return steps
+
+    def alpha(self):
+        """Return how far (0 to 1) the render time is between the last two ticks"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        """Forget any accumulated time"""
+        self.accumulator = 0.0
@@ -1,55 +1,84 @@
-from OpenGL.GL import *
 from OpenGL.GLUT import *
-from OpenGL.GLU import *
+from render.renderer import gl, use_renderer, TIMES_ROMAN_24
+from render.opengl_renderer import OpenGLRenderer
 from shapes.dinosaur import Dinosaur
 from shapes.obstacles import MovingObstacles
+from shapes.line import Line, LineBatch
 from scene.scene import Scene
 from scene.intro import IntroScene
 from utils.utils import keyboard, keyboardUp, iterate
+from utils.text import bitmap_text
+from utils.scheduler import FrameScheduler
 from logics.score_manager import ScoreManager
-import time
+from logics.score_db import SQLiteScoreManager
+from logics.timestep import FixedTimestep
+from logics.clock import GameClock
+from logics.simulation import Simulation, JUMP_PRESS, JUMP_RELEASE, derive_rng
+from logics.replay import ReplayRecorder
+import os
 import sys
+import time
+
+TARGET_FPS = 60  # Frame rate while playing
+IDLE_FPS = 15  # Frame rate of the intro, pause and game over screens
+TICK_RATE = 60  # Simulation ticks per second, independent of the frame rate
+SWEPT_COLLISION = False  # Test hitboxes over the whole tick so fast obstacles can't skip past
+PRECISE_COLLISION = False  # Collide on drawn pixels rather than hitboxes
+REPLAY_DIR = None  # Directory to record a replay of every game into, or None
+SCORE_FILE = "high_score.json"  # JSON and journal score store, copied into SCORE_DB when it's created
+SCORE_DB = None  # SQLite database to keep scores in, or None for SCORE_FILE
+SCORES_PER_PAGE = 5  # Rows of the intro's high score table
 
 # Game state variables
-score_manager = ScoreManager()
-moving_obstacles = MovingObstacles()  
-dinosaur = Dinosaur()
-scene = Scene()
-intro_scene = IntroScene()
+clock = GameClock()  # Real time, sampled once per frame
+sim_clock = GameClock(manual=True)  # Simulation time, stepped once per tick
+score_manager = (SQLiteScoreManager(SCORE_DB, import_from=SCORE_FILE) if SCORE_DB
+                 else ScoreManager(SCORE_FILE))
+moving_obstacles = MovingObstacles(sim_clock)  
+simulation = Simulation(sim_clock, moving_obstacles, swept_collision=SWEPT_COLLISION,
+                        precise_collision=PRECISE_COLLISION)  # Game logic, drawn by the views below
+dinosaur = Dinosaur(sim_clock, simulation.jump_physics)
+pending_inputs = []  # Jump presses/releases for the next simulation tick
+scene = Scene(derive_rng(simulation.seed, "scene"))
+intro_scene = IntroScene(clock, derive_rng(simulation.seed, "intro"))
+line_batch = LineBatch()
+timestep = FixedTimestep(TICK_RATE)
 game_state = "intro"  # intro, playing, paused, game_over
 pause = False
 game_over = False
-last_frame_time = time.time()
 frame_time = 0
 current_score = 0
 mouse_x, mouse_y = 0, 0
+score_page = 0  # Page of the intro's high score table
+score_page_entries = None  # That page's scores and page count, fetched when needed
+score_page_saves = 0  # Saves the score manager had written when the page was fetched
 
 high_score = score_manager.get_high_score()
 intro_scene.set_high_score(high_score)
 
 
 def showScreen():
-    global pause, game_over, last_frame_time, frame_time, game_state, current_score, high_score
+    global frame_time
     
-    # Calculate frame time for smooth animation
-    current_time = time.time()
-    frame_time = current_time - last_frame_time
-    last_frame_time = current_time
+    gl.begin_frame()
+    
+    # Sample the clock once for the whole frame
+    frame_time = clock.tick()
     
     if game_state == "intro":
         # Draw intro screen
         intro_scene.update()
         intro_scene.draw(pause, current_score, scene.is_day)
         # Draw high score history
-        intro_scene.draw_high_scores(score_manager.get_score_history(), 600, 350)
+        drawHighScores()
     elif game_state == "game_over":
         # Draw game over screen
         intro_scene.update()
         intro_scene.draw_game_over(current_score, high_score, scene.is_day)
     else:
         # Main game rendering
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
+        gl.clear()
+        gl.load_identity()
         iterate(scene)
 
         # Draw background scene
@@ -57,61 +86,98 @@ def showScreen():
         
         # Update game state if not paused or game over
         if game_state == "playing":
-            # Update obstacle positions and speed
-            current_speed = moving_obstacles.update()
-            
-            # Update dinosaur animation and position
-            dinosaur.update(current_speed)
-            
-            # Update current score
-            current_score = moving_obstacles.num_triangles_touched
-            
-            # Check for collisions
-            try:
-                if moving_obstacles.detect_collision(dinosaur.x, dinosaur.y):
-                    game_state = "game_over"
-                    # Update high score
-                    high_score = max(high_score, current_score)
-                    intro_scene.set_high_score(high_score)
-                    # Save both the high score and the current score to history
-                    try:
-                        score_manager.save_score(current_score)
-                        
-                        # If this was a high score, save immediately
-                        if current_score >= high_score:
-                            score_manager.save_high_score(high_score, force=True)
-                    except Exception as e:
-                        print(f"Error saving score: {e}")
-            except Exception as e:
-                print(f"Error in collision detection: {e}")
+            # Step the simulation in fixed ticks so gameplay doesn't depend on frame rate
+            for _ in range(timestep.advance(frame_time)):
+                if not stepGame():
+                    break
         
-        # Draw game elements
-        moving_obstacles.draw()
-        dinosaur.draw()
+        # Draw game elements between the last two simulation ticks,
+        # batching the dinosaur's line work
+        alpha = timestep.alpha()
+        moving_obstacles.draw(alpha)
+        Line.begin_batch(line_batch)
+        dinosaur.draw(alpha)
+        Line.end_batch()
         
         # Display score
         displayScore()
 
+    gl.end_frame()
     glutSwapBuffers()
+    
+    # Collisions can end the game mid-frame, so re-pick the pacing here
+    frame_scheduler.set_active(game_state == "playing")
+
+
+def stepGame():
+    """Advance the game by one simulation tick, returning False once it ends"""
+    global game_state, current_score, high_score, score_page_entries
+    
+    # Advance obstacles, speed and jump physics, then the dinosaur's animation
+    alive = simulation.step(timestep.dt, pending_inputs)
+    pending_inputs.clear()
+    dinosaur.update(simulation.speed)
+    
+    # Update current score
+    current_score = simulation.score
+    if alive:
+        return True
+    
+    game_state = "game_over"
+    finishRecording()
+    # Update high score
+    high_score = max(high_score, current_score)
+    intro_scene.set_high_score(high_score)
+    # Save both the high score and the current score to history
+    score_page_entries = None  # Refetch the high score table
+    try:
+        score_manager.save_score(current_score)
+        
+        # If this was a high score, save immediately
+        if current_score >= high_score:
+            score_manager.save_high_score(high_score, force=True)
+    except Exception as e:
+        print(f"Error saving score: {e}")
+    return False
+
+
+def drawHighScores():
+    """Draw the intro's current page of high scores, fetching it only
+    after the page changes or the score writer finishes a save. Fetching
+    never waits for the writer, so a page may briefly miss a queued game"""
+    global score_page, score_page_entries, score_page_saves
+    if score_page_entries is None or score_page_saves != score_manager.saves_written:
+        score_page_saves = score_manager.saves_written
+        score_page_entries = score_manager.get_score_page(score_page, SCORES_PER_PAGE)
+    entries, page_count = score_page_entries
+    score_page = min(score_page, page_count - 1)
+    intro_scene.draw_high_scores(entries, 600, 350, score_page, page_count, SCORES_PER_PAGE)
+
+
+def scheduleRedraw():
+    """Match frame pacing to the game state and redraw after input"""
+    frame_scheduler.set_active(game_state == "playing")
+    frame_scheduler.request_redraw()
 
 
 def displayScore():
     """Display the score on the screen."""
-    glColor3f(1.0, 0.0, 0.0)
-    glRasterPos2f(600, 450)  # Position for the score display
-    score_text = f"Score: {moving_obstacles.num_triangles_touched}" 
-    for char in score_text:
-        glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+    gl.color(1.0, 0.0, 0.0)
+    score_text = f"Score: {simulation.score}" 
+    bitmap_text.draw(score_text, 600, 450, TIMES_ROMAN_24)
     
     # Also display high score
-    glRasterPos2f(400, 450)
     high_score_text = f"High: {high_score}"
-    for char in high_score_text:
-        glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+    bitmap_text.draw(high_score_text, 400, 450, TIMES_ROMAN_24)
 
 
 def keyboardHandler(key, x, y):
-    global game_state, pause, game_over, current_score
+    handleKey(key)
+    scheduleRedraw()
+
+
+def handleKey(key):
+    global game_state, pause, score_page, score_page_entries
     
     # Handle quit key (Q)
     if key == b'q':
@@ -123,18 +189,22 @@ def keyboardHandler(key, x, y):
         if key == b' ':  # Space to start
             if pause:
                 # Resume the game if paused
-                game_state = "playing"
-                pause = False
+                resumeGame()
             else:
                 # Start a new game
                 resetGame()
                 game_state = "playing"
         elif key == b'1' and pause:  # 1 to resume
-            game_state = "playing"
-            pause = False
+            resumeGame()
         elif key == b'2' and pause:  # 2 to start new
             resetGame()
             game_state = "playing"
+        elif key in (b',', b'<') and score_page > 0:  # Previous page of high scores
+            score_page -= 1
+            score_page_entries = None
+        elif key in (b'.', b'>'):  # Next page of high scores
+            score_page += 1
+            score_page_entries = None
         return
     
     # Handle game over state
@@ -146,45 +216,47 @@ def keyboardHandler(key, x, y):
         except Exception as e:
             print(f"Error drawing game over screen: {e}")
             # Fallback to a simple game over message
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            glColor3f(1.0, 0.0, 0.0)
-            glRasterPos2f(350, 250)
-            for char in "GAME OVER":
-                glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+            gl.clear()
+            gl.color(1.0, 0.0, 0.0)
+            bitmap_text.draw("GAME OVER", 350, 250, TIMES_ROMAN_24)
     
     # Handle pause toggle
     if key == b'\x1b':  # Escape key
         if game_state == "playing":
             game_state = "paused"
             pause = True
+            sim_clock.pause()
             intro_scene.set_high_score(high_score)  # Update high score in intro
             # Show the intro screen with pause menu
             game_state = "intro"
             return
         elif game_state == "paused":
-            game_state = "playing"
-            pause = False
+            resumeGame()
             return
     
     # Normal gameplay keys
     if game_state == "playing":
         if key == b' ':  # Space to jump
-            dinosaur.jump_press()
+            pending_inputs.append(JUMP_PRESS)
         elif key == b'd':  # D for day/night
             scene.toggle_day_night()
 
 
 def keyboardUpHandler(key, x, y):
     if game_state == "playing" and key == b' ':
-        dinosaur.jump_release()
+        pending_inputs.append(JUMP_RELEASE)
 
 
 def mouseHandler(button, state, x, y):
-    global game_state, pause
-    
     # Only process left mouse button clicks
     if button != GLUT_LEFT_BUTTON or state != GLUT_DOWN:
         return
+    handleClick(x, y)
+    scheduleRedraw()
+
+
+def handleClick(x, y):
+    global game_state
         
     # Check for button clicks in intro screen
     if game_state == "intro":
@@ -192,8 +264,7 @@ def mouseHandler(button, state, x, y):
         if action == "start":
             if pause:
                 # Resume the game if paused
-                game_state = "playing"
-                pause = False
+                resumeGame()
             else:
                 # Start a new game
                 resetGame()
@@ -216,30 +287,71 @@ def passiveMouseMotionHandler(x, y):
     # Check for hover in intro screen
     if game_state == "intro" or game_state == "game_over":
         intro_scene.check_button_hover(x, y)
+        frame_scheduler.request_redraw()
+
+
+def resumeGame():
+    """Resume a paused game without simulating the time spent paused"""
+    global game_state, pause
+    game_state = "playing"
+    pause = False
+    sim_clock.resume()
+    timestep.reset()
 
 
 def resetGame():
     """Reset the game state."""
     global game_state, pause, game_over, current_score
-    moving_obstacles.reset()
-    scene.__init__()  # Reset scene
-    dinosaur.__init__()  # Reset dinosaur
+    finishRecording()  # Close any abandoned game's replay before it's reset
+    simulation.reset()  # New game with a fresh seed
+    timestep.reset()
+    pending_inputs.clear()
+    scene.reset(derive_rng(simulation.seed, "scene"))  # Reset scene
+    startRecording()
+    dinosaur.__init__(sim_clock, simulation.jump_physics)  # Reset dinosaur
     game_state = "playing"
     game_over = False
     pause = False
     current_score = 0
 
 
+def startRecording():
+    """Record the new game to REPLAY_DIR if replays are enabled. The last
+    game's replay must already be finished"""
+    if REPLAY_DIR is None:
+        return
+    try:
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{simulation.seed}.dreplay"
+        simulation.recorder = ReplayRecorder(os.path.join(REPLAY_DIR, name), simulation.seed,
+                                             TICK_RATE, simulation.collision_mode)
+    except OSError as e:
+        print(f"Error starting replay recording: {e}")
+
+
+def finishRecording(wait=False):
+    """Close the current game's replay, if one is being recorded. The
+    writer thread finishes the file in the background unless wait is set"""
+    if simulation.recorder is not None:
+        simulation.recorder.finish(simulation, wait)
+        simulation.recorder = None
+
+
 def closeHandler():
     """Save high score when window is closed"""
+    finishRecording(wait=True)
     # Always save the high score when closing
     score_manager.save_high_score(high_score, force=True)
     
     # If we're in the middle of a game, save that score too
     if game_state == "playing" and current_score > 0:
         score_manager.save_score(current_score)
-        
-    print("Game closed. High scores saved.")
+    
+    # Give the background writer a moment to get the scores to disk
+    if score_manager.flush(timeout=2.0):
+        print("Game closed. High scores saved.")
+    else:
+        print("Game closed. Timed out saving high scores.")
 
 
 # OpenGL initialization
@@ -248,12 +360,15 @@ glutInitDisplayMode(GLUT_RGBA)
 glutInitWindowSize(800, 500)  # window size
 glutInitWindowPosition(250, 150)
 wind = glutCreateWindow(b"T-Rex Dino Runner")  # window name
-glClearColor(0.529, 0.808, 0.922, 1.0)  # Set default clear color to light blue
+use_renderer(OpenGLRenderer())  # Draw through PyOpenGL now that a context exists
+gl.clear_color(0.529, 0.808, 0.922, 1.0)  # Set default clear color to light blue
 glutDisplayFunc(showScreen)
 glutKeyboardFunc(keyboardHandler)
 glutKeyboardUpFunc(keyboardUpHandler)
 glutMouseFunc(mouseHandler)
 glutPassiveMotionFunc(passiveMouseMotionHandler)
-glutIdleFunc(showScreen)
 glutCloseFunc(closeHandler)  # Register close handler
+# Redraw on timers rather than from an idle callback that spins a core
+frame_scheduler = FrameScheduler(glutTimerFunc, glutPostRedisplay, TARGET_FPS, IDLE_FPS)
+frame_scheduler.start(active=game_state == "playing")
 glutMainLoop()
\ No newline at end of file
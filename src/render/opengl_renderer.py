@@ -0,0 +1,102 @@
+from OpenGL.GL import *
+from OpenGL.GLUT import *
+from .renderer import Renderer, HELVETICA_12, HELVETICA_18, TIMES_ROMAN_24
+
+class OpenGLRenderer(Renderer):
+    """Backend that draws through PyOpenGL into the current GLUT window"""
+    def __init__(self):
+        self.fonts = {
+            HELVETICA_12: GLUT_BITMAP_HELVETICA_12,
+            HELVETICA_18: GLUT_BITMAP_HELVETICA_18,
+            TIMES_ROMAN_24: GLUT_BITMAP_TIMES_ROMAN_24
+        }
+
+    def set_ortho(self, width, height):
+        glViewport(0, 0, width, height)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        glOrtho(0.0, width, 0.0, height, 0.0, 1.0)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+
+    def clear_color(self, r, g, b, a=1.0):
+        glClearColor(r, g, b, a)
+
+    def clear(self):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+    def load_identity(self):
+        glLoadIdentity()
+
+    def push_matrix(self):
+        glPushMatrix()
+
+    def pop_matrix(self):
+        glPopMatrix()
+
+    def translate(self, x, y):
+        glTranslatef(x, y, 0)
+
+    def rotate(self, angle):
+        glRotatef(angle, 0, 0, 1)
+
+    def color(self, r, g, b):
+        glColor3f(r, g, b)
+
+    def line_width(self, width):
+        glLineWidth(width)
+
+    def point_size(self, size):
+        glPointSize(size)
+
+    def push_attrib(self):
+        glPushAttrib(GL_CURRENT_BIT | GL_LINE_BIT | GL_POINT_BIT)
+
+    def pop_attrib(self):
+        glPopAttrib()
+
+    def begin(self, mode):
+        glBegin(mode)
+
+    def vertex(self, x, y):
+        glVertex2f(x, y)
+
+    def end(self):
+        glEnd()
+
+    def draw_array(self, mode, vertices, x=0, y=0, first=0, count=None):
+        if count is None:
+            count = len(vertices) - first
+        if count <= 0:
+            return
+        glPushMatrix()
+        glTranslatef(x, y, 0)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, vertices)
+        glDrawArrays(mode, first, count)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glPopMatrix()
+
+    def gen_lists(self, count):
+        return glGenLists(count)
+
+    def new_list(self, list_id, execute=False):
+        glNewList(list_id, GL_COMPILE_AND_EXECUTE if execute else GL_COMPILE)
+
+    def end_list(self):
+        glEndList()
+
+    def call_list(self, list_id):
+        glCallList(list_id)
+
+    def delete_lists(self, list_id, count):
+        glDeleteLists(list_id, count)
+
+    def raster_pos(self, x, y):
+        glRasterPos2f(x, y)
+
+    def bitmap_character(self, font, code):
+        glutBitmapCharacter(self.fonts[font], code)
+
+    def bitmap_width(self, font, code):
+        return glutBitmapWidth(self.fonts[font], code)
@@ -0,0 +1,148 @@
+from collections import Counter
+from .renderer import Renderer
+
+class FrameStats:
+    """Call, draw call and vertex counts for one frame"""
+    def __init__(self):
+        self.calls = Counter()  # Renderer method name -> number of calls
+        self.draw_calls = 0
+        self.vertices = 0
+
+    def total_calls(self):
+        """Return the number of renderer calls made"""
+        return sum(self.calls.values())
+
+class RecordingRenderer(Renderer):
+    """Backend that draws nothing but records, per frame, how many renderer
+    calls, draw calls and vertices the game submitted. Replaying a display
+    list counts as one draw call carrying the vertices compiled into it"""
+    def __init__(self, glyph_width=10):
+        self.glyph_width = glyph_width  # Fixed advance reported for every glyph
+        self.frames = []  # FrameStats of every finished frame
+        self.current = FrameStats()
+        self.list_contents = {}  # Display list id -> (draw_calls, vertices)
+        self.compiling = None  # [list_id, execute, draw_calls, vertices]
+        self.next_list_id = 1
+
+    def _call(self, name):
+        self.current.calls[name] += 1
+
+    def _draw(self, draw_calls, vertices):
+        if self.compiling is not None:
+            self.compiling[2] += draw_calls
+            self.compiling[3] += vertices
+            if not self.compiling[1]:
+                return
+        self.current.draw_calls += draw_calls
+        self.current.vertices += vertices
+
+    def begin_frame(self):
+        self.current = FrameStats()
+
+    def end_frame(self):
+        self.frames.append(self.current)
+        self.current = FrameStats()
+
+    def summary(self):
+        """Return the average calls, draw calls and vertices per frame"""
+        count = max(len(self.frames), 1)
+        return {
+            'frames': len(self.frames),
+            'calls': sum(f.total_calls() for f in self.frames) / count,
+            'draw_calls': sum(f.draw_calls for f in self.frames) / count,
+            'vertices': sum(f.vertices for f in self.frames) / count
+        }
+
+    def set_ortho(self, width, height):
+        self._call('set_ortho')
+
+    def clear_color(self, r, g, b, a=1.0):
+        self._call('clear_color')
+
+    def clear(self):
+        self._call('clear')
+
+    def load_identity(self):
+        self._call('load_identity')
+
+    def push_matrix(self):
+        self._call('push_matrix')
+
+    def pop_matrix(self):
+        self._call('pop_matrix')
+
+    def translate(self, x, y):
+        self._call('translate')
+
+    def rotate(self, angle):
+        self._call('rotate')
+
+    def color(self, r, g, b):
+        self._call('color')
+
+    def line_width(self, width):
+        self._call('line_width')
+
+    def point_size(self, size):
+        self._call('point_size')
+
+    def push_attrib(self):
+        self._call('push_attrib')
+
+    def pop_attrib(self):
+        self._call('pop_attrib')
+
+    def begin(self, mode):
+        self._call('begin')
+
+    def vertex(self, x, y):
+        self._call('vertex')
+        self._draw(0, 1)
+
+    def end(self):
+        self._call('end')
+        self._draw(1, 0)
+
+    def draw_array(self, mode, vertices, x=0, y=0, first=0, count=None):
+        self._call('draw_array')
+        if count is None:
+            count = len(vertices) - first
+        if count > 0:
+            self._draw(1, count)
+
+    def gen_lists(self, count):
+        self._call('gen_lists')
+        list_id = self.next_list_id
+        self.next_list_id += count
+        return list_id
+
+    def new_list(self, list_id, execute=False):
+        self._call('new_list')
+        self.compiling = [list_id, execute, 0, 0]
+
+    def end_list(self):
+        self._call('end_list')
+        list_id, _, draw_calls, vertices = self.compiling
+        self.list_contents[list_id] = (draw_calls, vertices)
+        self.compiling = None
+
+    def call_list(self, list_id):
+        self._call('call_list')
+        _, vertices = self.list_contents.get(list_id, (0, 0))
+        self._draw(1, vertices)
+
+    def delete_lists(self, list_id, count):
+        self._call('delete_lists')
+        for i in range(list_id, list_id + count):
+            self.list_contents.pop(i, None)
+
+    def raster_pos(self, x, y):
+        self._call('raster_pos')
+
+    def bitmap_character(self, font, code):
+        self._call('bitmap_character')
+        self._draw(1, 0)
+
+    def bitmap_width(self, font, code):
+        self._call('bitmap_width')
+        return self.glyph_width
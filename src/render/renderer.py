@@ -0,0 +1,142 @@
+"""Render backend interface that the shapes and scenes draw through.
+
+Drawing code calls the module-level `gl` object, which forwards to the
+backend picked with use_renderer: OpenGLRenderer for the real game,
+NullRenderer or RecordingRenderer for headless runs and benchmarks.
+"""
+
+# Primitive modes, numerically equal to the OpenGL enums
+POINTS = 0x0000
+LINES = 0x0001
+LINE_LOOP = 0x0002
+TRIANGLES = 0x0004
+QUADS = 0x0007
+POLYGON = 0x0009
+
+# Bitmap fonts
+HELVETICA_12 = "helvetica_12"
+HELVETICA_18 = "helvetica_18"
+TIMES_ROMAN_24 = "times_roman_24"
+
+class Renderer:
+    """Drawing API shared by every backend. The base implementation draws
+    nothing, so it doubles as the no-op backend"""
+    def begin_frame(self):
+        """Mark the start of a frame"""
+
+    def end_frame(self):
+        """Mark the end of a frame"""
+
+    # Frame and view state
+    def set_ortho(self, width, height):
+        """Map the viewport to an orthographic width x height canvas"""
+
+    def clear_color(self, r, g, b, a=1.0):
+        """Set the color used by clear"""
+
+    def clear(self):
+        """Clear the color and depth buffers"""
+
+    def load_identity(self):
+        """Reset the current matrix"""
+
+    def push_matrix(self):
+        """Save the current transform"""
+
+    def pop_matrix(self):
+        """Restore the last saved transform"""
+
+    def translate(self, x, y):
+        """Translate subsequent drawing by (x, y)"""
+
+    def rotate(self, angle):
+        """Rotate subsequent drawing by angle degrees around the z axis"""
+
+    # Primitive state
+    def color(self, r, g, b):
+        """Set the current color"""
+
+    def line_width(self, width):
+        """Set the line width"""
+
+    def point_size(self, size):
+        """Set the point size"""
+
+    def push_attrib(self):
+        """Save the current color, line width and point size"""
+
+    def pop_attrib(self):
+        """Restore the last saved color, line width and point size"""
+
+    # Immediate mode
+    def begin(self, mode):
+        """Start an immediate-mode primitive"""
+
+    def vertex(self, x, y):
+        """Emit a vertex of the current primitive"""
+
+    def end(self):
+        """Finish the current primitive"""
+
+    # Vertex arrays
+    def draw_array(self, mode, vertices, x=0, y=0, first=0, count=None):
+        """Draw an (N, 2) vertex array in one call, translated so its local
+        origin lands on (x, y). first/count select a contiguous range"""
+
+    # Display lists
+    def gen_lists(self, count):
+        """Reserve count consecutive display lists and return the first id"""
+        return 0
+
+    def new_list(self, list_id, execute=False):
+        """Start compiling a display list, also drawing it if execute is set"""
+
+    def end_list(self):
+        """Finish compiling the current display list"""
+
+    def call_list(self, list_id):
+        """Replay a compiled display list"""
+
+    def delete_lists(self, list_id, count):
+        """Free count display lists starting at list_id"""
+
+    # Bitmap text
+    def raster_pos(self, x, y):
+        """Move the raster position used by bitmap text"""
+
+    def bitmap_character(self, font, code):
+        """Draw one glyph at the raster position and advance it"""
+
+    def bitmap_width(self, font, code):
+        """Return the advance width of a glyph in pixels"""
+        return 0
+
+# Renderer methods forwarded by the gl proxy
+RENDERER_METHODS = [name for name in vars(Renderer) if not name.startswith('_')]
+
+class NullRenderer(Renderer):
+    """Backend that accepts every call and draws nothing"""
+
+class _ActiveRenderer:
+    """Forwards draw calls to the backend chosen with use_renderer. The
+    backend's bound methods are copied onto the proxy so forwarding adds
+    no per-call lookup"""
+    def __init__(self):
+        self.backend = None
+
+    def bind(self, backend):
+        self.backend = backend
+        for name in RENDERER_METHODS:
+            setattr(self, name, getattr(backend, name))
+
+gl = _ActiveRenderer()
+gl.bind(NullRenderer())
+
+def use_renderer(backend):
+    """Route all drawing through backend and return it"""
+    gl.bind(backend)
+    return backend
+
+def get_renderer():
+    """Return the active backend"""
+    return gl.backend
@@ -0,0 +1,42 @@
+"""Check recorded games still play out the same in the headless simulation.
+
+Usage: python replay.py FILE [FILE ...] [--seek TICK]
+
+Each replay's seed and inputs are fed through a fresh Simulation, and its
+score and final tick are compared with the ones recorded. With --seek,
+the game state at TICK is also restored from the nearest snapshot and
+printed.
+"""
+from logics.replay import ReplayReader, play_replay
+import argparse
+import sys
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify T-Rex Runner replays")
+    parser.add_argument("files", nargs="+", help="replay files written with REPLAY_DIR set")
+    parser.add_argument("--seek", type=int, default=None, help="show the game state at this tick")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.files:
+        with ReplayReader(path) as reader:
+            replay = reader.replay()
+            simulation = play_replay(replay)
+            ok = (simulation.score == replay.score and simulation.ticks == replay.ticks
+                  and simulation.game_over == replay.game_over)
+            failures += not ok
+            print(f"{path}: seed {replay.seed}, {len(replay.events)} inputs, "
+                  f"{len(reader.snapshot_ticks)} snapshots, "
+                  f"recorded score {replay.score} at tick {replay.ticks}, "
+                  f"replayed score {simulation.score} at tick {simulation.ticks} "
+                  f"{'ok' if ok else 'MISMATCH'}")
+
+            if args.seek is not None:
+                state = reader.seek(args.seek)
+                obstacles = ", ".join(f"{o.type} at {o.x:.0f}" for o in state.obstacles.obstacles)
+                print(f"  tick {state.ticks}: score {state.score}, dino y {state.dino_y:.1f}, "
+                      f"speed {state.speed:.2f}, obstacles: {obstacles}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
-from OpenGL.GL import *
-from OpenGL.GLUT import *
-import time
+from render.renderer import (gl, POINTS, LINES, LINE_LOOP, TRIANGLES, QUADS, POLYGON,
+                             HELVETICA_12, HELVETICA_18, TIMES_ROMAN_24)
+from shapes.vertex_array import to_vertex_array
+from utils.text import bitmap_text
+from .stars import StarField
 import math
 import random
 
 class IntroScene:
-    def __init__(self):
+    cloud_meshes = {}  # Cloud triangle mesh per integer size
+
+    def __init__(self, clock, rng=None):
+        self.clock = clock  # Real-time GameClock, ticked once per frame
+        self.rng = rng if rng is not None else random.Random()  # Clouds and stars
         self.title = "T-Rex Runner"
         self.instructions = [
             "Press SPACE to start",
@@ -15,18 +21,16 @@ class IntroScene:
         self.credits = "Created with OpenGL"
         self.high_score = 0
         self.animation_time = 0
-        self.last_update_time = time.time()
         self.show_buttons = True
         self.button_animation_period = 0.5  # Blinking period in seconds
         
         # Animation variables
-        self.clouds = [
-            {'x': random.randint(0, 800), 'y': random.randint(300, 450), 'speed': random.uniform(0.5, 2.0), 'size': random.uniform(10, 25)}
-            for _ in range(5)
-        ]
+        self.clouds = [self._spawn_cloud({}, self.rng.randint(0, 800)) for _ in range(5)]
         self.dino_jump_height = 0
         self.dino_jump_dir = 1
-        self.stars = [(random.uniform(0, 800), random.uniform(300, 500)) for _ in range(50)]
+        self.stars = StarField(50, (0, 800), (300, 500), point_size=2.0, twinkle_rate=0.5, duty=0.03,
+                               rng=self.rng)
+        self.star_time = 0  # Drives the star twinkle
         
         # Start button
         self.start_button = {
@@ -56,12 +60,11 @@ class IntroScene:
         
     def update(self):
         """Update animation timers"""
-        current_time = time.time()
-        delta_time = current_time - self.last_update_time
-        self.last_update_time = current_time
+        delta_time = self.clock.dt
         
         # Update button blink animation
         self.animation_time += delta_time
+        self.star_time += delta_time
         if self.animation_time > self.button_animation_period:
             self.animation_time -= self.button_animation_period
             self.show_buttons = not self.show_buttons
@@ -70,10 +73,7 @@ class IntroScene:
         for cloud in self.clouds:
             cloud['x'] -= cloud['speed'] * delta_time * 20
             if cloud['x'] < -50:
-                cloud['x'] = 850
-                cloud['y'] = random.randint(300, 450)
-                cloud['speed'] = random.uniform(0.5, 2.0)
-                cloud['size'] = random.uniform(10, 25)
+                self._spawn_cloud(cloud, 850)
         
         # Animate dinosaur bounce
         self.dino_jump_height += 0.5 * self.dino_jump_dir
@@ -122,58 +122,51 @@ class IntroScene:
     def draw(self, is_paused=False, current_score=0, is_day=True):
         """Draw the intro screen"""
         # Clear the screen
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        gl.clear()
         
         # Set background color - light blue for day, dark blue for night
         if is_day:
-            glClearColor(0.529, 0.808, 0.922, 1.0)  # Light blue sky
+            gl.clear_color(0.529, 0.808, 0.922, 1.0)  # Light blue sky
         else:
-            glClearColor(0.05, 0.05, 0.2, 1.0)  # Night sky
+            gl.clear_color(0.05, 0.05, 0.2, 1.0)  # Night sky
             
         # Force a clear with the new color
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        gl.clear()
             
         # Draw stars at night
         if not is_day:
-            glColor3f(1.0, 1.0, 1.0)
-            glPointSize(2.0)
-            glBegin(GL_POINTS)
-            for x, y in self.stars:
-                # Add twinkling effect
-                if random.random() > 0.97:
-                    glVertex2f(x, y)
-            glEnd()
-            glPointSize(1.0)
+            gl.color(1.0, 1.0, 1.0)
+            self.stars.draw(self.star_time)
         
         # Draw clouds
-        glColor3f(1.0, 1.0, 1.0)
+        gl.color(1.0, 1.0, 1.0)
         for cloud in self.clouds:
-            self._draw_cloud(cloud['x'], cloud['y'], cloud['size'])
+            self._draw_cloud(cloud)
         
         # Draw ground
-        glColor3f(0.133, 0.545, 0.133)  # Green ground
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(800, 0)
-        glVertex2f(800, 100)
-        glVertex2f(0, 100)
-        glEnd()
+        gl.color(0.133, 0.545, 0.133)  # Green ground
+        gl.begin(QUADS)
+        gl.vertex(0, 0)
+        gl.vertex(800, 0)
+        gl.vertex(800, 100)
+        gl.vertex(0, 100)
+        gl.end()
         
         # Draw title with shadow effect
-        glColor3f(0.0, 0.0, 0.0)  # Black shadow
+        gl.color(0.0, 0.0, 0.0)  # Black shadow
         self._draw_text(self.title, 403, 397, 30, center=True)
-        glColor3f(0.0, 0.8, 0.0)  # Green color
+        gl.color(0.0, 0.8, 0.0)  # Green color
         self._draw_text(self.title, 400, 400, 30, center=True)
         
         # Draw an animated dinosaur
         self._draw_dino_animated(400, 300 + self.dino_jump_height)
         
         # Draw scores
-        glColor3f(1.0, 0.0, 0.0)  # Red color
+        gl.color(1.0, 0.0, 0.0)  # Red color
         self._draw_text(f"High Score: {self.high_score}", 400, 250, 18, center=True)
         
         if is_paused:
-            glColor3f(1.0, 0.5, 0.0)  # Orange color
+            gl.color(1.0, 0.5, 0.0)  # Orange color
             self._draw_text(f"Current Score: {current_score}", 400, 220, 18, center=True)
             
             # Draw pause menu
@@ -198,71 +191,64 @@ class IntroScene:
             
             # Draw instructions
             if self.show_buttons:
-                glColor3f(0.0, 0.0, 0.0)  # Black text
+                gl.color(0.0, 0.0, 0.0)  # Black text
                 for i, instruction in enumerate(self.instructions):
                     self._draw_text(instruction, 400, 120 - i * 25, 14, center=True)
         
         # Draw credits at the bottom
-        glColor3f(0.0, 0.0, 0.0)  # Black text
+        gl.color(0.0, 0.0, 0.0)  # Black text
         self._draw_text(self.credits, 400, 20, 12, center=True)
     
     def draw_game_over(self, final_score, high_score, is_day=True):
         """Draw the game over screen with animations"""
         # Clear the screen
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        gl.clear()
         
         # Set background color - light blue for day, dark blue for night
         if is_day:
-            glClearColor(0.529, 0.808, 0.922, 1.0)  # Light blue sky
+            gl.clear_color(0.529, 0.808, 0.922, 1.0)  # Light blue sky
         else:
-            glClearColor(0.05, 0.05, 0.2, 1.0)  # Night sky
+            gl.clear_color(0.05, 0.05, 0.2, 1.0)  # Night sky
             
         # Force a clear with the new color
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        gl.clear()
             
         # Draw stars at night
         if not is_day:
-            glColor3f(1.0, 1.0, 1.0)
-            glPointSize(2.0)
-            glBegin(GL_POINTS)
-            for x, y in self.stars:
-                # Add twinkling effect
-                if random.random() > 0.97:
-                    glVertex2f(x, y)
-            glEnd()
-            glPointSize(1.0)
+            gl.color(1.0, 1.0, 1.0)
+            self.stars.draw(self.star_time)
         
         # Draw clouds
-        glColor3f(1.0, 1.0, 1.0)
+        gl.color(1.0, 1.0, 1.0)
         for cloud in self.clouds:
-            self._draw_cloud(cloud['x'], cloud['y'], cloud['size'])
+            self._draw_cloud(cloud)
         
         # Draw ground
-        glColor3f(0.133, 0.545, 0.133)  # Green ground
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(800, 0)
-        glVertex2f(800, 100)
-        glVertex2f(0, 100)
-        glEnd()
+        gl.color(0.133, 0.545, 0.133)  # Green ground
+        gl.begin(QUADS)
+        gl.vertex(0, 0)
+        gl.vertex(800, 0)
+        gl.vertex(800, 100)
+        gl.vertex(0, 100)
+        gl.end()
         
         # Draw a fallen dinosaur
         self._draw_dino_fallen(400, 120)
         
         # Draw game over text with animation
         pulse_scale = 1.0 + 0.1 * math.sin(self.start_button['pulse'] * 2)
-        glColor3f(1.0, 0.0, 0.0)  # Red color
+        gl.color(1.0, 0.0, 0.0)  # Red color
         self._draw_text("GAME OVER", 400, 350, int(30 * pulse_scale), center=True)
         
         # Draw score information
-        glColor3f(0.0, 0.0, 0.0)  # Black color
+        gl.color(0.0, 0.0, 0.0)  # Black color
         self._draw_text(f"Your Score: {final_score}", 400, 300, 20, center=True)
-        glColor3f(1.0, 0.7, 0.0)  # Gold color
+        gl.color(1.0, 0.7, 0.0)  # Gold color
         self._draw_text(f"High Score: {high_score}", 400, 270, 20, center=True)
         
         # Check if this was a new high score
         if final_score >= high_score and final_score > 0:
-            glColor3f(1.0, 0.8, 0.0)  # Bright gold
+            gl.color(1.0, 0.8, 0.0)  # Bright gold
             self._draw_text("NEW HIGH SCORE!", 400, 240, 22, center=True)
         
         # Draw action buttons with proper hover state
@@ -286,109 +272,111 @@ class IntroScene:
         
     def _draw_text(self, text, x, y, size=18, center=False):
         """Draw text at specified position"""
-        if center:
-            text_width = 0
-            for c in text:
-                if size <= 12:
-                    text_width += glutBitmapWidth(GLUT_BITMAP_HELVETICA_12, ord(c))
-                elif size <= 16:
-                    text_width += glutBitmapWidth(GLUT_BITMAP_HELVETICA_18, ord(c))
-                else:
-                    text_width += glutBitmapWidth(GLUT_BITMAP_TIMES_ROMAN_24, ord(c))
-            x = x - text_width // 2
-        
-        glRasterPos2f(x, y)
-        
-        for c in text:
-            if size <= 12:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(c))
-            elif size <= 16:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(c))
-            else:
-                glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(c))
+        if size <= 12:
+            font = HELVETICA_12
+        elif size <= 16:
+            font = HELVETICA_18
+        else:
+            font = TIMES_ROMAN_24
+        bitmap_text.draw(text, x, y, font, center)
     
     def _draw_button(self, x, y, width, height, text, hover=False):
         """Draw an interactive button"""
         # Button background
         if hover:
-            glColor3f(0.0, 0.7, 0.0)  # Bright green when hovered
+            gl.color(0.0, 0.7, 0.0)  # Bright green when hovered
         else:
-            glColor3f(0.0, 0.5, 0.0)  # Dark green normally
+            gl.color(0.0, 0.5, 0.0)  # Dark green normally
             
-        glBegin(GL_QUADS)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
+        gl.begin(QUADS)
+        gl.vertex(x, y)
+        gl.vertex(x + width, y)
+        gl.vertex(x + width, y + height)
+        gl.vertex(x, y + height)
+        gl.end()
         
         # Button border
-        glColor3f(0.0, 0.0, 0.0)
-        glLineWidth(2.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
-        glLineWidth(1.0)
+        gl.color(0.0, 0.0, 0.0)
+        gl.line_width(2.0)
+        gl.begin(LINE_LOOP)
+        gl.vertex(x, y)
+        gl.vertex(x + width, y)
+        gl.vertex(x + width, y + height)
+        gl.vertex(x, y + height)
+        gl.end()
+        gl.line_width(1.0)
         
         # Button text
-        glColor3f(1.0, 1.0, 1.0)  # White text
+        gl.color(1.0, 1.0, 1.0)  # White text
         text_size = 16
-        text_width = 0
-        for c in text:
-            text_width += glutBitmapWidth(GLUT_BITMAP_HELVETICA_18, ord(c))
+        text_width = bitmap_text.text_width(text, HELVETICA_18)
         
         text_x = x + (width - text_width) // 2
         text_y = y + (height - text_size) // 2 + 5
         
-        glRasterPos2f(text_x, text_y)
-        for c in text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(c))
+        bitmap_text.draw(text, text_x, text_y, HELVETICA_18)
     
-    def _draw_cloud(self, x, y, size):
-        """Draw a simple cloud"""
-        # Cloud made of overlapping circles
-        for i in range(3):
-            for r in range(int(size)):
-                rx = x + i * size
-                ry = y
-                # Draw circle using points
-                glBegin(GL_POLYGON)
-                for angle in range(0, 360, 10):
-                    rad = math.radians(angle)
-                    glVertex2f(rx + r * math.cos(rad), ry + r * math.sin(rad))
-                glEnd()
+    @staticmethod
+    def cloud_mesh(size):
+        """Return the triangle mesh of a cloud for an integer size bucket,
+        tessellating it on first use"""
+        mesh = IntroScene.cloud_meshes.get(size)
+        if mesh is None:
+            # Three overlapping discs, each a 36-sided fan split into triangles
+            radius = size - 1
+            rim = [(radius * math.cos(math.radians(angle)), radius * math.sin(math.radians(angle)))
+                   for angle in range(0, 360, 10)]
+            coords = []
+            for i in range(3):
+                cx = i * size
+                for j in range(len(rim)):
+                    (ax, ay), (bx, by) = rim[j], rim[(j + 1) % len(rim)]
+                    coords.extend([(cx, 0), (cx + ax, ay), (cx + bx, by)])
+            mesh = to_vertex_array(coords)
+            IntroScene.cloud_meshes[size] = mesh
+        return mesh
+
+    def _spawn_cloud(self, cloud, x):
+        """Place a cloud at x with a random height, speed and cached mesh"""
+        cloud['x'] = x
+        cloud['y'] = self.rng.randint(300, 450)
+        cloud['speed'] = self.rng.uniform(0.5, 2.0)
+        cloud['size'] = self.rng.randint(10, 25)
+        cloud['mesh'] = IntroScene.cloud_mesh(cloud['size'])
+        return cloud
+    
+    def _draw_cloud(self, cloud):
+        """Draw a cloud by translating its cached mesh"""
+        gl.draw_array(TRIANGLES, cloud['mesh'], cloud['x'], cloud['y'])
     
     def _draw_dino_animated(self, x, y):
         """Draw an animated dinosaur for the intro screen"""
         # Get a bobbing animation based on animation time
         bounce = 5 * math.sin(self.animation_time * 6)
         
-        glColor3f(0.0, 0.6, 0.0)  # Green color
+        gl.color(0.0, 0.6, 0.0)  # Green color
         
         # Draw dino body as a polygon
-        glBegin(GL_POLYGON)
-        glVertex2f(x - 40, y + 20)  # Head top
-        glVertex2f(x - 50, y)       # Back
-        glVertex2f(x - 30, y - 20)  # Tail
-        glVertex2f(x + 20, y - 20)  # Bottom
-        glVertex2f(x + 30, y)       # Front
-        glVertex2f(x + 10, y + 10)  # Head front
-        glEnd()
+        gl.begin(POLYGON)
+        gl.vertex(x - 40, y + 20)  # Head top
+        gl.vertex(x - 50, y)       # Back
+        gl.vertex(x - 30, y - 20)  # Tail
+        gl.vertex(x + 20, y - 20)  # Bottom
+        gl.vertex(x + 30, y)       # Front
+        gl.vertex(x + 10, y + 10)  # Head front
+        gl.end()
         
         # Draw legs with animation
-        glLineWidth(3.0)
-        glBegin(GL_LINES)
+        gl.line_width(3.0)
+        gl.begin(LINES)
         # Front leg
         leg_angle_front = 15 * math.sin(self.animation_time * 6)
         fx1 = x + 15
         fy1 = y - 20
         fx2 = fx1 + 15 * math.sin(math.radians(leg_angle_front))
         fy2 = fy1 - 20 * math.cos(math.radians(leg_angle_front))
-        glVertex2f(fx1, fy1)
-        glVertex2f(fx2, fy2)
+        gl.vertex(fx1, fy1)
+        gl.vertex(fx2, fy2)
         
         # Back leg
         leg_angle_back = -leg_angle_front
@@ -396,129 +384,140 @@ class IntroScene:
         by1 = y - 20
         bx2 = bx1 + 15 * math.sin(math.radians(leg_angle_back))
         by2 = by1 - 20 * math.cos(math.radians(leg_angle_back))
-        glVertex2f(bx1, by1)
-        glVertex2f(bx2, by2)
-        glEnd()
-        glLineWidth(1.0)
+        gl.vertex(bx1, by1)
+        gl.vertex(bx2, by2)
+        gl.end()
+        gl.line_width(1.0)
         
         # Draw eye
-        glPointSize(5.0)
-        glBegin(GL_POINTS)
-        glColor3f(1.0, 1.0, 1.0)  # White eye
-        glVertex2f(x + 15, y + 5)
-        glEnd()
+        gl.point_size(5.0)
+        gl.begin(POINTS)
+        gl.color(1.0, 1.0, 1.0)  # White eye
+        gl.vertex(x + 15, y + 5)
+        gl.end()
         
         # Draw blinking effect
-        if random.random() > 0.95:
-            glLineWidth(2.0)
-            glColor3f(0.0, 0.0, 0.0)
-            glBegin(GL_LINES)
-            glVertex2f(x + 10, y + 5)
-            glVertex2f(x + 20, y + 5)
-            glEnd()
-            glLineWidth(1.0)
+        if self.rng.random() > 0.95:
+            gl.line_width(2.0)
+            gl.color(0.0, 0.0, 0.0)
+            gl.begin(LINES)
+            gl.vertex(x + 10, y + 5)
+            gl.vertex(x + 20, y + 5)
+            gl.end()
+            gl.line_width(1.0)
         else:
-            glPointSize(3.0)
-            glBegin(GL_POINTS)
-            glColor3f(0.0, 0.0, 0.0)  # Black pupil
-            glVertex2f(x + 17, y + 5)
-            glEnd()
-        glPointSize(1.0)
+            gl.point_size(3.0)
+            gl.begin(POINTS)
+            gl.color(0.0, 0.0, 0.0)  # Black pupil
+            gl.vertex(x + 17, y + 5)
+            gl.end()
+        gl.point_size(1.0)
             
     # Update the _draw_dino_fallen method
 
     def _draw_dino_fallen(self, x, y):
         """Draw a fallen dinosaur for the game over screen"""
         try:
-            glColor3f(0.0, 0.6, 0.0)  # Green color
+            gl.color(0.0, 0.6, 0.0)  # Green color
             
             # Draw rotated dino body
-            glPushMatrix()
-            glTranslatef(x, y, 0)
-            glRotatef(-90, 0, 0, 1)  # Rotate 90 degrees
+            gl.push_matrix()
+            gl.translate(x, y)
+            gl.rotate(-90)  # Rotate 90 degrees
             
             # Body
-            glBegin(GL_POLYGON)
-            glVertex2f(-20, 40)  # Head top
-            glVertex2f(0, 50)    # Back
-            glVertex2f(20, 30)   # Tail
-            glVertex2f(20, -20)  # Bottom
-            glVertex2f(0, -30)   # Front
-            glVertex2f(-10, -10) # Head front
-            glEnd()
+            gl.begin(POLYGON)
+            gl.vertex(-20, 40)  # Head top
+            gl.vertex(0, 50)    # Back
+            gl.vertex(20, 30)   # Tail
+            gl.vertex(20, -20)  # Bottom
+            gl.vertex(0, -30)   # Front
+            gl.vertex(-10, -10) # Head front
+            gl.end()
             
             # Legs sticking up
-            glLineWidth(3.0)
-            glBegin(GL_LINES)
+            gl.line_width(3.0)
+            gl.begin(LINES)
             # Front leg
-            glVertex2f(-15, -20)
-            glVertex2f(-15, -40)
+            gl.vertex(-15, -20)
+            gl.vertex(-15, -40)
             # Back leg
-            glVertex2f(15, -10)
-            glVertex2f(15, -30)
-            glEnd()
-            glLineWidth(1.0)
+            gl.vertex(15, -10)
+            gl.vertex(15, -30)
+            gl.end()
+            gl.line_width(1.0)
             
             # X eyes for dead dino
-            glLineWidth(2.0)
-            glColor3f(1.0, 0.0, 0.0)
-            glBegin(GL_LINES)
-            glVertex2f(-15, -5)
-            glVertex2f(-5, 5)
-            glVertex2f(-15, 5)
-            glVertex2f(-5, -5)
-            glEnd()
+            gl.line_width(2.0)
+            gl.color(1.0, 0.0, 0.0)
+            gl.begin(LINES)
+            gl.vertex(-15, -5)
+            gl.vertex(-5, 5)
+            gl.vertex(-15, 5)
+            gl.vertex(-5, -5)
+            gl.end()
             
-            glPopMatrix()  # Balance the push matrix
+            gl.pop_matrix()  # Balance the push matrix
         except Exception as e:
             print(f"Error drawing fallen dino: {e}")
     
-    def draw_high_scores(self, score_history, x=600, y=400):
-        """Draw the high score history table"""
+    def draw_high_scores(self, score_history, x=600, y=400, page=0, page_count=1, page_size=5):
+        """Draw the high score history table.
+
+        score_history holds the entries of the page being shown; ranks
+        count on from earlier pages, and a page indicator is drawn when
+        there is more than one page.
+        """
         if not score_history:
             return
             
         # Draw table title
-        glColor3f(0.8, 0.8, 0.0)  # Gold color
+        gl.color(0.8, 0.8, 0.0)  # Gold color
         self._draw_text("High Scores", x, y, 18, center=True)
         
         # Draw horizontal line
-        glColor3f(0.7, 0.7, 0.7)
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        glVertex2f(x - 100, y - 10)
-        glVertex2f(x + 100, y - 10)
-        glEnd()
-        glLineWidth(1.0)
+        gl.color(0.7, 0.7, 0.7)
+        gl.line_width(2.0)
+        gl.begin(LINES)
+        gl.vertex(x - 100, y - 10)
+        gl.vertex(x + 100, y - 10)
+        gl.end()
+        gl.line_width(1.0)
         
         # Draw table headers
-        glColor3f(0.0, 0.0, 0.0)  # Black for headers
+        gl.color(0.0, 0.0, 0.0)  # Black for headers
         self._draw_text("Rank", x - 80, y - 30, 14)
         self._draw_text("Score", x, y - 30, 14, center=True)
         self._draw_text("Date", x + 80, y - 30, 14, center=True)
         
-        # Draw scores, limited to top 5 for space
-        display_count = min(5, len(score_history))
+        # Draw scores, one page at a time for space
+        display_count = min(page_size, len(score_history))
         for i in range(display_count):
             entry = score_history[i]
+            rank = page * page_size + i
             
             y_pos = y - 60 - (i * 25)
             
             # Draw rank with color based on position
-            if i == 0:
-                glColor3f(1.0, 0.8, 0.0)  # Gold for #1
-            elif i == 1:
-                glColor3f(0.8, 0.8, 0.8)  # Silver for #2
-            elif i == 2:
-                glColor3f(0.8, 0.5, 0.2)  # Bronze for #3
+            if rank == 0:
+                gl.color(1.0, 0.8, 0.0)  # Gold for #1
+            elif rank == 1:
+                gl.color(0.8, 0.8, 0.8)  # Silver for #2
+            elif rank == 2:
+                gl.color(0.8, 0.5, 0.2)  # Bronze for #3
             else:
-                glColor3f(0.0, 0.0, 0.0)  # Black for others
+                gl.color(0.0, 0.0, 0.0)  # Black for others
                 
-            self._draw_text(f"#{i+1}", x - 80, y_pos, 14)
+            self._draw_text(f"#{rank+1}", x - 80, y_pos, 14)
             
             # Draw score
             self._draw_text(str(entry['score']), x, y_pos, 14, center=True)
             
             # Draw date (shortened for space)
             date_str = entry['date'].split()[0] if 'date' in entry else ""
-            self._draw_text(date_str, x + 80, y_pos, 12, center=True)
\ No newline at end of file
+            self._draw_text(date_str, x + 80, y_pos, 12, center=True)
+
+        # Draw the page indicator
+        if page_count > 1:
+            gl.color(0.0, 0.0, 0.0)
+            self._draw_text(f"< Page {page + 1}/{page_count} >", x, y - 60 - page_size * 25, 12, center=True)
@@ -1,12 +1,26 @@
-from OpenGL.GL import *
+from render.renderer import gl, QUADS
 from shapes.circle import Circle
-from shapes.line import Line
+from .stars import StarField
 import random
 
 class Scene:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()  # Star layout
         self.is_day = False
-        self.stars = [(random.uniform(0, 800), random.uniform(800, 300)) for _ in range(200)]
+        self.stars = StarField(200, (0, 800), (300, 800), rng=self.rng)
+        self.background_lists = {}  # Compiled display list per is_day value
+
+    def reset(self, rng=None):
+        """Reset the scene, optionally with a new game's random stream, and
+        drop the cached background layers"""
+        self.clear_cache()
+        self.__init__(rng if rng is not None else self.rng)
+
+    def clear_cache(self):
+        """Free the compiled background display lists"""
+        for display_list in self.background_lists.values():
+            gl.delete_lists(display_list, 1)
+        self.background_lists = {}
     
     def toggle_day_night(self):
         """Toggle between day and night mode"""
@@ -15,39 +29,53 @@ class Scene:
     
     def draw(self):
         """Draw the outdoor scene based on day/night status"""
+        # The background only changes on toggle or reset, so compile it once
+        # per day/night state and replay the display list afterwards
+        display_list = self.background_lists.get(self.is_day)
+        if display_list is not None:
+            gl.call_list(display_list)
+            return
+
+        display_list = gl.gen_lists(1)
+        gl.new_list(display_list, execute=True)
+        self.draw_background()
+        gl.end_list()
+        self.background_lists[self.is_day] = display_list
+
+    def draw_background(self):
+        """Draw the static background in immediate mode"""
         # Sky background
         if self.is_day:
-            glColor3f(0.529, 0.808, 0.922)  # Light blue for daytime
+            gl.color(0.529, 0.808, 0.922)  # Light blue for daytime
         else:
-            glColor3f(0.0, 0.0, 0.2)  # Dark blue for nighttime
+            gl.color(0.0, 0.0, 0.2)  # Dark blue for nighttime
             
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(800, 0)
-        glVertex2f(800, 500)
-        glVertex2f(0, 500)
-        glEnd()
+        gl.begin(QUADS)
+        gl.vertex(0, 0)
+        gl.vertex(800, 0)
+        gl.vertex(800, 500)
+        gl.vertex(0, 500)
+        gl.end()
 
         # Ground
-        glColor3f(0.133, 0.545, 0.133)  # Green for grass
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(800, 0)
-        glVertex2f(800, 100)
-        glVertex2f(0, 100)
-        glEnd()
+        gl.color(0.133, 0.545, 0.133)  # Green for grass
+        gl.begin(QUADS)
+        gl.vertex(0, 0)
+        gl.vertex(800, 0)
+        gl.vertex(800, 100)
+        gl.vertex(0, 100)
+        gl.end()
 
         # Sun or Moon
         if self.is_day:
-            glColor3f(1.0, 0.843, 0.0)  # Yellow for the sun
+            gl.color(1.0, 0.843, 0.0)  # Yellow for the sun
         else:
-            glColor3f(1.0, 1.0, 1.0)  # White for the moon
-        for i in range(1, 40):
-            Circle.circles(i, 100, 450)
+            gl.color(1.0, 1.0, 1.0)  # White for the moon
+        Circle.filled_disc(39, 100, 450)
             
         # Clouds (daytime only)
         if self.is_day:
-            glColor3f(1.0, 1.0, 1.0)  # White for clouds
+            gl.color(1.0, 1.0, 1.0)  # White for clouds
             Circle.circles(20, 200, 400)
             Circle.circles(30, 230, 420)
             Circle.circles(20, 260, 400)
@@ -58,13 +86,12 @@ class Scene:
 
         # Stars (nighttime only)
         if not self.is_day:
-            glColor3f(1.0, 1.0, 1.0)  # White for stars
-            for x, y in self.stars:
-                Line.WritePixel(x, y)
+            gl.color(1.0, 1.0, 1.0)  # White for stars
+            self.stars.draw()
     
     def set_clear_color(self):
         """Set the background clear color based on day/night mode"""
         if self.is_day:
-            glClearColor(0.8, 0.8, 0.8, 2)
+            gl.clear_color(0.8, 0.8, 0.8, 2)
         else:
-            glClearColor(0, 0, 0, 1)
\ No newline at end of file
+            gl.clear_color(0, 0, 0, 1)
\ No newline at end of file
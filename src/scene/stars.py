@@ -0,0 +1,43 @@
+from render.renderer import gl, POINTS
+from shapes.vertex_array import to_vertex_array
+import bisect
+import random
+
+class StarField:
+    """A field of stars kept in one contiguous vertex array.
+
+    Each star gets a fixed twinkle phase and the array is sorted by phase,
+    so the stars lit at any moment form a contiguous (possibly wrapping)
+    range that is drawn without touching the RNG or rebuilding the array.
+    """
+    def __init__(self, count, x_range, y_range, point_size=3, twinkle_rate=0.0, duty=1.0,
+                 rng=random):
+        self.point_size = point_size
+        self.twinkle_rate = twinkle_rate  # Twinkle cycles per second
+        self.duty = duty  # Fraction of each cycle a star is lit
+        stars = sorted(
+            (rng.random(), rng.uniform(*x_range), rng.uniform(*y_range))
+            for _ in range(count)
+        )
+        self.phases = [phase for phase, _, _ in stars]
+        self.vertices = to_vertex_array([(x, y) for _, x, y in stars])
+
+    def lit_ranges(self, t):
+        """Return the (first, count) ranges of stars lit at time t"""
+        count = len(self.phases)
+        if self.duty >= 1.0 or self.twinkle_rate == 0.0:
+            return [(0, count)]
+        # A star is lit while (phase + t * rate) % 1 < duty
+        start = (-t * self.twinkle_rate) % 1.0
+        end = start + self.duty
+        first = bisect.bisect_left(self.phases, start)
+        if end <= 1.0:
+            return [(first, bisect.bisect_left(self.phases, end) - first)]
+        return [(first, count - first), (0, bisect.bisect_left(self.phases, end - 1.0))]
+
+    def draw(self, t=0.0):
+        """Draw the stars lit at time t in the current color"""
+        gl.point_size(self.point_size)
+        for first, count in self.lit_ranges(t):
+            gl.draw_array(POINTS, self.vertices, first=first, count=count)
+        gl.point_size(1.0)
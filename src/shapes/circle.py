@@ -1,40 +1,94 @@
-from OpenGL.GL import *
+from render.renderer import gl, POINTS, QUADS
+from .vertex_array import to_vertex_array
 
 class Circle:
+    # Midpoint circle points per radius, relative to the centre
+    _points_cache = {}
+    # Disc half-widths per row and the quads built from them, per radius
+    _span_cache = {}
+    _disc_cache = {}
+
+    @staticmethod
+    def eight_way_points(x, y):
+        """Return the 8 symmetric octant points of (x, y)"""
+        return [(x, y), (y, x), (-y, x), (-x, y),
+                (-x, -y), (-y, -x), (y, -x), (x, -y)]
+
     @staticmethod
     def eight_way_draw(x0, y0, x, y):
-        glPointSize(2)
-        glBegin(GL_POINTS)
+        gl.point_size(2)
+        gl.begin(POINTS)
+        for px, py in Circle.eight_way_points(x, y):
+            gl.vertex(px + x0, py + y0)
+        gl.end()
+
+    @staticmethod
+    def midpoint_points(rad):
+        """Return all midpoint circle points for a radius as a vertex array
+        centred on the origin, computing them once per radius"""
+        points = Circle._points_cache.get(rad)
+        if points is None:
+            x = 0
+            y = rad
+            d = 1 - rad
+
+            coords = Circle.eight_way_points(x, y)
+            while x < y:
+                if d >= 0:
+                    d = d + 2 * x - 2 * y + 5
+                    x += 1
+                    y -= 1
+                else:
+                    d = d + 2 * x + 3
+                    x += 1
 
-        glVertex2f(x + x0, y + y0)
-        glVertex2f(y + x0, x + y0)
-        glVertex2f(-y + x0, x + y0)
-        glVertex2f(-x + x0, y + y0)
-        glVertex2f(-x + x0, -y + y0)
-        glVertex2f(-y + x0, -x + y0)
-        glVertex2f(y + x0, -x + y0)
-        glVertex2f(x + x0, -y + y0)
+                coords.extend(Circle.eight_way_points(x, y))
 
-        glEnd()
+            points = to_vertex_array(coords)
+            Circle._points_cache[rad] = points
+        return points
 
     @staticmethod
     def midPointCircle(x0, y0, rad):
-        x = 0
-        y = rad
-        d = 1 - rad
+        gl.point_size(2)
+        gl.draw_array(POINTS, Circle.midpoint_points(rad), x0, y0)
 
-        Circle.eight_way_draw(x0, y0, x, y)
-        while x < y:
-            if d >= 0:
-                d = d + 2 * x - 2 * y + 5
-                x += 1
-                y -= 1
-            else:
-                d = d + 2 * x + 3
-                x += 1
+    @staticmethod
+    def circles(rad, x0, y0):
+        Circle.midPointCircle(x0, y0, rad)
+
+    @staticmethod
+    def disc_spans(rad):
+        """Return {dy: half_width} covering every point of the concentric
+        midpoint circles 1..rad, built incrementally from smaller radii"""
+        spans = Circle._span_cache.get(rad)
+        if spans is None:
+            spans = dict(Circle.disc_spans(rad - 1)) if rad > 1 else {}
+            for px, py in Circle.midpoint_points(rad).tolist():
+                half_width = abs(px)
+                if half_width > spans.get(py, -1):
+                    spans[py] = half_width
+            Circle._span_cache[rad] = spans
+        return spans
 
-            Circle.eight_way_draw(x0, y0, x, y)
+    @staticmethod
+    def disc_quads(rad):
+        """Return the span table for rad as one quad per scanline. Each quad
+        is padded by a pixel to match the 2px points of midPointCircle"""
+        quads = Circle._disc_cache.get(rad)
+        if quads is None:
+            coords = []
+            for dy, half_width in sorted(Circle.disc_spans(rad).items()):
+                left, right = -half_width - 1, half_width + 1
+                coords.extend([(left, dy - 1), (right, dy - 1),
+                               (right, dy + 1), (left, dy + 1)])
+            quads = to_vertex_array(coords)
+            Circle._disc_cache[rad] = quads
+        return quads
 
     @staticmethod
-    def circles(rad, x0, y0):
-        Circle.midPointCircle(x0, y0, rad)
\ No newline at end of file
+    def filled_disc(rad, x0, y0):
+        """Draw the same pixels as circles(i, x0, y0) for i in 1..rad"""
+        if rad < 1:
+            return
+        gl.draw_array(QUADS, Circle.disc_quads(rad), x0, y0)
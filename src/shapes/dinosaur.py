@@ -1,20 +1,23 @@
-from OpenGL.GL import *
+from render.renderer import gl, POLYGON
 from .circle import Circle
 from .line import Line
+from logics.poses import get_pose_cache
 from logics.jump import JumpPhysics
 import math
-import time
 
 class Dinosaur:
-    def __init__(self):
+    def __init__(self, clock, jump_physics=None, pose_samples=32):
+        self.clock = clock  # Simulation GameClock
         self.x = 150  # Base x position
         self.y = 130  # Base y position
         self.size = 0.7  # Scaling factor to make dino smaller
         self.visual_offset_x = 0  # Horizontal offset for animation
-        self.jump_physics = JumpPhysics()  # Jump physics handler
-        self.last_update_time = time.time()
+        self.prev_y = self.y  # y at the previous simulation tick
+        # Jump physics, shared with the Simulation that steps it
+        self.jump_physics = jump_physics if jump_physics is not None else JumpPhysics(clock)
         self.run_animation_time = 0
         self.run_animation_period = 0.3  # Period of running animation in seconds
+        self.poses = get_pose_cache(self.size, pose_samples)  # Leg keyframes
         
     def jump_press(self):
         """Handle jump button press"""
@@ -25,14 +28,15 @@ class Dinosaur:
         self.jump_physics.jump_release()
     
     def update(self, game_speed):
-        """Update dinosaur state based on current game conditions"""
-        current_time = time.time()
-        delta_time = current_time - self.last_update_time
-        self.last_update_time = current_time
+        """Follow the jump physics and advance the running animation by the
+        last simulation clock step"""
+        delta_time = self.clock.dt
         
-        # Update jump physics
-        new_y, jump_progress, is_jumping = self.jump_physics.update(delta_time)
-        self.y = new_y
+        # Jump physics are stepped by the Simulation, just follow them
+        is_jumping = self.jump_physics.is_currently_jumping()
+        jump_progress = self.jump_physics.jump_progress
+        self.prev_y = self.y
+        self.y = self.jump_physics.get_vertical_position()
         self.is_jumping = is_jumping
         
         # Update running animation (bobbing motion when not jumping)
@@ -54,31 +58,33 @@ class Dinosaur:
         """Set the dinosaur position"""
         self.x = x
         self.y = y
+        self.prev_y = y
     
-    def draw(self):
-        """Draw the dinosaur at the current position with proper animation state"""
+    def draw(self, alpha=1.0):
+        """Draw the dinosaur with proper animation state, interpolated alpha
+        of the way from its previous to its current simulation position"""
         # Apply scaling by adjusting coordinates relative to center
         s = self.size  # scaling factor
-        cx, cy = self.x + self.visual_offset_x, self.y  # center point
+        cx = self.x + self.visual_offset_x  # center point
+        cy = self.prev_y + (self.y - self.prev_y) * alpha
         
         # T-Rex body shape
-        glColor3f(0.2, 0.7, 0.3)  # Green dinosaur color
+        Line.set_color(0.2, 0.7, 0.3)  # Green dinosaur color
         
         # Head
-        for i in range(1, int(18 * s)):
-            Circle.circles(i, cx, cy + int(10 * s))
+        Circle.filled_disc(int(18 * s) - 1, cx, cy + int(10 * s))
         
         # Body
-        glBegin(GL_POLYGON)
-        glVertex2f(cx - int(15 * s), cy + int(15 * s))  # Top neck
-        glVertex2f(cx - int(40 * s), cy)                # Mid back
-        glVertex2f(cx - int(30 * s), cy - int(15 * s))  # Lower back
-        glVertex2f(cx + int(10 * s), cy - int(15 * s))  # Bottom front
-        glVertex2f(cx + int(15 * s), cy)                # Mid front
-        glEnd()
+        gl.begin(POLYGON)
+        gl.vertex(cx - int(15 * s), cy + int(15 * s))  # Top neck
+        gl.vertex(cx - int(40 * s), cy)                # Mid back
+        gl.vertex(cx - int(30 * s), cy - int(15 * s))  # Lower back
+        gl.vertex(cx + int(10 * s), cy - int(15 * s))  # Bottom front
+        gl.vertex(cx + int(15 * s), cy)                # Mid front
+        gl.end()
         
         # Legs and feet based on jumping state
-        glLineWidth(2.0)
+        Line.set_line_width(2.0)
         if self.jump_physics.is_currently_jumping():
             self._draw_jumping_legs(cx, cy, s)
         else:
@@ -88,83 +94,23 @@ class Dinosaur:
         Line.plot(cx, cy, cx + int(10 * s), cy + int(5 * s))
         
         # Eye
-        glColor3f(0.9, 0.9, 0.9)  # White eye
+        Line.set_color(0.9, 0.9, 0.9)  # White eye
         Circle.circles(int(3 * s), cx + int(12 * s), cy + int(12 * s))
-        glColor3f(0.0, 0.0, 0.0)  # Black pupil
+        Line.set_color(0.0, 0.0, 0.0)  # Black pupil
         Circle.circles(int(1 * s), cx + int(13 * s), cy + int(12 * s))
         
         # Mouth
-        glColor3f(0.0, 0.0, 0.0)
+        Line.set_color(0.0, 0.0, 0.0)
         Line.plot(cx + int(18 * s), cy + int(5 * s), cx + int(8 * s), cy + int(5 * s))
         
-        glLineWidth(1.0)
+        Line.set_line_width(1.0)
     
     def _draw_jumping_legs(self, cx, cy, s):
         """Draw legs for jumping animation state"""
-        jump_progress = self.jump_physics.jump_progress
-        
-        # Dynamic leg animation based on jump phase
-        if jump_progress < 0.2:
-            # Takeoff phase - legs extending backward
-            leg_angle = 60 * jump_progress / 0.2  # 0 to 60 degrees
-        elif jump_progress > 0.8:
-            # Landing phase - legs extending forward
-            landing_progress = (jump_progress - 0.8) / 0.2  # 0 to 1 in landing phase
-            leg_angle = 60 - 120 * landing_progress  # 60 to -60 degrees
-        else:
-            # Mid-flight - maintain tucked position
-            mid_flight_progress = (jump_progress - 0.2) / 0.6  # 0 to 1 in mid-flight
-            # Add subtle oscillation during flight
-            leg_angle = 60 - 10 * math.sin(mid_flight_progress * math.pi * 2)
-        
-        # Front leg with dynamic angle
-        leg_x = cx + int(5 * s)
-        leg_y = cy - int(15 * s)
-        leg_length = int(15 * s)
-        
-        # Calculate leg positions with the angle
-        end_x = leg_x + leg_length * math.cos(math.radians(leg_angle))
-        end_y = leg_y - leg_length * math.sin(math.radians(leg_angle))
-        
-        Line.plot(leg_x, leg_y, int(end_x), int(end_y))
-        Line.plot(int(end_x), int(end_y), int(end_x + 10 * s), int(end_y))
-        
-        # Back leg with opposite angle for balance
-        back_leg_x = cx - int(20 * s)
-        back_leg_y = cy - int(15 * s)
-        back_leg_angle = -leg_angle  # Mirror the front leg
-        
-        back_end_x = back_leg_x + leg_length * math.cos(math.radians(back_leg_angle))
-        back_end_y = back_leg_y - leg_length * math.sin(math.radians(back_leg_angle))
-        
-        Line.plot(back_leg_x, back_leg_y, int(back_end_x), int(back_end_y))
-        Line.plot(int(back_end_x), int(back_end_y), int(back_end_x + 10 * s), int(back_end_y))
+        Line.segments(self.poses.jumping(self.jump_physics.jump_progress), cx, cy)
     
     def _draw_running_legs(self, cx, cy, s):
         """Draw legs for running animation"""
         # Use run_animation_time to create alternating leg movements
         run_progress = self.run_animation_time / self.run_animation_period
-        leg_angle_front = 30 * math.sin(run_progress * 2 * math.pi)  # -30 to 30 degrees
-        leg_angle_back = -leg_angle_front  # Opposite movement
-        
-        # Front leg with dynamic angle
-        leg_x = cx + int(5 * s)
-        leg_y = cy - int(15 * s)
-        leg_length = int(15 * s)
-        
-        # Calculate leg positions with the angle
-        end_x = leg_x + leg_length * math.cos(math.radians(leg_angle_front))
-        end_y = leg_y - leg_length * math.sin(math.radians(leg_angle_front))
-        
-        Line.plot(leg_x, leg_y, int(end_x), int(end_y))
-        Line.plot(int(end_x), int(end_y), int(end_x + 10 * s), int(end_y))
-        
-        # Back leg with opposite angle for balance
-        back_leg_x = cx - int(20 * s)
-        back_leg_y = cy - int(15 * s)
-        
-        back_end_x = back_leg_x + leg_length * math.cos(math.radians(leg_angle_back))
-        back_end_y = back_leg_y - leg_length * math.sin(math.radians(leg_angle_back))
-        
-        Line.plot(back_leg_x, back_leg_y, int(back_end_x), int(back_end_y))
-        Line.plot(int(back_end_x), int(back_end_y), int(back_end_x + 10 * s), int(back_end_y))
\ No newline at end of file
+        Line.segments(self.poses.running(run_progress), cx, cy)
@@ -1,25 +1,117 @@
-from OpenGL.GL import *
+from render.renderer import gl, POINTS, LINES
+from .vertex_array import to_vertex_array
 import random
 
+class LineBatch:
+    """Collects line segments and points grouped by color, line width and
+    point size, then draws each group with a single array call on flush"""
+    def __init__(self):
+        self.groups = {}  # (mode, color, size) -> list of (x, y) vertices
+        self.color = (1.0, 1.0, 1.0)
+        self.line_width = 1.0
+
+    def set_color(self, r, g, b):
+        """Set the color used by subsequently added primitives"""
+        self.color = (r, g, b)
+
+    def set_line_width(self, width):
+        """Set the line width used by subsequently added segments"""
+        self.line_width = width
+
+    def _group(self, mode, size):
+        key = (mode, self.color, size)
+        coords = self.groups.get(key)
+        if coords is None:
+            coords = self.groups[key] = []
+        return coords
+
+    def add_segment(self, x1, y1, x2, y2):
+        """Queue a line segment"""
+        self._group(LINES, self.line_width).extend([(x1, y1), (x2, y2)])
+
+    def add_segments(self, vertices, x=0, y=0):
+        """Queue a LINES vertex array translated by (x, y)"""
+        self._group(LINES, self.line_width).extend((vertices + (x, y)).tolist())
+
+    def add_point(self, x, y, size=3):
+        """Queue a point of the given size"""
+        self._group(POINTS, size).append((x, y))
+
+    def flush(self):
+        """Draw every queued group, one glDrawArrays call per group, leaving
+        the color, line width and point size as they were before"""
+        gl.push_attrib()
+        for (mode, color, size), coords in self.groups.items():
+            gl.color(*color)
+            if mode == LINES:
+                gl.line_width(size)
+            else:
+                gl.point_size(size)
+            gl.draw_array(mode, to_vertex_array(coords))
+        self.groups.clear()
+        gl.pop_attrib()
+
 class Line:
+    batch = None  # Active LineBatch, plot/WritePixel queue into it when set
+
+    @staticmethod
+    def begin_batch(batch):
+        """Route plot and WritePixel calls into batch until end_batch"""
+        Line.batch = batch
+
+    @staticmethod
+    def end_batch():
+        """Flush the active batch and go back to immediate drawing"""
+        if Line.batch is not None:
+            Line.batch.flush()
+            Line.batch = None
+
+    @staticmethod
+    def set_color(r, g, b):
+        """Set the current color for both immediate and batched drawing"""
+        gl.color(r, g, b)
+        if Line.batch is not None:
+            Line.batch.set_color(r, g, b)
+
+    @staticmethod
+    def set_line_width(width):
+        """Set the line width for both immediate and batched drawing"""
+        gl.line_width(width)
+        if Line.batch is not None:
+            Line.batch.set_line_width(width)
+
     @staticmethod
     def WritePixel(x, y):
-        glPointSize(3)
-        glBegin(GL_POINTS)
-        glVertex2f(x, y)
-        glEnd()
+        if Line.batch is not None:
+            Line.batch.add_point(x, y, 3)
+            return
+        gl.point_size(3)
+        gl.begin(POINTS)
+        gl.vertex(x, y)
+        gl.end()
 
     @staticmethod
     def plot(x1, y1, x2, y2):
-        glBegin(GL_LINES)
-        glVertex2f(x1, y1)
-        glVertex2f(x2, y2)
-        glEnd()
+        if Line.batch is not None:
+            Line.batch.add_segment(x1, y1, x2, y2)
+            return
+        gl.begin(LINES)
+        gl.vertex(x1, y1)
+        gl.vertex(x2, y2)
+        gl.end()
+
+    @staticmethod
+    def segments(vertices, x=0, y=0):
+        """Draw a LINES vertex array translated by (x, y)"""
+        if Line.batch is not None:
+            Line.batch.add_segments(vertices, x, y)
+            return
+        gl.draw_array(LINES, vertices, x, y)
 
     @staticmethod
     def stars():
-        glPointSize(3)
-        glBegin(GL_POINTS)
+        gl.point_size(3)
+        gl.begin(POINTS)
         for _ in range(50):
-            glVertex2f(random.randint(0, 800), random.randint(300, 400))
-        glEnd()
\ No newline at end of file
+            gl.vertex(random.randint(0, 800), random.randint(300, 400))
+        gl.end()
@@ -0,0 +1,5 @@
+import numpy as np
+
+def to_vertex_array(coords):
+    """Pack a list of (x, y) pairs into a contiguous float32 vertex array"""
+    return np.array(coords, dtype=np.float32).reshape(-1, 2)
@@ -0,0 +1,173 @@
+"""Play seeded headless games on every core and report how they ended.
+
+Usage: python tournament.py [--games M] [--policies reflex,idle] [--seed S]
+                            [--workers W] [--max-time SECONDS] [--verbose]
+                            [--collision discrete|swept|precise]
+
+Game i of every policy is seeded with seed + i, so all policies face the
+same obstacle sequences.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter, defaultdict
+from logics.simulation import Simulation, JUMP_PRESS, COLLISION_MODES
+import argparse
+import os
+import statistics
+import time
+
+TICK_RATE = 60  # Simulation ticks per second, as in main.py
+
+def idle_policy(simulation):
+    """Never jump"""
+    return ()
+
+def _jump_ahead(simulation, lead_ticks):
+    """Jump once the next ground obstacle is within lead_ticks of travel"""
+    for obstacle in simulation.obstacles.obstacles:
+        if obstacle.x + obstacle.width < simulation.dino_x:
+            continue  # Already behind the dinosaur
+        if obstacle.type == "bird_cactus":
+            return ()  # Run underneath flying cacti
+        distance = obstacle.x - (simulation.dino_x + 30)
+        return (JUMP_PRESS,) if distance < simulation.speed * lead_ticks else ()
+    return ()
+
+def reflex_policy(simulation):
+    """Jump late, just before the next ground obstacle"""
+    return _jump_ahead(simulation, 14)
+
+def early_policy(simulation):
+    """Jump well ahead of the next ground obstacle"""
+    return _jump_ahead(simulation, 22)
+
+POLICIES = {
+    "idle": idle_policy,
+    "reflex": reflex_policy,
+    "early": early_policy,
+}
+
+def play_game(policy_name, seed, max_time=300.0, tick_rate=TICK_RATE, collision="discrete"):
+    """Play one seeded game to the end and return a small result record"""
+    simulation = Simulation(swept_collision=collision == "swept",
+                            precise_collision=collision == "precise", seed=seed)
+    policy = POLICIES[policy_name]
+    dt = 1.0 / tick_rate
+    max_ticks = int(max_time * tick_rate)
+    while simulation.ticks < max_ticks and simulation.step(dt, policy(simulation)):
+        pass
+
+    collided_with = simulation.collided_with
+    return {
+        "policy": policy_name,
+        "seed": seed,
+        "score": simulation.score,
+        "survival_time": simulation.ticks * dt,
+        "cause": collided_with.type if collided_with is not None else "timeout",
+    }
+
+def play_games(policy_name, seeds, max_time, tick_rate, collision):
+    """Worker task: play a chunk of games so each task only ships a few seeds"""
+    return [play_game(policy_name, seed, max_time, tick_rate, collision) for seed in seeds]
+
+def run_tournament(policies, games, seed=0, workers=None, max_time=300.0,
+                   tick_rate=TICK_RATE, chunk_size=None, collision="discrete"):
+    """Spread games over a process pool and yield results as chunks finish"""
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # Several chunks per worker keeps the cores busy until the end
+        chunk_size = max(1, min(64, games * len(policies) // (workers * 8)))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for policy_name in policies:
+            for start in range(0, games, chunk_size):
+                seeds = range(seed + start, seed + min(start + chunk_size, games))
+                futures.append(executor.submit(play_games, policy_name, seeds,
+                                               max_time, tick_rate, collision))
+        for future in as_completed(futures):
+            yield from future.result()
+
+def summarize(results):
+    """Aggregate result records into per-policy statistics"""
+    by_policy = defaultdict(list)
+    for result in results:
+        by_policy[result["policy"]].append(result)
+
+    summary = {}
+    for policy_name, records in by_policy.items():
+        scores = sorted(r["score"] for r in records)
+        times = [r["survival_time"] for r in records]
+        deciles = statistics.quantiles(scores, n=10) if len(scores) > 1 else scores * 9
+        summary[policy_name] = {
+            "games": len(records),
+            "score_mean": statistics.fmean(scores),
+            "score_median": statistics.median(scores),
+            "score_p10": deciles[0],
+            "score_p90": deciles[-1],
+            "score_max": scores[-1],
+            "score_histogram": score_histogram(scores),
+            "survival_mean": statistics.fmean(times),
+            "survival_median": statistics.median(times),
+            "causes": Counter(r["cause"] for r in records),
+        }
+    return summary
+
+def score_histogram(scores, buckets=8):
+    """Return (low, high, count) buckets of equal width covering the scores"""
+    low, high = scores[0], scores[-1]
+    width = max(1, -(-(high - low + 1) // buckets))
+    counts = Counter((score - low) // width for score in scores)
+    return [(low + i * width, low + (i + 1) * width - 1, counts[i])
+            for i in range(max(counts) + 1)]
+
+def print_summary(summary):
+    for policy_name, stats in summary.items():
+        games = stats["games"]
+        print(f"\n{policy_name}: {games} games")
+        print(f"  score: mean {stats['score_mean']:.1f}, median {stats['score_median']:.0f}, "
+              f"p10 {stats['score_p10']:.0f}, p90 {stats['score_p90']:.0f}, max {stats['score_max']}")
+        print(f"  survival: mean {stats['survival_mean']:.1f}s, "
+              f"median {stats['survival_median']:.1f}s")
+        peak = max(count for _, _, count in stats["score_histogram"])
+        for low, high, count in stats["score_histogram"]:
+            bar = "#" * round(30 * count / peak)
+            print(f"  {low:>5}-{high:<5} {count:>6} {bar}")
+        print("  cause of death:")
+        for cause, count in stats["causes"].most_common():
+            print(f"    {cause:<14} {count:>6} ({100 * count / games:.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless T-Rex Runner tournament")
+    parser.add_argument("--games", type=int, default=200, help="seeded games per policy")
+    parser.add_argument("--policies", default="reflex",
+                        help="comma separated, from: " + ", ".join(POLICIES))
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--max-time", type=float, default=300.0,
+                        help="game seconds before a game is stopped as a timeout")
+    parser.add_argument("--verbose", action="store_true", help="print every game as it finishes")
+    parser.add_argument("--collision", choices=COLLISION_MODES, default="discrete",
+                        help="hitbox sweep, end-of-tick hitboxes or pixel masks")
+    args = parser.parse_args()
+
+    policies = args.policies.split(",")
+    unknown = [name for name in policies if name not in POLICIES]
+    if unknown:
+        parser.error(f"unknown policies: {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    results = []
+    for result in run_tournament(policies, args.games, args.seed, args.workers, args.max_time,
+                                 collision=args.collision):
+        results.append(result)
+        if args.verbose:
+            print(f"{result['policy']} seed {result['seed']}: score {result['score']}, "
+                  f"{result['survival_time']:.1f}s, {result['cause']}")
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print_summary({name: summary[name] for name in policies if name in summary})
+    print(f"\n{len(results)} games in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
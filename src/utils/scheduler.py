@@ -0,0 +1,77 @@
+import time
+
+class FrameScheduler:
+    """Paces redraws with one-shot timers instead of an idle busy loop.
+
+    Frames are scheduled against absolute deadlines at target_fps while the
+    game is active, and at the lower idle_fps on the intro, pause and game
+    over screens. A frame that lands late is caught up by scheduling the
+    next one immediately; once more than max_catch_up frames behind, the
+    missed frames are dropped and the deadline restarts from now.
+    """
+    def __init__(self, timer_func, redraw_func, target_fps=60, idle_fps=15,
+                 max_catch_up=3, clock=time.perf_counter):
+        self.timer_func = timer_func  # timer_func(msecs, callback, value), e.g. glutTimerFunc
+        self.redraw_func = redraw_func  # Requests a redraw, e.g. glutPostRedisplay
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.active = True
+        self.next_deadline = 0.0
+        self.missed_frames = 0  # Frames dropped because we fell too far behind
+        self.generation = 0  # Timers from an older schedule are ignored
+
+    def frame_interval(self):
+        """Return the seconds between frames in the current mode"""
+        return 1.0 / (self.target_fps if self.active else self.idle_fps)
+
+    def start(self, active=True):
+        """Start the timer chain, with the first frame due immediately"""
+        self.active = active
+        self.next_deadline = self.clock()
+        self._restart()
+
+    def set_active(self, active):
+        """Switch between full-rate and idle pacing"""
+        if active != self.active:
+            self.active = active
+            self.next_deadline = self.clock() + self.frame_interval()
+            self._restart()
+
+    def set_target_fps(self, fps):
+        """Change the full-rate frame target"""
+        self.target_fps = fps
+        if self.active:
+            self.next_deadline = self.clock() + self.frame_interval()
+            self._restart()
+
+    def request_redraw(self):
+        """Redraw as soon as possible, e.g. after input on a static screen"""
+        self.redraw_func()
+
+    def _restart(self):
+        self.generation += 1
+        self._schedule()
+
+    def _schedule(self):
+        delay = max(0.0, self.next_deadline - self.clock())
+        self.timer_func(int(delay * 1000), self._on_timer, self.generation)
+
+    def _on_timer(self, generation):
+        if generation != self.generation:
+            return
+        now = self.clock()
+        interval = self.frame_interval()
+        if now < self.next_deadline - 0.001:
+            # Timer granularity woke us early, sleep for the remainder
+            self._schedule()
+            return
+
+        self.redraw_func()
+        self.next_deadline += interval
+        behind = (now - self.next_deadline) / interval
+        if behind > self.max_catch_up:
+            self.missed_frames += int(behind)
+            self.next_deadline = now + interval
+        self._schedule()
@@ -0,0 +1,78 @@
+from render.renderer import gl
+from collections import OrderedDict
+
+class BitmapText:
+    """Draws GLUT bitmap strings through cached display lists.
+
+    Glyph widths are measured once per font, every glyph is compiled into
+    its own display list, and each rendered (text, font) pair is compiled
+    into a list that calls those glyphs, so redrawing an unchanged string
+    costs a single glCallList.
+    """
+    def __init__(self, max_strings=256):
+        self.width_tables = {}  # font -> width of each of the 256 glyphs
+        self.glyph_bases = {}  # font -> first of 256 glyph display lists
+        self.string_lists = OrderedDict()  # (text, font) -> display list, LRU order
+        self.max_strings = max_strings
+
+    @staticmethod
+    def _codes(text):
+        """Return the latin-1 glyph codes for text"""
+        return text.encode('latin-1', errors='replace')
+
+    def char_widths(self, font):
+        """Return the glyph width table for a font, building it on first use"""
+        widths = self.width_tables.get(font)
+        if widths is None:
+            widths = [gl.bitmap_width(font, code) for code in range(256)]
+            self.width_tables[font] = widths
+        return widths
+
+    def text_width(self, text, font):
+        """Return the width of text in pixels"""
+        widths = self.char_widths(font)
+        return sum(widths[code] for code in self._codes(text))
+
+    def glyph_base(self, font):
+        """Return the display list base of a font's glyphs, compiling them on first use"""
+        base = self.glyph_bases.get(font)
+        if base is None:
+            base = gl.gen_lists(256)
+            for code in range(256):
+                gl.new_list(base + code)
+                gl.bitmap_character(font, code)
+                gl.end_list()
+            self.glyph_bases[font] = base
+        return base
+
+    def string_list(self, text, font):
+        """Return the display list for a rendered string, compiling it if needed"""
+        key = (text, font)
+        display_list = self.string_lists.get(key)
+        if display_list is not None:
+            self.string_lists.move_to_end(key)
+            return display_list
+
+        base = self.glyph_base(font)
+        display_list = gl.gen_lists(1)
+        gl.new_list(display_list)
+        for code in self._codes(text):
+            gl.call_list(base + code)
+        gl.end_list()
+        self.string_lists[key] = display_list
+
+        # Evict the least recently drawn strings (e.g. old scores)
+        while len(self.string_lists) > self.max_strings:
+            _, old_list = self.string_lists.popitem(last=False)
+            gl.delete_lists(old_list, 1)
+        return display_list
+
+    def draw(self, text, x, y, font, center=False):
+        """Draw text with its baseline starting at (x, y), or centred on x"""
+        if center:
+            x = x - self.text_width(text, font) // 2
+        gl.raster_pos(x, y)
+        gl.call_list(self.string_list(text, font))
+
+# Shared instance so glyph lists are compiled once per process
+bitmap_text = BitmapText()
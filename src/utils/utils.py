@@ -1,4 +1,4 @@
-from OpenGL.GL import *
+from render.renderer import gl
 
 def keyboard(key, x, y, dinosaur, scene, pause):
     """Handle keyboard input - Note: This function is now deprecated in favor of 
@@ -18,10 +18,5 @@ def keyboardUp(key, x, y, dinosaur):
 
 def iterate(scene):
     """Setup OpenGL viewport and projection"""
-    glViewport(0, 0, 800, 500)
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
     scene.set_clear_color()  # Use scene method to set clear color
-    glOrtho(0.0, 800, 0.0, 500, 0.0, 1.0)
-    glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
\ No newline at end of file
+    gl.set_ortho(800, 500)
\ No newline at end of file
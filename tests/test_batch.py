@@ -0,0 +1,44 @@
+import numpy as np
+
+from logics.batch import BatchSimulation
+from logics.obstacles import OBSTACLE_TYPES
+from logics.simulation import Simulation, JUMP_PRESS
+
+SEEDS = list(range(1, 33))
+MAX_TICKS = 4000
+DT = 1.0 / 60
+DINO_X = 150
+
+
+def jump_window(speed):
+    """How close an obstacle gets before the reflex policy jumps"""
+    return 40 + 12 * speed
+
+
+def play_single(seed):
+    simulation = Simulation(seed=seed)
+    while simulation.ticks < MAX_TICKS:
+        window = jump_window(simulation.speed)
+        ahead = [o for o in simulation.obstacles.obstacles if 0 < o.x - DINO_X <= window]
+        if not simulation.step(DT, [JUMP_PRESS] if ahead else []):
+            break
+    cause = simulation.collided_with.type if simulation.collided_with is not None else None
+    return simulation.score, simulation.ticks, cause
+
+
+def test_seeded_batch_matches_simulation():
+    batch = BatchSimulation(len(SEEDS), game_seeds=SEEDS)
+    for _ in range(MAX_TICKS):
+        gap = batch.obstacle_x - DINO_X
+        ahead = batch.active & (gap > 0) & (gap <= jump_window(batch.speed)[:, None])
+        if not batch.step(DT, ahead.any(axis=1)).any():
+            break
+
+    outcomes = []
+    for i, seed in enumerate(SEEDS):
+        cause = OBSTACLE_TYPES[batch.collided_type[i]] if batch.game_over[i] else None
+        outcome = (int(batch.score[i]), int(batch.ticks[i]), cause)
+        assert outcome == play_single(seed), seed
+        outcomes.append(outcome)
+    # The policy should get games well past their first obstacle
+    assert max(score for score, _, _ in outcomes) >= 10
@@ -0,0 +1,69 @@
+from logics.simulation import Simulation, JUMP_PRESS
+
+
+def place_lone_cactus(simulation, x, obstacle_type="small_cactus"):
+    """Leave a single cactus at x in front of the dinosaur"""
+    field = simulation.obstacles
+    field.obstacles.clear()
+    return field.create_obstacle(obstacle_type, x)
+
+
+def jump_clears(seed, jump_tick, obstacle_type):
+    """Jump at jump_tick over a lone cactus in precise mode, returning
+    True if the dinosaur gets past it"""
+    simulation = Simulation(seed=seed, precise_collision=True)
+    cactus = place_lone_cactus(simulation, simulation.dino_x + 300, obstacle_type)
+    tick = 0
+    while cactus.x + cactus.width >= simulation.dino_x - 40:
+        if not simulation.step(1.0 / 60, (JUMP_PRESS,) if tick == jump_tick else ()):
+            return False
+        tick += 1
+    return True
+
+
+def test_discrete_collision_is_the_default():
+    simulation = Simulation(seed=1)
+    assert not simulation.swept_collision
+    assert simulation.collision_mode == "discrete"
+
+
+def test_swept_collision_catches_a_tunnelling_cactus():
+    # One long tick carries the cactus from in front of the dinosaur to
+    # well behind it, so the end-of-tick test never sees them overlap
+    dt = 1.0
+    discrete = Simulation(seed=1)
+    place_lone_cactus(discrete, discrete.dino_x + 60)
+    assert discrete.step(dt)
+    cactus = discrete.obstacles.obstacles[0]
+    assert cactus.x + cactus.width < discrete.dino_x - 10
+
+    swept = Simulation(seed=1, swept_collision=True)
+    place_lone_cactus(swept, swept.dino_x + 60)
+    assert not swept.step(dt)
+    assert swept.collided_with.type == "small_cactus"
+    assert 0.0 < swept.impact_time <= 1.0
+
+
+def test_sweep_reports_time_of_impact():
+    simulation = Simulation(seed=1, swept_collision=True)
+    place_lone_cactus(simulation, simulation.dino_x + 60)
+    cactus = simulation.obstacles.obstacles[0]
+    cactus.prev_x, cactus.x = cactus.x, cactus.x - 200
+    obstacle, toi = simulation.obstacles.sweep_collision(simulation.dino_x, 130, 130)
+    assert obstacle is cactus
+    assert 0.0 < toi < 1.0
+
+
+def test_precise_masks_cover_the_stem_but_not_the_arms():
+    simulation = Simulation(seed=1, precise_collision=True)
+    cactus = place_lone_cactus(simulation, 400, "tall_cactus")
+    mask = simulation.obstacles.get_mask(cactus)
+    # The stem's 2 pixel wide outline, centred on its edges
+    assert (mask.x0, mask.x1) == (-1, cactus.width + 1)
+    assert (mask.y0, mask.y1) == (0, cactus.height + 1)
+    assert cactus.vertices[:, 0].min() < mask.x0
+
+
+def test_precise_collision_lets_a_tall_cactus_be_jumped():
+    for seed in (1, 3, 4):
+        assert any(jump_clears(seed, tick, "tall_cactus") for tick in range(150))
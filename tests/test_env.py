@@ -0,0 +1,35 @@
+from logics.env import DinoEnv, NOOP, JUMP
+
+
+def play_until_done(env):
+    done = False
+    while not done:
+        observation, reward, done, info = env.step(NOOP)
+    return observation, reward, info
+
+
+def test_step_after_done_returns_terminal_observation():
+    env = DinoEnv()
+    env.reset(seed=1)
+    observation, reward, info = play_until_done(env)
+    assert env.simulation.game_over
+    final = observation.copy()
+    ticks = info["ticks"]
+
+    observation, reward, done, info = env.step(JUMP)
+    assert done
+    assert reward == 0.0
+    assert info["ticks"] == ticks
+    assert env.simulation.ticks == ticks
+    assert (observation == final).all()
+
+
+def test_reset_starts_a_new_episode():
+    env = DinoEnv()
+    env.reset(seed=1)
+    play_until_done(env)
+
+    env.reset(seed=1)
+    observation, reward, done, info = env.step(NOOP)
+    assert not done
+    assert info["ticks"] == 1
@@ -0,0 +1,42 @@
+import random
+
+from logics.clock import GameClock
+from logics.obstacles import ObstacleField
+
+
+def run_updates(field, clock, ticks):
+    """Advance the field tick by tick, returning the cache misses per update"""
+    misses = []
+    for _ in range(ticks):
+        before = field.cache_misses
+        clock.step(1.0 / 60)
+        field.update()
+        misses.append(field.cache_misses - before)
+    return misses
+
+
+def test_warm_updates_allocate_nothing():
+    clock = GameClock(manual=True)
+    field = ObstacleField(clock, rng=random.Random(7))
+    records = list(field.obstacles.records)
+
+    # The first run bakes every shape it meets; replaying the same seed
+    # meets the same shapes again, so every update must hit the caches
+    run_updates(field, clock, 3000)
+    field.rng.seed(7)
+    clock.reset()
+    field.reset()
+    assert run_updates(field, clock, 3000) == [0] * 3000
+
+    # Obstacles are recycled in place rather than allocated
+    assert [id(r) for r in field.obstacles.records] == [id(r) for r in records]
+
+
+def test_new_shapes_count_as_cache_misses():
+    clock = GameClock(manual=True)
+    field = ObstacleField(clock, rng=random.Random(7))
+    ObstacleField.geometry_cache.pop(("small_cactus", 40, 0), None)
+    misses = field.cache_misses
+    field.get_geometry("small_cactus", 20, 40, 0)
+    field.get_geometry("small_cactus", 20, 40, 0)
+    assert field.cache_misses == misses + 1
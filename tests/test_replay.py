@@ -0,0 +1,56 @@
+from logics.replay import ReplayRecorder, ReplayReader, load_replay, play_replay
+from logics.simulation import Simulation, JUMP_PRESS, JUMP_RELEASE
+
+
+def test_abandoned_game_replay_ends_where_it_was_left(tmp_path):
+    simulation = Simulation(seed=5)
+    path = tmp_path / "abandoned.dreplay"
+    simulation.recorder = ReplayRecorder(str(path), simulation.seed, 60, simulation.collision_mode)
+    for tick in range(17):
+        inputs = [JUMP_PRESS] if tick == 3 else [JUMP_RELEASE] if tick == 9 else []
+        assert simulation.step(1.0 / 60, inputs)
+    ticks, score = simulation.ticks, simulation.score
+
+    # Starting a new game closes the old replay first, as main.resetGame does
+    simulation.recorder.finish(simulation, wait=True)
+    simulation.recorder = None
+    simulation.reset()
+
+    replay = load_replay(str(path))
+    assert (replay.ticks, replay.score, replay.game_over) == (ticks, score, False)
+    replayed = play_replay(replay)
+    assert (replayed.ticks, replayed.score, replayed.game_over) == (ticks, score, False)
+
+
+def replay_to(replay, tick):
+    """Replay events from the start up to the start of tick"""
+    simulation = Simulation(seed=replay.seed)
+    events = [event for event in replay.events if event[0] < tick]
+    while simulation.ticks < tick and not simulation.game_over:
+        inputs = [action for event_tick, action in events if event_tick == simulation.ticks]
+        simulation.step(1.0 / replay.tick_rate, inputs)
+    return simulation
+
+
+def test_seek_matches_a_straight_replay_around_snapshots(tmp_path):
+    interval = 50
+    simulation = Simulation(seed=11)
+    path = tmp_path / "seek.dreplay"
+    simulation.recorder = ReplayRecorder(str(path), simulation.seed, 60, simulation.collision_mode,
+                                         snapshot_interval=interval)
+    while simulation.ticks < 400:
+        # Jump at obstacles in reach, and on every snapshot tick so an input
+        # lands on each boundary
+        ahead = [o for o in simulation.obstacles.obstacles if 0 < o.x - simulation.dino_x <= 64]
+        inputs = [JUMP_PRESS] if ahead or simulation.ticks % interval == 0 else []
+        if not simulation.step(1.0 / 60, inputs):
+            break
+    simulation.recorder.finish(simulation, wait=True)
+    assert simulation.ticks > 3 * interval
+
+    replay = load_replay(str(path))
+    with ReplayReader(str(path)) as reader:
+        assert reader.snapshot_ticks[:3] == [0, interval, 2 * interval]
+        for boundary in (interval, 2 * interval, 3 * interval):
+            for tick in (boundary - 1, boundary, boundary + 1):
+                assert reader.seek(tick).snapshot() == replay_to(replay, tick).snapshot(), tick
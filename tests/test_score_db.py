@@ -0,0 +1,63 @@
+import sqlite3
+import time
+
+from logics.score_db import INSERT_SCORE, SQLiteScoreManager
+from logics.score_manager import ScoreManager
+
+
+def test_first_pages_come_from_memory_without_waiting(tmp_path):
+    manager = SQLiteScoreManager(str(tmp_path / "scores.db"))
+    manager.flush()
+
+    # Hold the writer so saves stay queued, as they are right after a game
+    with manager.write_lock:
+        for score in (4, 11, 7):
+            manager.save_score(score)
+        entries, page_count = manager.get_score_page(0, 5)
+    assert [entry['score'] for entry in entries] == [11, 7, 4]
+    assert page_count == 1
+
+
+def test_deep_pages_and_queries_read_the_database(tmp_path):
+    manager = SQLiteScoreManager(str(tmp_path / "scores.db"), top_k=4)
+    for score in range(12):
+        manager.save_score(score, player=f"p{score % 3}")
+    assert manager.flush(timeout=5.0)
+
+    entries, page_count = manager.get_score_page(2, 3)
+    assert [entry['score'] for entry in entries] == [5, 4, 3]
+    assert page_count == 4
+    assert [entry['player'] for entry in manager.get_player_bests()] == ["p2", "p1", "p0"]
+    assert manager.get_percentile(6) == 50.0
+    assert [entry['score'] for entry in SQLiteScoreManager(str(tmp_path / "scores.db")).get_score_history()][:3] == [11, 10, 9]
+
+
+def test_player_bests_carry_the_date_of_the_best_game(tmp_path):
+    db_path = str(tmp_path / "scores.db")
+    SQLiteScoreManager(db_path)
+    with sqlite3.connect(db_path) as connection:
+        connection.executemany(INSERT_SCORE, [(3, 1000.0, "ann"), (9, 90000.0, "ann"), (5, 5000.0, "bob"),
+                                              (9, 200000.0, "ann")])
+
+    bests = SQLiteScoreManager(db_path).get_player_bests()
+    assert [(entry['player'], entry['score']) for entry in bests] == [("ann", 9), ("bob", 5)]
+    # The earlier of ann's two 9s
+    assert bests[0]['date'] == time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(90000.0))
+
+
+def test_json_history_is_imported_once(tmp_path):
+    json_path = str(tmp_path / "high_score.json")
+    scores = ScoreManager(json_path)
+    for score in (4, 8, 6):
+        scores.save_score(score)
+    assert scores.flush(timeout=5.0)
+
+    db_path = str(tmp_path / "scores.db")
+    manager = SQLiteScoreManager(db_path, import_from=json_path)
+    assert manager.get_high_score() == 8
+    assert [entry['score'] for entry in manager.get_top_scores()] == [8, 6, 4]
+
+    # An emptied database stays empty rather than importing again
+    manager.reset_scores()
+    assert manager.flush(timeout=5.0)
+    assert SQLiteScoreManager(db_path, import_from=json_path).get_top_scores() == []
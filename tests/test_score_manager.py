@@ -0,0 +1,64 @@
+import os
+import time
+
+from logics.score_manager import ScoreManager
+
+
+def test_high_scores_are_journaled_not_snapshotted(tmp_path):
+    path = str(tmp_path / "high_score.json")
+    manager = ScoreManager(path, compact_every=64)
+    for score in (3, 9, 4):
+        manager.save_score(score)
+        manager.save_high_score(manager.get_high_score(), force=True)
+    manager.save_high_score(12, force=True)
+    assert manager.flush(timeout=5.0)
+
+    # Nothing has reached the compaction cadence, so only the journal exists
+    assert not os.path.exists(path)
+    reloaded = ScoreManager(path)
+    assert reloaded.get_high_score() == 12
+    assert [entry['score'] for entry in reloaded.get_score_history()] == [9, 4, 3]
+    assert [entry['score'] for entry in reloaded.get_all_scores()] == [3, 9, 4]
+
+
+def test_journal_is_compacted_on_cadence(tmp_path):
+    path = str(tmp_path / "high_score.json")
+    manager = ScoreManager(path, top_k=3, compact_every=8)
+    for score in range(20):
+        manager.save_score(score)
+    assert manager.flush(timeout=5.0)
+    assert os.path.exists(path)
+
+    reloaded = ScoreManager(path, top_k=3)
+    assert reloaded.compacted_records == 16
+    assert reloaded.journal_records == 20
+    assert [entry['score'] for entry in reloaded.get_score_history()] == [19, 18, 17]
+
+
+def test_torn_journal_tail_is_dropped(tmp_path):
+    path = str(tmp_path / "high_score.json")
+    manager = ScoreManager(path)
+    for score in (5, 7):
+        manager.save_score(score)
+    assert manager.flush(timeout=5.0)
+    with open(manager.journal_path, "ab") as journal:
+        journal.write(b"\x00\x01\x02")
+
+    reloaded = ScoreManager(path)
+    assert [entry['score'] for entry in reloaded.get_score_history()] == [7, 5]
+    reloaded.save_score(6)
+    assert reloaded.flush(timeout=5.0)
+    assert [entry['score'] for entry in ScoreManager(path).get_all_scores()] == [5, 7, 6]
+
+
+def test_all_scores_read_what_is_on_disk_when_the_writer_is_behind(tmp_path):
+    manager = ScoreManager(str(tmp_path / "high_score.json"))
+    manager.save_score(5)
+    assert manager.flush(timeout=5.0)
+    # A save the writer never gets to
+    with manager.write_lock:
+        manager.saves_requested += 1
+
+    started = time.monotonic()
+    assert [entry['score'] for entry in manager.get_all_scores(timeout=0.05)] == [5]
+    assert time.monotonic() - started < 1.0
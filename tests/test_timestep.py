@@ -0,0 +1,27 @@
+from logics.simulation import Simulation, JUMP_PRESS, JUMP_RELEASE
+from logics.timestep import FixedTimestep
+
+# Jump presses and releases by simulation tick
+SCRIPT = {40: [JUMP_PRESS], 52: [JUMP_RELEASE], 150: [JUMP_PRESS], 190: [JUMP_RELEASE],
+          300: [JUMP_PRESS], 310: [JUMP_RELEASE]}
+
+
+def play_at(fps, ticks=400, seed=11):
+    """Render frames at fps, running whatever ticks each frame owes"""
+    simulation = Simulation(seed=seed)
+    timestep = FixedTimestep(60)
+    while simulation.ticks < ticks and not simulation.game_over:
+        for _ in range(timestep.advance(1.0 / fps)):
+            if simulation.ticks == ticks:
+                break
+            if not simulation.step(timestep.dt, SCRIPT.get(simulation.ticks, ())):
+                break
+    return simulation
+
+
+def test_same_game_at_any_frame_rate():
+    slow = play_at(30)
+    fast = play_at(144)
+    assert slow.ticks == fast.ticks
+    assert slow.game_over == fast.game_over
+    assert slow.snapshot() == fast.snapshot()